@@ -6,4 +6,12 @@ from .C import *  # noqa: F403, F401
 from .file import *  # noqa: F403, F401
 from .evaluate import *  # noqa: F403, F401
 from .core import *  # noqa: F403, F401
+from .manifest import *  # noqa: F403, F401
+from .catalog import *  # noqa: F403, F401
+from .bundle import *  # noqa: F403, F401
 from .antimony import *  # noqa: F403, F401
+from .cache import *  # noqa: F403, F401
+from .profiling import *  # noqa: F403, F401
+from .lint import *  # noqa: F403, F401
+from .residuals import *  # noqa: F403, F401
+from .solution import *  # noqa: F403, F401
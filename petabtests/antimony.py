@@ -1,39 +1,191 @@
 """Antimony -> SBML"""
 
+import functools
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
 import antimony as ant
 from pathlib import Path
 
-__all__ = ["antimony_to_sbml_str"]
+from .cache import DiskCache
+
+__all__ = [
+    "AntimonyConversionError",
+    "AntimonyModel",
+    "antimony_to_sbml_str",
+    "antimony_to_sbml_strs",
+]
+
+#: Serializes access to libantimony's process-global state
+_antimony_lock = threading.Lock()
+
+
+class AntimonyConversionError(RuntimeError):
+    """Error converting an Antimony model in a batch conversion.
+
+    The original error is available as ``__cause__``.
+    """
+
+    def __init__(self, message: str, model: str | Path, index: int):
+        super().__init__(message)
+        #: The Antimony model (string or file) that failed to convert
+        self.model = model
+        #: The position of the model in the batch
+        self.index = index
 
 
-def antimony_to_sbml_str(ant_model: str | Path) -> str:
+@dataclass(frozen=True)
+class AntimonyModel:
+    """An SBML model defined in Antimony.
+
+    The model is only converted to SBML when it is written, so that test
+    case definitions can refer to it without doing any work.
+    """
+
+    #: Antimony model as string (model, not filename), or Path to file
+    source: str | Path
+
+    def to_sbml_str(self) -> str:
+        """Convert the model to SBML (see :func:`antimony_to_sbml_str`).
+
+        The result is memoized.
+        """
+        return self._sbml_str
+
+    @functools.cached_property
+    def _sbml_str(self) -> str:
+        return antimony_to_sbml_str(self.source)
+
+
+def antimony_to_sbml_str(ant_model: str | Path, cache: bool = True) -> str:
     """Convert Antimony string to SBML model.
 
+    This function is thread-safe; conversions are serialized, though, as
+    libantimony has global state. See :func:`antimony_to_sbml_strs` for
+    parallel conversions.
+
+    Conversion results are cached on disk (see :mod:`petabtests.cache`),
+    keyed by the Antimony model and the libantimony version.
+
     Arguments:
         ant_str:
             Antimony model as string (model, not filename), or Path to file.
+        cache:
+            Whether to use the conversion cache.
 
     Returns:
         SBML model as string.
     """
+    if not cache:
+        return _antimony_to_sbml_str(ant_model)
+
+    disk_cache = DiskCache("antimony")
+    key = _cache_key(disk_cache, ant_model)
+    if (sbml := disk_cache.get(key)) is not None:
+        return sbml.decode()
+
+    sbml_str = _antimony_to_sbml_str(ant_model)
+    disk_cache.put(key, sbml_str.encode())
+    return sbml_str
+
+
+def antimony_to_sbml_strs(
+    ant_models: Iterable[str | Path],
+    jobs: int | None = None,
+    cache: bool = True,
+) -> list[str]:
+    """Convert multiple Antimony models to SBML in parallel.
+
+    libantimony keeps global state, so the conversions are run in separate
+    worker processes, each with its own libantimony instance.
+
+    Arguments:
+        ant_models:
+            Antimony models as strings (model, not filename), or Paths to
+            files.
+        jobs:
+            Number of worker processes. ``None`` uses one worker per CPU.
+        cache:
+            Whether to use the conversion cache
+            (see :func:`antimony_to_sbml_str`).
+
+    Returns:
+        SBML models as strings, in the order of `ant_models`.
+
+    Raises:
+        AntimonyConversionError:
+            For the first model (in input order) that could not be converted.
+    """
+    ant_models = list(ant_models)
+    sbml_strs: list[str | None] = [None] * len(ant_models)
+
+    disk_cache = DiskCache("antimony")
+    cache = cache and disk_cache.enabled
+    if cache:
+        keys = [_cache_key(disk_cache, model) for model in ant_models]
+        for i, key in enumerate(keys):
+            if (sbml := disk_cache.get(key)) is not None:
+                sbml_strs[i] = sbml.decode()
+
+    todo = [i for i, sbml_str in enumerate(sbml_strs) if sbml_str is None]
+    if not todo:
+        return sbml_strs
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            i: executor.submit(_antimony_to_sbml_str, ant_models[i])
+            for i in todo
+        }
+        for i, future in futures.items():
+            try:
+                sbml_strs[i] = future.result()
+            except Exception as e:
+                for pending in futures.values():
+                    pending.cancel()
+                raise AntimonyConversionError(
+                    f"Failed to convert Antimony model #{i}: {e}",
+                    model=ant_models[i],
+                    index=i,
+                ) from e
+            if cache:
+                disk_cache.put(keys[i], sbml_strs[i].encode())
+
+    return sbml_strs
 
-    # Unload everything / free memory
-    ant.clearPreviousLoads()
-    ant.freeAll()
 
+def _cache_key(disk_cache: DiskCache, ant_model: str | Path) -> str:
+    """Get the conversion cache key for an Antimony model."""
     if isinstance(ant_model, Path):
-        status = ant.loadAntimonyFile(str(ant_model))
-    else:
-        status = ant.loadAntimonyString(ant_model)
-    if status < 0:
-        raise RuntimeError(
-            f"Antimony model could not be loaded: {ant.getLastError()}"
+        # the path matters for resolving imports
+        return disk_cache.key(
+            ant.__version__, str(ant_model.absolute()), ant_model
         )
+    return disk_cache.key(ant.__version__, ant_model)
+
+
+def _antimony_to_sbml_str(ant_model: str | Path) -> str:
+    """Convert Antimony string to SBML model, without caching."""
+    with _antimony_lock:
+        # Unload everything / free memory
+        ant.clearPreviousLoads()
+        ant.freeAll()
+
+        if isinstance(ant_model, Path):
+            status = ant.loadAntimonyFile(str(ant_model))
+        else:
+            status = ant.loadAntimonyString(ant_model)
+        if status < 0:
+            raise RuntimeError(
+                f"Antimony model could not be loaded: {ant.getLastError()}"
+            )
+
+        if (main_module_name := ant.getMainModuleName()) is None:
+            raise AssertionError("There is no Antimony module.")
 
-    if (main_module_name := ant.getMainModuleName()) is None:
-        raise AssertionError("There is no Antimony module.")
+        sbml_str = ant.getSBMLString(main_module_name)
 
-    sbml_str = ant.getSBMLString(main_module_name)
     if not sbml_str:
         raise ValueError("Antimony model could not be converted to SBML.")
 
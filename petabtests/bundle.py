@@ -0,0 +1,510 @@
+"""Solution bundles.
+
+A solution bundle packs the solutions of all test cases of a PEtab version
+and model format into a single file, so that they can be loaded without
+opening and parsing the solution files of each test case. It is written
+alongside the catalog (see :mod:`petabtests.catalog`).
+
+The bundle file starts with :data:`MAGIC`, followed by the length of the
+header as little-endian unsigned 64-bit integer, and the JSON header. The
+header contains, for each test case, the solution configuration and the
+layout of the simulation tables. The column data follow the header, each
+column stored contiguously and aligned to :data:`ALIGNMENT` bytes. String
+columns are dictionary-encoded: the distinct values are stored in the header,
+and the column as 32-bit integer codes, with ``-1`` for missing values.
+Solutions are served from the bundle without accessing the solution files.
+The bundle is rewritten whenever test cases are generated or cleared
+(see :mod:`petabtests.core`), and ``petabtests_create --check`` reports a
+bundle that does not match the solution files. The header also records the
+SHA-256 digests of the solution files each solution was rendered from, to
+check individual solutions explicitly (see
+:meth:`SolutionBundle.is_up_to_date`).
+The column data are read through :class:`numpy.memmap`, or from shared
+memory (see :class:`SharedSolutionBundle`).
+"""
+
+from __future__ import annotations
+
+import atexit
+import copy
+import functools
+import io
+import json
+import sys
+from collections.abc import Iterable
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from .C import CASES_DIR, SIMULATION_DFS, SIMULATION_FILES
+from .cache import file_digest
+from .file import (
+    get_case_dir,
+    load_solution_files,
+    solution_yaml_name,
+    test_id_str,
+)
+
+__all__ = [
+    "SOLUTION_BUNDLE_FILE",
+    "SharedSolutionBundle",
+    "SolutionBundle",
+    "read_solution_bundle",
+    "render_solution_bundle",
+]
+
+#: Name of the solution bundle file inside a version/format directory
+SOLUTION_BUNDLE_FILE = "_solutions.bundle"
+#: Leading bytes of a solution bundle file
+MAGIC = b"PTSOLBN1"
+#: Alignment of the column data in bytes
+ALIGNMENT = 64
+
+#: Memoized bundles: path -> (file stamp, bundle)
+_bundles: dict[Path, tuple[tuple[int, int, int], SolutionBundle]] = {}
+
+
+class SolutionBundle:
+    """The solutions of all test cases of a PEtab version and model format,
+    read from a solution bundle.
+
+    Parameters
+    ----------
+    data: Content of a solution bundle file, e.g., a memory map of the file
+        (see :meth:`from_file`). It is not copied.
+    """
+
+    def __init__(self, data):
+        data = np.frombuffer(data, dtype=np.uint8)
+        data.flags.writeable = False
+        if data[: len(MAGIC)].tobytes() != MAGIC:
+            raise ValueError("Not a solution bundle.")
+        header_start = len(MAGIC) + 8
+        header_size = int.from_bytes(
+            data[len(MAGIC) : header_start].tobytes(), "little"
+        )
+        self._header = json.loads(
+            data[header_start : header_start + header_size].tobytes()
+        )
+        self._data = data[_align(header_start + header_size) :]
+        self._tables: dict[str, list[pd.DataFrame]] = {}
+
+    @classmethod
+    def from_file(cls, path: Path | str) -> SolutionBundle:
+        """Read a solution bundle file through :class:`numpy.memmap`."""
+        return cls(np.memmap(path, dtype=np.uint8, mode="r"))
+
+    def __contains__(self, test_id: int | str) -> bool:
+        return test_id_str(test_id) in self._header["cases"]
+
+    @property
+    def case_ids(self) -> list[str]:
+        """IDs of the test cases in the bundle."""
+        return list(self._header["cases"])
+
+    def source_root(
+        self, test_id: int | str, root: Path | str = None
+    ) -> Path | str | None:
+        """Get the root directory of the generated test suite that the
+        solution of a test case was rendered from.
+
+        Parameters
+        ----------
+        test_id: Test case ID
+        root: Root directory of the generated test suite of the bundle (see
+            :func:`petabtests.file.get_case_dir`).
+        """
+        return self._header["cases"][test_id_str(test_id)].get("root", root)
+
+    def is_up_to_date(
+        self,
+        test_id: int | str,
+        format_: str,
+        version: str,
+        root: Path | str = None,
+    ) -> bool:
+        """Check whether the solution files of a test case did not change
+        since its solution was rendered into the bundle.
+
+        This reads and hashes the solution files, and is therefore not done
+        by :meth:`load_solution`. Each solution file is hashed at most once
+        per process, until it changes.
+
+        Parameters
+        ----------
+        test_id: Test case ID
+        format_: Model format (SBML/PySB)
+        version: PEtab version
+        root: Root directory of the generated test suite of the bundle (see
+            :func:`petabtests.file.get_case_dir`).
+        """
+        case_id = test_id_str(test_id)
+        case_dir = get_case_dir(
+            case_id, format_, version, root=self.source_root(case_id, root)
+        )
+        try:
+            return all(
+                file_digest(case_dir / file_name) == digest
+                for file_name, digest in self._header["cases"][case_id][
+                    "files"
+                ].items()
+            )
+        except FileNotFoundError:
+            return False
+
+    def load_solution(self, test_id: int | str) -> dict:
+        """Load the solution of a test case.
+
+        See :func:`petabtests.file.load_solution`.
+        """
+        case_id = test_id_str(test_id)
+        config = copy.deepcopy(self._header["cases"][case_id]["config"])
+        config[SIMULATION_DFS] = [
+            df.copy() for df in self._read_tables(case_id)
+        ]
+        return config
+
+    def get_array(
+        self, test_id: int | str, column: str, table: int = 0
+    ) -> np.ndarray:
+        """Get a column of a simulation table of a test case, without
+        copying.
+
+        Parameters
+        ----------
+        test_id: Test case ID
+        column: Column name
+        table: Index of the simulation table of the test case.
+
+        Returns
+        -------
+        The read-only column values. String columns are returned as integer
+        codes into :meth:`get_categories`, with ``-1`` for missing values.
+        """
+        n_rows, spec = self._get_column_spec(test_id, column, table)
+        return self._view(spec, n_rows)
+
+    def get_categories(
+        self, test_id: int | str, column: str, table: int = 0
+    ) -> list[str] | None:
+        """Get the distinct values of a string column of a simulation table
+        of a test case, or ``None`` for other columns.
+
+        See :meth:`get_array`.
+        """
+        _, spec = self._get_column_spec(test_id, column, table)
+        return spec.get("uniques")
+
+    def _get_column_spec(
+        self, test_id: int | str, column: str, table: int
+    ) -> tuple[int, dict]:
+        """Get the number of rows of a simulation table and the layout of
+        one of its columns."""
+        table = self._header["cases"][test_id_str(test_id)]["tables"][table]
+        for spec in table["columns"]:
+            if spec["name"] == column:
+                return table["rows"], spec
+        raise KeyError(column)
+
+    def _read_tables(self, case_id: str) -> list[pd.DataFrame]:
+        """Read the simulation tables of a test case.
+
+        The tables are memoized and must not be modified.
+        """
+        if (tables := self._tables.get(case_id)) is not None:
+            return tables
+        tables = [
+            pd.DataFrame(
+                {
+                    spec["name"]: self._read_column(spec, table["rows"])
+                    for spec in table["columns"]
+                }
+            )
+            for table in self._header["cases"][case_id]["tables"]
+        ]
+        self._tables[case_id] = tables
+        return tables
+
+    def _read_column(self, spec: dict, n_rows: int) -> np.ndarray:
+        """Read a column of a simulation table."""
+        values = self._view(spec, n_rows)
+        if "uniques" not in spec:
+            return values.copy()
+        uniques = np.array([*spec["uniques"], np.nan], dtype=object)
+        return pd.Series(uniques[values], dtype=_string_dtype()).array
+
+    def _view(self, spec: dict, n_rows: int) -> np.ndarray:
+        """Get the column data of a simulation table."""
+        dtype = np.dtype(spec["dtype"])
+        return np.frombuffer(
+            self._data[
+                spec["offset"] : spec["offset"] + n_rows * dtype.itemsize
+            ],
+            dtype=dtype,
+        )
+
+
+class SharedSolutionBundle(SolutionBundle):
+    """A solution bundle in shared memory (see
+    :mod:`multiprocessing.shared_memory`).
+
+    A bundle is published once via :meth:`publish`. Other processes, e.g.,
+    the workers of a :class:`concurrent.futures.ProcessPoolExecutor`, attach
+    to it by :attr:`name` via :meth:`attach`, and access the same memory
+    without copying, e.g., via :meth:`get_array`. The publishing process
+    owns the shared memory, which is freed by :meth:`close`, or when leaving
+    the ``with`` block.
+
+    Parameters
+    ----------
+    name: Name of the shared memory of a published bundle.
+    """
+
+    def __init__(self, name: str):
+        shared_memory = _open_shared_memory(name)
+        super().__init__(shared_memory.buf)
+        # set after the views of the shared memory, so that these are
+        #  released first on garbage collection
+        self._shared_memory = shared_memory
+        self._owner = False
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory."""
+        return self._shared_memory.name
+
+    @classmethod
+    def publish(
+        cls, format_: str, version: str, root: Path | str = None
+    ) -> SharedSolutionBundle:
+        """Copy the solution bundle for the given PEtab version and model
+        format to shared memory.
+
+        Parameters
+        ----------
+        format_: Model format (SBML/PySB)
+        version: PEtab version
+        root: Root directory of the generated test suite (see
+            :func:`petabtests.file.get_case_dir`).
+        """
+        root = Path(root) if root is not None else CASES_DIR
+        data = (root / version / format_ / SOLUTION_BUNDLE_FILE).read_bytes()
+        shared_memory = SharedMemory(create=True, size=len(data))
+        try:
+            shared_memory.buf[: len(data)] = data
+            bundle = cls(shared_memory.name)
+        except BaseException:
+            shared_memory.unlink()
+            raise
+        finally:
+            shared_memory.close()
+        bundle._owner = True
+        return bundle
+
+    @classmethod
+    def attach(cls, name: str) -> SharedSolutionBundle:
+        """Attach to a published bundle.
+
+        The bundle is attached only once per process.
+        """
+        if (bundle := _attached_bundles.get(name)) is None:
+            if not _attached_bundles:
+                atexit.register(_detach_bundles)
+            bundle = _attached_bundles[name] = cls(name)
+        return bundle
+
+    def close(self) -> None:
+        """Detach from the shared memory, and free it in the publishing
+        process.
+
+        The bundle must not be used afterwards, and any arrays obtained from
+        it must have been released.
+        """
+        if self._owner:
+            self._shared_memory.unlink()
+            self._owner = False
+        self._data = None
+        self._tables.clear()
+        self._shared_memory.close()
+
+    def __enter__(self) -> SharedSolutionBundle:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+#: Bundles attached to in this process by name
+_attached_bundles: dict[str, SharedSolutionBundle] = {}
+
+
+def _detach_bundles() -> None:
+    """Detach from all bundles attached to in this process."""
+    while _attached_bundles:
+        _, bundle = _attached_bundles.popitem()
+        try:
+            bundle.close()
+        except BufferError:
+            # arrays obtained from the bundle are still in use
+            pass
+
+
+def _open_shared_memory(name: str) -> SharedMemory:
+    """Open existing shared memory without tracking it in this process."""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    # before Python 3.13, attaching registers the shared memory with the
+    #  resource tracker. Processes started via multiprocessing share the
+    #  resource tracker of the parent process, which already tracks the
+    #  shared memory. Otherwise, attaching starts a resource tracker for this
+    #  process, which would unlink the shared memory when this process exits.
+    own_tracker = resource_tracker._resource_tracker._fd is None
+    shared_memory = SharedMemory(name=name)
+    if own_tracker:
+        resource_tracker.unregister(shared_memory._name, "shared_memory")
+    return shared_memory
+
+
+def read_solution_bundle(
+    format_: str, version: str, root: Path | str = None
+) -> SolutionBundle | None:
+    """Read the solution bundle for the given PEtab version and model
+    format.
+
+    The bundle is only read again if the file was modified.
+
+    Parameters
+    ----------
+    format_: Model format (SBML/PySB)
+    version: PEtab version
+    root: Root directory of the generated test suite (see
+        :func:`petabtests.file.get_case_dir`).
+
+    Returns
+    -------
+    The solution bundle, or ``None`` if there is no bundle.
+    """
+    root = Path(root) if root is not None else CASES_DIR
+    path = root / version / format_ / SOLUTION_BUNDLE_FILE
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    stamp = stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    if (cached := _bundles.get(path)) and cached[0] == stamp:
+        return cached[1]
+
+    bundle = SolutionBundle.from_file(path)
+    _bundles[path] = stamp, bundle
+    return bundle
+
+
+def render_solution_bundle(
+    case_ids: Iterable[str],
+    format_: str,
+    version: str,
+    root: Path | str = None,
+    fallback_root: Path | str = None,
+) -> bytes:
+    """Render the solutions of the given test cases to the content of the
+    solution bundle file.
+
+    The solutions are read from the solution files. Test cases without
+    solution files are skipped.
+
+    Parameters
+    ----------
+    case_ids: IDs of the test cases to include.
+    format_: Model format (SBML/PySB)
+    version: PEtab version
+    root: Root directory of the generated test suite (see
+        :func:`petabtests.file.get_case_dir`).
+    fallback_root: Root directory of another generated test suite to read
+        the solution files of test cases from that have none below `root`.
+    """
+    cases = {}
+    data = io.BytesIO()
+    roots = [root] if fallback_root is None else [root, fallback_root]
+    for case_id in case_ids:
+        solution = None
+        for case_root in roots:
+            try:
+                solution = load_solution_files(
+                    case_id, format_, version, root=case_root
+                )
+                break
+            except FileNotFoundError:
+                continue
+        if solution is None:
+            continue
+        case = {}
+        if case_root is not root:
+            case["root"] = str(case_root)
+        case_dir = get_case_dir(case_id, format_, version, root=case_root)
+        yaml_file = solution_yaml_name(case_id)
+        case["files"] = {
+            file_name: file_digest(case_dir / file_name)
+            for file_name in [
+                yaml_file,
+                *yaml.safe_load((case_dir / yaml_file).read_bytes())[
+                    SIMULATION_FILES
+                ],
+            ]
+        }
+
+        tables = []
+        for df in solution.pop(SIMULATION_DFS):
+            columns = []
+            for name in df.columns:
+                column = {"name": name}
+                values = df[name]
+                if values.dtype.kind == "O":
+                    # object or string columns
+                    codes, uniques = pd.factorize(values)
+                    if not all(isinstance(value, str) for value in uniques):
+                        raise ValueError(
+                            f"Unsupported values in column {name} of the "
+                            f"solution of test case {case_id}."
+                        )
+                    column["uniques"] = list(uniques)
+                    values = codes.astype(np.int32)
+                else:
+                    values = values.to_numpy()
+                    if values.dtype.kind not in "biuf":
+                        raise ValueError(
+                            f"Unsupported type {values.dtype} of column "
+                            f"{name} of the solution of test case {case_id}."
+                        )
+                column["dtype"] = values.dtype.newbyteorder("<").str
+                column["offset"] = _align(data.tell())
+                data.seek(column["offset"])
+                data.write(values.astype(column["dtype"]).tobytes())
+                columns.append(column)
+            tables.append({"rows": len(df), "columns": columns})
+        case |= {"config": solution, "tables": tables}
+        cases[test_id_str(case_id)] = case
+
+    header = json.dumps(
+        {"cases": cases}, sort_keys=True, separators=(",", ":")
+    ).encode()
+    prefix = MAGIC + len(header).to_bytes(8, "little") + header
+    data = data.getvalue()
+    return prefix.ljust(_align(len(prefix)), b"\0") + data.ljust(
+        _align(len(data)), b"\0"
+    )
+
+
+def _align(offset: int) -> int:
+    """Round `offset` up to a multiple of :data:`ALIGNMENT`."""
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+@functools.cache
+def _string_dtype():
+    """Get the type of string columns read by :func:`pandas.read_csv`."""
+    return pd.read_csv(io.StringIO("a\nb\n"))["a"].dtype
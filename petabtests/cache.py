@@ -0,0 +1,188 @@
+"""Content-addressed on-disk cache.
+
+The cache directory defaults to ``$XDG_CACHE_HOME/petabtests`` (or
+``~/.cache/petabtests``) and can be changed via the environment variable
+``PETABTESTS_CACHE_DIR``. The total size of the cache is bounded by
+``PETABTESTS_CACHE_MAX_SIZE`` (in bytes, default 256 MiB); least recently
+used entries are evicted first. A maximum size of ``0`` disables caching.
+
+To keep writes cheap, each process keeps a running estimate of the cache size
+and only scans the cache directory for eviction when that estimate exceeds
+the limit. Entries written by other processes are accounted for at the next
+scan.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+__all__ = ["DiskCache", "file_digest", "get_cache_dir"]
+
+#: Environment variable for the cache directory
+CACHE_DIR_ENV = "PETABTESTS_CACHE_DIR"
+#: Environment variable for the maximum cache size in bytes
+CACHE_MAX_SIZE_ENV = "PETABTESTS_CACHE_MAX_SIZE"
+#: Default maximum cache size in bytes
+DEFAULT_CACHE_MAX_SIZE = 256 * 2**20
+
+# estimated total size of the entries per cache directory, i.e. the size at
+#  the last scan plus the size of the entries written since then by this
+#  process, or missing if not scanned yet
+_cache_sizes: dict[Path, int] = {}
+_cache_sizes_lock = threading.Lock()
+#: Memoized file digests: path -> (file stamp, digest)
+_file_digests: dict[Path, tuple[tuple[int, int, int], str]] = {}
+
+
+def get_cache_dir() -> Path:
+    """Get the root directory of the petabtests cache."""
+    if cache_dir := os.environ.get(CACHE_DIR_ENV):
+        return Path(cache_dir)
+    if xdg_cache_home := os.environ.get("XDG_CACHE_HOME"):
+        return Path(xdg_cache_home, "petabtests")
+    return Path.home() / ".cache" / "petabtests"
+
+
+def file_digest(path: Path | str) -> str:
+    """Get the SHA-256 hex digest of the content of a file.
+
+    The digest is memoized per process until the file is replaced or
+    modified.
+    """
+    path = Path(path)
+    stat = os.stat(path)
+    stamp = stat.st_ino, stat.st_mtime_ns, stat.st_size
+    if (cached := _file_digests.get(path)) and cached[0] == stamp:
+        return cached[1]
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    _file_digests[path] = stamp, digest
+    return digest
+
+
+def _get_max_size() -> int:
+    """Get the maximum cache size in bytes."""
+    return int(os.environ.get(CACHE_MAX_SIZE_ENV, DEFAULT_CACHE_MAX_SIZE))
+
+
+class DiskCache:
+    """A content-addressed on-disk cache.
+
+    Entries are stored as individual files under
+    ``<cache directory>/<namespace>/``, named by the hash of their key.
+    Writes are atomic, so the cache can be shared between processes.
+
+    Parameters
+    ----------
+    namespace: Subdirectory of the cache directory for this cache.
+    cache_dir: Root directory of the cache. Defaults to
+        :func:`get_cache_dir`.
+    max_size: Maximum total size in bytes of all entries in the cache
+        directory. Defaults to ``$PETABTESTS_CACHE_MAX_SIZE``.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        cache_dir: Path | str = None,
+        max_size: int = None,
+    ):
+        self.root = Path(cache_dir) if cache_dir else get_cache_dir()
+        self.dir = self.root / namespace
+        self.max_size = _get_max_size() if max_size is None else max_size
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is enabled."""
+        return self.max_size > 0
+
+    @staticmethod
+    def key(*parts: str | bytes | Path) -> str:
+        """Compute a cache key from the given parts.
+
+        :class:`pathlib.Path` parts stand for the content of the file (see
+        :func:`file_digest`), not for the path itself.
+        """
+        hasher = hashlib.sha256()
+        for part in parts:
+            if isinstance(part, Path):
+                part = bytes.fromhex(file_digest(part))
+            elif isinstance(part, str):
+                part = hashlib.sha256(part.encode()).digest()
+            else:
+                part = hashlib.sha256(part).digest()
+            hasher.update(part)
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """Get the cached data for `key`, or ``None`` if not cached."""
+        if not self.enabled:
+            return None
+        path = self.dir / key
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        # mark as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store `data` under `key`, and evict old entries if necessary."""
+        if not self.enabled:
+            return
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.dir, prefix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self.dir / key)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            # caching is best effort
+            return
+
+        with _cache_sizes_lock:
+            size = _cache_sizes.get(self.root)
+            if size is not None:
+                # overwritten entries are counted twice, which only causes an
+                #  early scan
+                size += len(data)
+                _cache_sizes[self.root] = size
+        if size is None or size > self.max_size:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries from the cache directory
+        until it is within the size limit."""
+        entries = []
+        for path in self.root.glob("*/*"):
+            if path.name.startswith(".tmp"):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total_size -= size
+
+        with _cache_sizes_lock:
+            _cache_sizes[self.root] = total_size
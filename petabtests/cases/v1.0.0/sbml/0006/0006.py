@@ -19,63 +19,69 @@ model output is scaled by a different parameter at each timepoint.
 A simple conversion reaction `A <=> B` in a single compartment, following
 mass action kinetics.
 """)
-
-# problem --------------------------------------------------------------------
-
-condition_df = pd.DataFrame(
-    data={
-        CONDITION_ID: ["c0"],
-    }
-).set_index([CONDITION_ID])
-
-measurement_df = pd.DataFrame(
-    data={
-        OBSERVABLE_ID: ["obs_a", "obs_a"],
-        SIMULATION_CONDITION_ID: ["c0", "c0"],
-        TIME: [0, 10],
-        MEASUREMENT: [0.7, 0.1],
-        OBSERVABLE_PARAMETERS: [10, 15],
-    }
+BRIEF = (
+    "Simulation. Time-point specific numeric observable parameter "
+    "overrides."
 )
 
-observable_df = pd.DataFrame(
-    data={
-        OBSERVABLE_ID: ["obs_a"],
-        OBSERVABLE_FORMULA: ["observableParameter1_obs_a * A"],
-        NOISE_FORMULA: [1],
-    }
-).set_index([OBSERVABLE_ID])
-
-parameter_df = pd.DataFrame(
-    data={
-        PARAMETER_ID: ["a0", "b0", "k1", "k2"],
-        PARAMETER_SCALE: [LIN] * 4,
-        LOWER_BOUND: [0] * 4,
-        UPPER_BOUND: [10] * 4,
-        NOMINAL_VALUE: [1, 0, 0.8, 0.6],
-        ESTIMATE: [1] * 4,
-    }
-).set_index(PARAMETER_ID)
-
-# solutions ------------------------------------------------------------------
-
-simulation_df = measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-simulation_df[SIMULATION] = [
-    10 * analytical_a(0, 1, 0, 0.8, 0.6),
-    15 * analytical_a(10, 1, 0, 0.8, 0.6),
-]
-
-case = PetabV1TestCase(
-    id=6,
-    brief="Simulation. Time-point specific numeric observable parameter "
-    "overrides.",
-    description=DESCRIPTION,
-    model=DEFAULT_SBML_FILE,
-    condition_dfs=[condition_df],
-    observable_dfs=[observable_df],
-    measurement_dfs=[measurement_df],
-    simulation_dfs=[simulation_df],
-    parameter_df=parameter_df,
-)
+
+def build() -> PetabV1TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
+
+    condition_df = pd.DataFrame(
+        data={
+            CONDITION_ID: ["c0"],
+        }
+    ).set_index([CONDITION_ID])
+
+    measurement_df = pd.DataFrame(
+        data={
+            OBSERVABLE_ID: ["obs_a", "obs_a"],
+            SIMULATION_CONDITION_ID: ["c0", "c0"],
+            TIME: [0, 10],
+            MEASUREMENT: [0.7, 0.1],
+            OBSERVABLE_PARAMETERS: [10, 15],
+        }
+    )
+
+    observable_df = pd.DataFrame(
+        data={
+            OBSERVABLE_ID: ["obs_a"],
+            OBSERVABLE_FORMULA: ["observableParameter1_obs_a * A"],
+            NOISE_FORMULA: [1],
+        }
+    ).set_index([OBSERVABLE_ID])
+
+    parameter_df = pd.DataFrame(
+        data={
+            PARAMETER_ID: ["a0", "b0", "k1", "k2"],
+            PARAMETER_SCALE: [LIN] * 4,
+            LOWER_BOUND: [0] * 4,
+            UPPER_BOUND: [10] * 4,
+            NOMINAL_VALUE: [1, 0, 0.8, 0.6],
+            ESTIMATE: [1] * 4,
+        }
+    ).set_index(PARAMETER_ID)
+
+    # solutions ---------------------------------------------------------------
+
+    simulation_df = measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
+    )
+    simulation_df[SIMULATION] = [
+        10 * analytical_a(0, 1, 0, 0.8, 0.6),
+        15 * analytical_a(10, 1, 0, 0.8, 0.6),
+    ]
+
+    return PetabV1TestCase(
+        id=6,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=DEFAULT_SBML_FILE,
+        condition_dfs=[condition_df],
+        observable_dfs=[observable_df],
+        measurement_dfs=[measurement_df],
+        simulation_dfs=[simulation_df],
+        parameter_df=parameter_df,
+    )
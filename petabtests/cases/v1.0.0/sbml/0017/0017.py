@@ -29,69 +29,75 @@ preequilibration.
 A simple conversion reaction `A <=> B` in a single compartment, following
 mass action kinetics.
 """)
-
-# problem --------------------------------------------------------------------
-
-
-condition_df = pd.DataFrame(
-    data={
-        CONDITION_ID: ["preeq_c0", "c0"],
-        "k1": [0.3, 0.8],
-        "B": [2.0, "NaN"],
-        "A": [0, 1],
-    }
-).set_index([CONDITION_ID])
-
-measurement_df = pd.DataFrame(
-    data={
-        OBSERVABLE_ID: ["obs_a", "obs_a"],
-        PREEQUILIBRATION_CONDITION_ID: ["preeq_c0", "preeq_c0"],
-        SIMULATION_CONDITION_ID: ["c0", "c0"],
-        TIME: [1, 10],
-        MEASUREMENT: [0.7, 0.1],
-    }
+BRIEF = (
+    "Simulation. Preequilibration. One species reinitialized, one not "
+    "(NaN in condition table). InitialAssignment to species overridden."
 )
 
-observable_df = pd.DataFrame(
-    data={
-        OBSERVABLE_ID: ["obs_a"],
-        OBSERVABLE_FORMULA: ["A"],
-        NOISE_FORMULA: [0.5],
-    }
-).set_index([OBSERVABLE_ID])
-
-parameter_df = pd.DataFrame(
-    data={
-        PARAMETER_ID: ["k2"],
-        PARAMETER_SCALE: [LIN],
-        LOWER_BOUND: [0],
-        UPPER_BOUND: [10],
-        NOMINAL_VALUE: [0.6],
-        ESTIMATE: [1],
-    }
-).set_index(PARAMETER_ID)
-
-# solutions ------------------------------------------------------------------
-
-simulation_df = measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-# simulate for far time point as steady state
-steady_state_b = analytical_b(1000, 0, 2.0, 0.3, 0.6)
-# use steady state as initial state
-simulation_df[SIMULATION] = [
-    analytical_a(t, 1, steady_state_b, 0.8, 0.6) for t in simulation_df[TIME]
-]
-
-case = PetabV1TestCase(
-    id=17,
-    brief="Simulation. Preequilibration. One species reinitialized, one not "
-    "(NaN in condition table). InitialAssignment to species overridden.",
-    description=DESCRIPTION,
-    model=DEFAULT_SBML_FILE,
-    condition_dfs=[condition_df],
-    observable_dfs=[observable_df],
-    measurement_dfs=[measurement_df],
-    simulation_dfs=[simulation_df],
-    parameter_df=parameter_df,
-)
+
+def build() -> PetabV1TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
+
+    condition_df = pd.DataFrame(
+        data={
+            CONDITION_ID: ["preeq_c0", "c0"],
+            "k1": [0.3, 0.8],
+            "B": [2.0, "NaN"],
+            "A": [0, 1],
+        }
+    ).set_index([CONDITION_ID])
+
+    measurement_df = pd.DataFrame(
+        data={
+            OBSERVABLE_ID: ["obs_a", "obs_a"],
+            PREEQUILIBRATION_CONDITION_ID: ["preeq_c0", "preeq_c0"],
+            SIMULATION_CONDITION_ID: ["c0", "c0"],
+            TIME: [1, 10],
+            MEASUREMENT: [0.7, 0.1],
+        }
+    )
+
+    observable_df = pd.DataFrame(
+        data={
+            OBSERVABLE_ID: ["obs_a"],
+            OBSERVABLE_FORMULA: ["A"],
+            NOISE_FORMULA: [0.5],
+        }
+    ).set_index([OBSERVABLE_ID])
+
+    parameter_df = pd.DataFrame(
+        data={
+            PARAMETER_ID: ["k2"],
+            PARAMETER_SCALE: [LIN],
+            LOWER_BOUND: [0],
+            UPPER_BOUND: [10],
+            NOMINAL_VALUE: [0.6],
+            ESTIMATE: [1],
+        }
+    ).set_index(PARAMETER_ID)
+
+    # solutions ---------------------------------------------------------------
+
+    simulation_df = measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
+    )
+    # simulate for far time point as steady state
+    steady_state_b = analytical_b(1000, 0, 2.0, 0.3, 0.6)
+    # use steady state as initial state
+    simulation_df[SIMULATION] = [
+        analytical_a(t, 1, steady_state_b, 0.8, 0.6)
+        for t in simulation_df[TIME]
+    ]
+
+    return PetabV1TestCase(
+        id=17,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=DEFAULT_SBML_FILE,
+        condition_dfs=[condition_df],
+        observable_dfs=[observable_df],
+        measurement_dfs=[measurement_df],
+        simulation_dfs=[simulation_df],
+        parameter_df=parameter_df,
+    )
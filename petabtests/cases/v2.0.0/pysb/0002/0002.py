@@ -21,44 +21,56 @@ model values for `b0` should be used for either condition.
 A simple conversion reaction `A <=> B` in a single compartment, following
 mass action kinetics.
 """)
-
-# problem --------------------------------------------------------------------
-problem = Problem()
-
-problem.add_condition("c0", a0=0.8)
-problem.add_condition("c1", a0=0.9)
-
-problem.add_experiment("e0", 0, "c0")
-problem.add_experiment("e1", 0, "c1")
-
-problem.add_observable("obs_a", "A", noise_formula=1)
-
-problem.add_measurement("obs_a", experiment_id="e0", time=0, measurement=0.7)
-problem.add_measurement("obs_a", experiment_id="e0", time=10, measurement=0.1)
-problem.add_measurement("obs_a", experiment_id="e1", time=0, measurement=0.8)
-problem.add_measurement("obs_a", experiment_id="e1", time=10, measurement=0.2)
-
-problem.add_parameter("k1", lb=0, ub=10, nominal_value=0.8, estimate=True)
-problem.add_parameter("k2", lb=0, ub=10, nominal_value=0.6, estimate=True)
-
-# solutions ------------------------------------------------------------------
-
-simulation_df = problem.measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-simulation_df[SIMULATION] = [
-    *[analytical_a(t, 0.8, 1, 0.8, 0.6) for t in [0, 10]],
-    *[analytical_a(t, 0.9, 1, 0.8, 0.6) for t in [0, 10]],
-]
-case = PetabV2TestCase(
-    id=2,
-    brief="Simulation. Two conditions. Numeric parameter override.",
-    description=DESCRIPTION,
-    model=DEFAULT_PYSB_FILE,
-    condition_dfs=[problem.condition_df],
-    observable_dfs=[problem.observable_df],
-    measurement_dfs=[problem.measurement_df],
-    simulation_dfs=[simulation_df],
-    experiment_dfs=[problem.experiment_df],
-    parameter_df=problem.parameter_df,
-)
+BRIEF = "Simulation. Two conditions. Numeric parameter override."
+
+
+def build() -> PetabV2TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
+    problem = Problem()
+
+    problem.add_condition("c0", a0=0.8)
+    problem.add_condition("c1", a0=0.9)
+
+    problem.add_experiment("e0", 0, "c0")
+    problem.add_experiment("e1", 0, "c1")
+
+    problem.add_observable("obs_a", "A", noise_formula=1)
+
+    problem.add_measurement(
+        "obs_a", experiment_id="e0", time=0, measurement=0.7
+    )
+    problem.add_measurement(
+        "obs_a", experiment_id="e0", time=10, measurement=0.1
+    )
+    problem.add_measurement(
+        "obs_a", experiment_id="e1", time=0, measurement=0.8
+    )
+    problem.add_measurement(
+        "obs_a", experiment_id="e1", time=10, measurement=0.2
+    )
+
+    problem.add_parameter("k1", lb=0, ub=10, nominal_value=0.8, estimate=True)
+    problem.add_parameter("k2", lb=0, ub=10, nominal_value=0.6, estimate=True)
+
+    # solutions ---------------------------------------------------------------
+
+    simulation_df = problem.measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
+    )
+    simulation_df[SIMULATION] = [
+        *[analytical_a(t, 0.8, 1, 0.8, 0.6) for t in [0, 10]],
+        *[analytical_a(t, 0.9, 1, 0.8, 0.6) for t in [0, 10]],
+    ]
+    return PetabV2TestCase(
+        id=2,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=DEFAULT_PYSB_FILE,
+        condition_dfs=[problem.condition_df],
+        observable_dfs=[problem.observable_df],
+        measurement_dfs=[problem.measurement_df],
+        simulation_dfs=[simulation_df],
+        experiment_dfs=[problem.experiment_df],
+        parameter_df=problem.parameter_df,
+    )
@@ -22,47 +22,53 @@ observableFormula.
 A simple conversion reaction `A <=> B` in a single compartment, following
 mass action kinetics.
 """)
+BRIEF = (
+    "Simulation. Numeric observable parameter overrides in measurement "
+    "table."
+)
 
-# problem --------------------------------------------------------------------
-problem = Problem()
 
-problem.add_observable(
-    "obs_a",
-    "obs_a_scale * A + obs_a_offset",
-    noise_formula=0.5,
-    observable_placeholders=["obs_a_scale", "obs_a_offset"],
-)
+def build() -> PetabV2TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
+    problem = Problem()
 
-problem.add_measurement(
-    "obs_a", time=0, measurement=0.7, observable_parameters=(0.5, 2)
-)
-problem.add_measurement(
-    "obs_a", time=10, measurement=0.1, observable_parameters=(0.5, 2)
-)
+    problem.add_observable(
+        "obs_a",
+        "obs_a_scale * A + obs_a_offset",
+        noise_formula=0.5,
+        observable_placeholders=["obs_a_scale", "obs_a_offset"],
+    )
 
-problem.add_parameter("a0", lb=0, ub=10, nominal_value=1)
-problem.add_parameter("b0", lb=0, ub=10, nominal_value=0)
-problem.add_parameter("k1", lb=0, ub=10, nominal_value=0.8)
-problem.add_parameter("k2", lb=0, ub=10, nominal_value=0.6)
+    problem.add_measurement(
+        "obs_a", time=0, measurement=0.7, observable_parameters=(0.5, 2)
+    )
+    problem.add_measurement(
+        "obs_a", time=10, measurement=0.1, observable_parameters=(0.5, 2)
+    )
 
-# solutions ------------------------------------------------------------------
+    problem.add_parameter("a0", lb=0, ub=10, nominal_value=1)
+    problem.add_parameter("b0", lb=0, ub=10, nominal_value=0)
+    problem.add_parameter("k1", lb=0, ub=10, nominal_value=0.8)
+    problem.add_parameter("k2", lb=0, ub=10, nominal_value=0.6)
 
-simulation_df = problem.measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-simulation_df[SIMULATION] = [
-    0.5 * analytical_a(t, 1, 0, 0.8, 0.6) + 2 for t in simulation_df[TIME]
-]
+    # solutions ---------------------------------------------------------------
 
-case = PetabV2TestCase(
-    id=3,
-    brief="Simulation. Numeric observable parameter overrides in measurement "
-    "table.",
-    description=DESCRIPTION,
-    model=DEFAULT_PYSB_FILE,
-    condition_dfs=[problem.condition_df],
-    observable_dfs=[problem.observable_df],
-    measurement_dfs=[problem.measurement_df],
-    simulation_dfs=[simulation_df],
-    parameter_df=problem.parameter_df,
-)
+    simulation_df = problem.measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
+    )
+    simulation_df[SIMULATION] = [
+        0.5 * analytical_a(t, 1, 0, 0.8, 0.6) + 2 for t in simulation_df[TIME]
+    ]
+
+    return PetabV2TestCase(
+        id=3,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=DEFAULT_PYSB_FILE,
+        condition_dfs=[problem.condition_df],
+        observable_dfs=[problem.observable_df],
+        measurement_dfs=[problem.measurement_df],
+        simulation_dfs=[simulation_df],
+        parameter_df=problem.parameter_df,
+    )
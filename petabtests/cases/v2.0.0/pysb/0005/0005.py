@@ -20,98 +20,104 @@ to be taken from the parameter table).
 A simple conversion reaction `A <=> B` in a single compartment, following
 mass action kinetics.
 """)
-
-# problem --------------------------------------------------------------------
-
-problem = Problem()
-
-problem.add_condition("c0", offset_A="offset_A_c0")
-problem.add_condition("c1", offset_A="offset_A_c1")
-
-problem.add_experiment("e0", 0, "c0")
-problem.add_experiment("e1", 0, "c1")
-
-problem.add_observable(
-    "obs_a",
-    "A + offset_A",
-    noise_formula=1,
+BRIEF = (
+    "Simulation. Condition-specific parameters only defined in "
+    "parameter table."
 )
 
-problem.add_measurement(
-    "obs_a",
-    experiment_id="e0",
-    time=10,
-    measurement=2.1,
-)
-problem.add_measurement(
-    "obs_a",
-    experiment_id="e1",
-    time=10,
-    measurement=3.2,
-)
 
-problem.add_parameter(
-    "a0",
-    lb=0,
-    ub=10,
-    nominal_value=1,
-    estimate=True,
-)
-problem.add_parameter(
-    "b0",
-    lb=0,
-    ub=10,
-    nominal_value=0,
-    estimate=True,
-)
-problem.add_parameter(
-    "k1",
-    lb=0,
-    ub=10,
-    nominal_value=0.8,
-    estimate=True,
-)
-problem.add_parameter(
-    "k2",
-    lb=0,
-    ub=10,
-    nominal_value=0.6,
-    estimate=True,
-)
-problem.add_parameter(
-    "offset_A_c0",
-    lb=0,
-    ub=10,
-    nominal_value=2,
-    estimate=False,
-)
-problem.add_parameter(
-    "offset_A_c1",
-    lb=0,
-    ub=10,
-    nominal_value=3,
-    estimate=False,
-)
-
-# solutions ------------------------------------------------------------------
-
-simulation_df = problem.measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-simulation_df[SIMULATION] = [
-    analytical_a(10, 1, 0, 0.8, 0.6) + offset for offset in [2, 3]
-]
-
-case = PetabV2TestCase(
-    id=5,
-    brief="Simulation. Condition-specific parameters only defined in "
-    "parameter table.",
-    description=DESCRIPTION,
-    model=Path("conversion_modified_pysb.py"),
-    condition_dfs=[problem.condition_df],
-    observable_dfs=[problem.observable_df],
-    measurement_dfs=[problem.measurement_df],
-    simulation_dfs=[simulation_df],
-    parameter_df=problem.parameter_df,
-    experiment_dfs=[problem.experiment_df],
-)
+def build() -> PetabV2TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
+
+    problem = Problem()
+
+    problem.add_condition("c0", offset_A="offset_A_c0")
+    problem.add_condition("c1", offset_A="offset_A_c1")
+
+    problem.add_experiment("e0", 0, "c0")
+    problem.add_experiment("e1", 0, "c1")
+
+    problem.add_observable(
+        "obs_a",
+        "A + offset_A",
+        noise_formula=1,
+    )
+
+    problem.add_measurement(
+        "obs_a",
+        experiment_id="e0",
+        time=10,
+        measurement=2.1,
+    )
+    problem.add_measurement(
+        "obs_a",
+        experiment_id="e1",
+        time=10,
+        measurement=3.2,
+    )
+
+    problem.add_parameter(
+        "a0",
+        lb=0,
+        ub=10,
+        nominal_value=1,
+        estimate=True,
+    )
+    problem.add_parameter(
+        "b0",
+        lb=0,
+        ub=10,
+        nominal_value=0,
+        estimate=True,
+    )
+    problem.add_parameter(
+        "k1",
+        lb=0,
+        ub=10,
+        nominal_value=0.8,
+        estimate=True,
+    )
+    problem.add_parameter(
+        "k2",
+        lb=0,
+        ub=10,
+        nominal_value=0.6,
+        estimate=True,
+    )
+    problem.add_parameter(
+        "offset_A_c0",
+        lb=0,
+        ub=10,
+        nominal_value=2,
+        estimate=False,
+    )
+    problem.add_parameter(
+        "offset_A_c1",
+        lb=0,
+        ub=10,
+        nominal_value=3,
+        estimate=False,
+    )
+
+    # solutions ---------------------------------------------------------------
+
+    simulation_df = problem.measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
+    )
+    simulation_df[SIMULATION] = [
+        analytical_a(10, 1, 0, 0.8, 0.6) + offset for offset in [2, 3]
+    ]
+
+    return PetabV2TestCase(
+        id=5,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=Path("conversion_modified_pysb.py"),
+        condition_dfs=[problem.condition_df],
+        observable_dfs=[problem.observable_df],
+        measurement_dfs=[problem.measurement_df],
+        simulation_dfs=[simulation_df],
+        parameter_df=problem.parameter_df,
+        experiment_dfs=[problem.experiment_df],
+    )
@@ -17,44 +17,52 @@ table, while for `A` it is given via an assignment rule in the SBML model.
 A simple conversion reaction `A <=> B` in a single compartment, following
 mass action kinetics.
 """)
+BRIEF = "Simulation. InitialAssignment to species overridden."
 
-# problem --------------------------------------------------------------------
-problem = Problem()
 
-problem.add_condition("c0", B=2)
+def build() -> PetabV2TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
+    problem = Problem()
 
-problem.add_experiment("e0", 0, "c0")
+    problem.add_condition("c0", B=2)
 
-problem.add_observable("obs_a", "A", noise_formula=0.5)
+    problem.add_experiment("e0", 0, "c0")
 
-problem.add_measurement("obs_a", experiment_id="e0", time=0, measurement=0.7)
-problem.add_measurement("obs_a", experiment_id="e0", time=10, measurement=0.1)
+    problem.add_observable("obs_a", "A", noise_formula=0.5)
 
-problem.add_parameter("k1", lb=0, ub=10, nominal_value=0.8, estimate=True)
-problem.add_parameter("k2", lb=0, ub=10, nominal_value=0.6, estimate=True)
+    problem.add_measurement(
+        "obs_a", experiment_id="e0", time=0, measurement=0.7
+    )
+    problem.add_measurement(
+        "obs_a", experiment_id="e0", time=10, measurement=0.1
+    )
 
-problem.add_mapping("A", "A_() ** compartment")
-problem.add_mapping("B", "B_() ** compartment")
+    problem.add_parameter("k1", lb=0, ub=10, nominal_value=0.8, estimate=True)
+    problem.add_parameter("k2", lb=0, ub=10, nominal_value=0.6, estimate=True)
 
-# solutions ------------------------------------------------------------------
+    problem.add_mapping("A", "A_() ** compartment")
+    problem.add_mapping("B", "B_() ** compartment")
 
-simulation_df = problem.measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-simulation_df[SIMULATION] = [
-    analytical_a(t, 1, 2, 0.8, 0.6) for t in simulation_df[TIME]
-]
+    # solutions ---------------------------------------------------------------
 
-case = PetabV2TestCase(
-    id=11,
-    brief="Simulation. InitialAssignment to species overridden.",
-    description=DESCRIPTION,
-    model=Path("conversion_modified_pysb.py"),
-    condition_dfs=[problem.condition_df],
-    observable_dfs=[problem.observable_df],
-    measurement_dfs=[problem.measurement_df],
-    simulation_dfs=[simulation_df],
-    parameter_df=problem.parameter_df,
-    mapping_df=problem.mapping_df,
-    experiment_dfs=[problem.experiment_df],
-)
+    simulation_df = problem.measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
+    )
+    simulation_df[SIMULATION] = [
+        analytical_a(t, 1, 2, 0.8, 0.6) for t in simulation_df[TIME]
+    ]
+
+    return PetabV2TestCase(
+        id=11,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=Path("conversion_modified_pysb.py"),
+        condition_dfs=[problem.condition_df],
+        observable_dfs=[problem.observable_df],
+        measurement_dfs=[problem.measurement_df],
+        simulation_dfs=[simulation_df],
+        parameter_df=problem.parameter_df,
+        mapping_df=problem.mapping_df,
+        experiment_dfs=[problem.experiment_df],
+    )
@@ -15,46 +15,55 @@ This case tests parametric initial concentrations in the condition table.
 A simple conversion reaction `A <=> B` in a single compartment, following
 mass action kinetics.
 """)
+BRIEF = (
+    "Simulation. Species with InitialAssignment overridden by " "parameter."
+)
 
-# problem --------------------------------------------------------------------
-problem = Problem()
 
-problem.add_condition("c0", B="par")
-problem.add_experiment("e0", 0, "c0")
-problem.add_observable("obs_a", "A", noise_formula=0.5)
+def build() -> PetabV2TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
+    problem = Problem()
 
-problem.add_measurement("obs_a", experiment_id="e0", time=0, measurement=0.7)
-problem.add_measurement("obs_a", experiment_id="e0", time=10, measurement=0.1)
+    problem.add_condition("c0", B="par")
+    problem.add_experiment("e0", 0, "c0")
+    problem.add_observable("obs_a", "A", noise_formula=0.5)
 
-problem.add_parameter("k1", lb=0, ub=10, nominal_value=0.8, estimate=True)
-problem.add_parameter("k2", lb=0, ub=10, nominal_value=0.6, estimate=True)
-problem.add_parameter("par", lb=0, ub=10, nominal_value=7, estimate=True)
+    problem.add_measurement(
+        "obs_a", experiment_id="e0", time=0, measurement=0.7
+    )
+    problem.add_measurement(
+        "obs_a", experiment_id="e0", time=10, measurement=0.1
+    )
 
-problem.add_mapping("A", "A_() ** compartment")
-problem.add_mapping("B", "B_() ** compartment")
+    problem.add_parameter("k1", lb=0, ub=10, nominal_value=0.8, estimate=True)
+    problem.add_parameter("k2", lb=0, ub=10, nominal_value=0.6, estimate=True)
+    problem.add_parameter("par", lb=0, ub=10, nominal_value=7, estimate=True)
 
-# solutions ------------------------------------------------------------------
+    problem.add_mapping("A", "A_() ** compartment")
+    problem.add_mapping("B", "B_() ** compartment")
 
-simulation_df = problem.measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-# in the model, concentrations are used, which do not depend on the
-#  compartment size, so that the species values should stay the same
-simulation_df[SIMULATION] = [
-    analytical_a(t, 1, 7, 0.8, 0.6) for t in simulation_df[TIME]
-]
-
-case = PetabV2TestCase(
-    id=13,
-    brief="Simulation. Species with InitialAssignment overridden by "
-    "parameter.",
-    description=DESCRIPTION,
-    model=Path("conversion_modified_pysb.py"),
-    condition_dfs=[problem.condition_df],
-    observable_dfs=[problem.observable_df],
-    measurement_dfs=[problem.measurement_df],
-    simulation_dfs=[simulation_df],
-    parameter_df=problem.parameter_df,
-    mapping_df=problem.mapping_df,
-    experiment_dfs=[problem.experiment_df],
-)
+    # solutions ---------------------------------------------------------------
+
+    simulation_df = problem.measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
+    )
+    # in the model, concentrations are used, which do not depend on the
+    #  compartment size, so that the species values should stay the same
+    simulation_df[SIMULATION] = [
+        analytical_a(t, 1, 7, 0.8, 0.6) for t in simulation_df[TIME]
+    ]
+
+    return PetabV2TestCase(
+        id=13,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=Path("conversion_modified_pysb.py"),
+        condition_dfs=[problem.condition_df],
+        observable_dfs=[problem.observable_df],
+        measurement_dfs=[problem.measurement_df],
+        simulation_dfs=[simulation_df],
+        parameter_df=problem.parameter_df,
+        mapping_df=problem.mapping_df,
+        experiment_dfs=[problem.experiment_df],
+    )
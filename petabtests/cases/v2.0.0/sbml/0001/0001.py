@@ -16,37 +16,41 @@ features.
 A simple conversion reaction `A <=> B` in a single compartment, following
 mass action kinetics.
 """)
-
-# problem --------------------------------------------------------------------
-a0 = 1
-b0 = 0
-k1 = 0.8
-k2 = 0.6
-
-problem = Problem()
-problem += Observable(id="obs_a", formula="A", noise_formula=0.5)
-problem += Measurement(observable_id="obs_a", time=0, measurement=0.7)
-problem += Measurement(observable_id="obs_a", time=10, measurement=0.1)
-problem += Parameter(id="a0", lb=0, ub=10, nominal_value=a0)
-problem += Parameter(id="b0", lb=0, ub=10, nominal_value=b0)
-problem += Parameter(id="k1", lb=0, ub=10, nominal_value=k1)
-problem += Parameter(id="k2", lb=0, ub=10, nominal_value=k2)
-
-# solutions ------------------------------------------------------------------
-
-simulation_df = problem.measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-simulation_df[SIMULATION] = [
-    analytical_a(t=t, a0=a0, b0=b0, k1=k1, k2=k2) for t in simulation_df[TIME]
-]
-
-
-case = PetabV2TestCase.from_problem(
-    id=1,
-    problem=problem,
-    brief="Simulation. Nothing special.",
-    description=DESCRIPTION,
-    model=DEFAULT_SBML_FILE,
-    simulation_df=simulation_df,
-)
+BRIEF = "Simulation. Nothing special."
+
+
+def build() -> PetabV2TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
+    a0 = 1
+    b0 = 0
+    k1 = 0.8
+    k2 = 0.6
+
+    problem = Problem()
+    problem += Observable(id="obs_a", formula="A", noise_formula=0.5)
+    problem += Measurement(observable_id="obs_a", time=0, measurement=0.7)
+    problem += Measurement(observable_id="obs_a", time=10, measurement=0.1)
+    problem += Parameter(id="a0", lb=0, ub=10, nominal_value=a0)
+    problem += Parameter(id="b0", lb=0, ub=10, nominal_value=b0)
+    problem += Parameter(id="k1", lb=0, ub=10, nominal_value=k1)
+    problem += Parameter(id="k2", lb=0, ub=10, nominal_value=k2)
+
+    # solutions ---------------------------------------------------------------
+
+    simulation_df = problem.measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
+    )
+    simulation_df[SIMULATION] = [
+        analytical_a(t=t, a0=a0, b0=b0, k1=k1, k2=k2)
+        for t in simulation_df[TIME]
+    ]
+
+    return PetabV2TestCase.from_problem(
+        id=1,
+        problem=problem,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=DEFAULT_SBML_FILE,
+        simulation_df=simulation_df,
+    )
@@ -19,57 +19,63 @@ model output is scaled by a different parameter at each timepoint.
 A simple conversion reaction `A <=> B` in a single compartment, following
 mass action kinetics.
 """)
+BRIEF = (
+    "Simulation. Time-point specific numeric observable parameter "
+    "overrides."
+)
 
-# problem --------------------------------------------------------------------
 
-measurement_df = pd.DataFrame(
-    data={
-        OBSERVABLE_ID: ["obs_a", "obs_a"],
-        EXPERIMENT_ID: ["", ""],
-        TIME: [0, 10],
-        MEASUREMENT: [0.7, 0.1],
-        OBSERVABLE_PARAMETERS: [10, 15],
-    }
-)
+def build() -> PetabV2TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
 
-observable_df = pd.DataFrame(
-    data={
-        OBSERVABLE_ID: ["obs_a"],
-        OBSERVABLE_FORMULA: ["obs_a_scale * A"],
-        NOISE_FORMULA: [1],
-        OBSERVABLE_PLACEHOLDERS: ["obs_a_scale"],
-    }
-).set_index([OBSERVABLE_ID])
+    measurement_df = pd.DataFrame(
+        data={
+            OBSERVABLE_ID: ["obs_a", "obs_a"],
+            EXPERIMENT_ID: ["", ""],
+            TIME: [0, 10],
+            MEASUREMENT: [0.7, 0.1],
+            OBSERVABLE_PARAMETERS: [10, 15],
+        }
+    )
 
-parameter_df = pd.DataFrame(
-    data={
-        PARAMETER_ID: ["a0", "b0", "k1", "k2"],
-        LOWER_BOUND: [0] * 4,
-        UPPER_BOUND: [10] * 4,
-        NOMINAL_VALUE: [1, 0, 0.8, 0.6],
-        ESTIMATE: ["true"] * 4,
-    }
-).set_index(PARAMETER_ID)
+    observable_df = pd.DataFrame(
+        data={
+            OBSERVABLE_ID: ["obs_a"],
+            OBSERVABLE_FORMULA: ["obs_a_scale * A"],
+            NOISE_FORMULA: [1],
+            OBSERVABLE_PLACEHOLDERS: ["obs_a_scale"],
+        }
+    ).set_index([OBSERVABLE_ID])
 
-# solutions ------------------------------------------------------------------
+    parameter_df = pd.DataFrame(
+        data={
+            PARAMETER_ID: ["a0", "b0", "k1", "k2"],
+            LOWER_BOUND: [0] * 4,
+            UPPER_BOUND: [10] * 4,
+            NOMINAL_VALUE: [1, 0, 0.8, 0.6],
+            ESTIMATE: ["true"] * 4,
+        }
+    ).set_index(PARAMETER_ID)
 
-simulation_df = measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-simulation_df[SIMULATION] = [
-    10 * analytical_a(0, 1, 0, 0.8, 0.6),
-    15 * analytical_a(10, 1, 0, 0.8, 0.6),
-]
+    # solutions ---------------------------------------------------------------
 
-case = PetabV2TestCase(
-    id=6,
-    brief="Simulation. Time-point specific numeric observable parameter "
-    "overrides.",
-    description=DESCRIPTION,
-    model=DEFAULT_SBML_FILE,
-    condition_dfs=[],
-    observable_dfs=[observable_df],
-    measurement_dfs=[measurement_df],
-    simulation_dfs=[simulation_df],
-    parameter_df=parameter_df,
-)
+    simulation_df = measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
+    )
+    simulation_df[SIMULATION] = [
+        10 * analytical_a(0, 1, 0, 0.8, 0.6),
+        15 * analytical_a(10, 1, 0, 0.8, 0.6),
+    ]
+
+    return PetabV2TestCase(
+        id=6,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=DEFAULT_SBML_FILE,
+        condition_dfs=[],
+        observable_dfs=[observable_df],
+        measurement_dfs=[measurement_df],
+        simulation_dfs=[simulation_df],
+        parameter_df=parameter_df,
+    )
@@ -22,43 +22,51 @@ simulation condition.
 A simple conversion reaction `A <=> B` in a single compartment, following
 mass action kinetics.
 """)
+BRIEF = "Simulation. Preequilibration."
 
-# problem --------------------------------------------------------------------
 
-problem = Problem()
-problem.add_condition("preeq_c0", k1=0.3)
-problem.add_condition("c0", k1=0.8)
+def build() -> PetabV2TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
 
-problem.add_experiment("e0", "-inf", "preeq_c0", 0, "c0")
+    problem = Problem()
+    problem.add_condition("preeq_c0", k1=0.3)
+    problem.add_condition("c0", k1=0.8)
 
-problem.add_observable("obs_a", "A", noise_formula="0.5")
+    problem.add_experiment("e0", "-inf", "preeq_c0", 0, "c0")
 
-problem.add_measurement("obs_a", experiment_id="e0", time=1, measurement=0.7)
-problem.add_measurement("obs_a", experiment_id="e0", time=10, measurement=0.1)
+    problem.add_observable("obs_a", "A", noise_formula="0.5")
 
-problem.add_parameter("a0", lb=0, ub=10, nominal_value=1, estimate=True)
-problem.add_parameter("b0", lb=0, ub=10, nominal_value=0, estimate=True)
-problem.add_parameter("k2", lb=0, ub=10, nominal_value=0.6, estimate=True)
+    problem.add_measurement(
+        "obs_a", experiment_id="e0", time=1, measurement=0.7
+    )
+    problem.add_measurement(
+        "obs_a", experiment_id="e0", time=10, measurement=0.1
+    )
 
-# solutions ------------------------------------------------------------------
+    problem.add_parameter("a0", lb=0, ub=10, nominal_value=1, estimate=True)
+    problem.add_parameter("b0", lb=0, ub=10, nominal_value=0, estimate=True)
+    problem.add_parameter("k2", lb=0, ub=10, nominal_value=0.6, estimate=True)
 
-simulation_df = problem.measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-# simulate for far time point as steady state
-steady_state_a = analytical_a(1000, 1, 0, 0.3, 0.6)
-steady_state_b = analytical_b(1000, 1, 0, 0.3, 0.6)
-# use steady state as initial state
-simulation_df[SIMULATION] = [
-    analytical_a(t, steady_state_a, steady_state_b, 0.8, 0.6)
-    for t in simulation_df[TIME]
-]
-
-case = PetabV2TestCase.from_problem(
-    id=9,
-    brief="Simulation. Preequilibration.",
-    description=DESCRIPTION,
-    model=DEFAULT_SBML_FILE,
-    problem=problem,
-    simulation_df=simulation_df,
-)
+    # solutions ---------------------------------------------------------------
+
+    simulation_df = problem.measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
+    )
+    # simulate for far time point as steady state
+    steady_state_a = analytical_a(1000, 1, 0, 0.3, 0.6)
+    steady_state_b = analytical_b(1000, 1, 0, 0.3, 0.6)
+    # use steady state as initial state
+    simulation_df[SIMULATION] = [
+        analytical_a(t, steady_state_a, steady_state_b, 0.8, 0.6)
+        for t in simulation_df[TIME]
+    ]
+
+    return PetabV2TestCase.from_problem(
+        id=9,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=DEFAULT_SBML_FILE,
+        problem=problem,
+        simulation_df=simulation_df,
+    )
@@ -15,55 +15,58 @@ This case tests parametric noise parameter overrides in the measurement table.
 A simple conversion reaction `A <=> B` in a single compartment, following
 mass action kinetics.
 """)
+BRIEF = "Simulation. Single parametric noise parameter override."
 
-# problem --------------------------------------------------------------------
 
+def build() -> PetabV2TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
 
-measurement_df = pd.DataFrame(
-    data={
-        OBSERVABLE_ID: ["obs_a", "obs_a"],
-        EXPERIMENT_ID: ["", ""],
-        TIME: [0, 10],
-        MEASUREMENT: [0.7, 0.1],
-        NOISE_PARAMETERS: ["noise", "noise"],
-    }
-)
+    measurement_df = pd.DataFrame(
+        data={
+            OBSERVABLE_ID: ["obs_a", "obs_a"],
+            EXPERIMENT_ID: ["", ""],
+            TIME: [0, 10],
+            MEASUREMENT: [0.7, 0.1],
+            NOISE_PARAMETERS: ["noise", "noise"],
+        }
+    )
 
-observable_df = pd.DataFrame(
-    data={
-        OBSERVABLE_ID: ["obs_a"],
-        OBSERVABLE_FORMULA: ["A"],
-        NOISE_FORMULA: ["noiseParameter1_obs_a"],
-        NOISE_PLACEHOLDERS: ["noiseParameter1_obs_a"],
-    }
-).set_index([OBSERVABLE_ID])
-parameter_df = pd.DataFrame(
-    data={
-        PARAMETER_ID: ["a0", "b0", "k1", "k2", "noise"],
-        LOWER_BOUND: [0] * 5,
-        UPPER_BOUND: [10] * 5,
-        NOMINAL_VALUE: [1, 0, 0.8, 0.6, 5],
-        ESTIMATE: ["true"] * 5,
-    }
-).set_index(PARAMETER_ID)
+    observable_df = pd.DataFrame(
+        data={
+            OBSERVABLE_ID: ["obs_a"],
+            OBSERVABLE_FORMULA: ["A"],
+            NOISE_FORMULA: ["noiseParameter1_obs_a"],
+            NOISE_PLACEHOLDERS: ["noiseParameter1_obs_a"],
+        }
+    ).set_index([OBSERVABLE_ID])
+    parameter_df = pd.DataFrame(
+        data={
+            PARAMETER_ID: ["a0", "b0", "k1", "k2", "noise"],
+            LOWER_BOUND: [0] * 5,
+            UPPER_BOUND: [10] * 5,
+            NOMINAL_VALUE: [1, 0, 0.8, 0.6, 5],
+            ESTIMATE: ["true"] * 5,
+        }
+    ).set_index(PARAMETER_ID)
 
-# solutions ------------------------------------------------------------------
+    # solutions ---------------------------------------------------------------
 
-simulation_df = measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-simulation_df[SIMULATION] = [
-    analytical_a(t, 1, 0, 0.8, 0.6) for t in simulation_df[TIME]
-]
+    simulation_df = measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
+    )
+    simulation_df[SIMULATION] = [
+        analytical_a(t, 1, 0, 0.8, 0.6) for t in simulation_df[TIME]
+    ]
 
-case = PetabV2TestCase(
-    id=15,
-    brief="Simulation. Single parametric noise parameter override.",
-    description=DESCRIPTION,
-    model=DEFAULT_SBML_FILE,
-    condition_dfs=[],
-    observable_dfs=[observable_df],
-    measurement_dfs=[measurement_df],
-    simulation_dfs=[simulation_df],
-    parameter_df=parameter_df,
-)
+    return PetabV2TestCase(
+        id=15,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=DEFAULT_SBML_FILE,
+        condition_dfs=[],
+        observable_dfs=[observable_df],
+        measurement_dfs=[measurement_df],
+        simulation_dfs=[simulation_df],
+        parameter_df=parameter_df,
+    )
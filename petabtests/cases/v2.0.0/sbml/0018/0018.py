@@ -2,12 +2,11 @@ from inspect import cleandoc
 
 from petab.v2.C import *
 from petab.v2 import Problem
-from pathlib import Path
 from petabtests import (
     PetabV2TestCase,
     analytical_a,
     analytical_b,
-    antimony_to_sbml_str,
+    AntimonyModel,
 )
 
 DESCRIPTION = cleandoc("""
@@ -31,12 +30,18 @@ A simple conversion reaction `A <=> B` in a single compartment, following
 mass action kinetics. Dynamics of are specified as `RateRule`s targeting a
 parameter and a species.
 """)
+BRIEF = (
+    "Simulation. Preequilibration and RateRules. "
+    "Non-zero simulation start time. "
+    "InitialAssignment to species overridden."
+)
 
-# problem --------------------------------------------------------------------
 
-sbml_file = Path(__file__).parent / "model.xml"
+def build() -> PetabV2TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
 
-ant_model = """
+    ant_model = """
 model petab_test_0018
     a0 = 1
     b0 = 1
@@ -49,53 +54,54 @@ model petab_test_0018
     B' = - default_compartment * k2 * B + default_compartment * k1 * A
 end
 """
-sbml_file.write_text(antimony_to_sbml_str(ant_model))
-
-problem = Problem()
-
-problem.add_condition("preeq_c0", k1=0.3, B=2.0, A=0)
-problem.add_condition("c0", k1=0.8, A=1)
-
-problem.add_experiment("e0", "-inf", "preeq_c0", 10, "c0")
-
-problem.add_observable("obs_a", "A", noise_formula="0.5")
-problem.add_observable("obs_b", "B", noise_formula="0.2")
-
-problem.add_measurement("obs_a", experiment_id="e0", time=10, measurement=0.1)
-problem.add_measurement("obs_a", experiment_id="e0", time=11, measurement=0.7)
-problem.add_measurement("obs_a", experiment_id="e0", time=20, measurement=0.1)
-problem.add_measurement("obs_b", experiment_id="e0", time=10, measurement=0.1)
 
-problem.add_parameter("k2", lb=0, ub=10, nominal_value=0.6, estimate=True)
-
-
-# solutions ------------------------------------------------------------------
-
-simulation_df = problem.measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-# simulate for far time point as steady state
-steady_state_b = analytical_b(1000, 0, 2.0, 0.3, 0.6)
-# use steady state as initial state
-simulation_df.iloc[:3, simulation_df.columns.get_loc(SIMULATION)] = [
-    analytical_a(t - 10, 1, steady_state_b, 0.8, 0.6)
-    for t in simulation_df[TIME]
-][:3]
-simulation_df.iloc[3:, simulation_df.columns.get_loc(SIMULATION)] = [
-    analytical_b(t - 10, 1, steady_state_b, 0.8, 0.6)
-    for t in simulation_df[TIME]
-][3:]
-
-
-case = PetabV2TestCase.from_problem(
-    id=18,
-    brief=(
-        "Simulation. Preequilibration and RateRules. "
-        "Non-zero simulation start time. "
-        "InitialAssignment to species overridden."
-    ),
-    description=DESCRIPTION,
-    model=sbml_file,
-    problem=problem,
-    simulation_df=simulation_df,
-)
+    problem = Problem()
+
+    problem.add_condition("preeq_c0", k1=0.3, B=2.0, A=0)
+    problem.add_condition("c0", k1=0.8, A=1)
+
+    problem.add_experiment("e0", "-inf", "preeq_c0", 10, "c0")
+
+    problem.add_observable("obs_a", "A", noise_formula="0.5")
+    problem.add_observable("obs_b", "B", noise_formula="0.2")
+
+    problem.add_measurement(
+        "obs_a", experiment_id="e0", time=10, measurement=0.1
+    )
+    problem.add_measurement(
+        "obs_a", experiment_id="e0", time=11, measurement=0.7
+    )
+    problem.add_measurement(
+        "obs_a", experiment_id="e0", time=20, measurement=0.1
+    )
+    problem.add_measurement(
+        "obs_b", experiment_id="e0", time=10, measurement=0.1
+    )
+
+    problem.add_parameter("k2", lb=0, ub=10, nominal_value=0.6, estimate=True)
+
+    # solutions ---------------------------------------------------------------
+
+    simulation_df = problem.measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
+    )
+    # simulate for far time point as steady state
+    steady_state_b = analytical_b(1000, 0, 2.0, 0.3, 0.6)
+    # use steady state as initial state
+    simulation_df.iloc[:3, simulation_df.columns.get_loc(SIMULATION)] = [
+        analytical_a(t - 10, 1, steady_state_b, 0.8, 0.6)
+        for t in simulation_df[TIME]
+    ][:3]
+    simulation_df.iloc[3:, simulation_df.columns.get_loc(SIMULATION)] = [
+        analytical_b(t - 10, 1, steady_state_b, 0.8, 0.6)
+        for t in simulation_df[TIME]
+    ][3:]
+
+    return PetabV2TestCase.from_problem(
+        id=18,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=AntimonyModel(ant_model),
+        problem=problem,
+        simulation_df=simulation_df,
+    )
@@ -15,47 +15,49 @@ the measurement table.
 A simple conversion reaction `A <=> B` in a single compartment, following
 mass action kinetics.
 """)
-
-# problem --------------------------------------------------------------------
-
-problem = Problem()
-problem.add_measurement(
-    "obs_a", time=0, measurement=0.7, noise_parameters=["noise"]
-)
-problem.add_measurement(
-    "obs_a", time=10, measurement=0.1, noise_parameters=["noise"]
-)
-problem.add_observable(
-    "obs_a",
-    "A",
-    noise_formula="obs_a_noise_scale * obs_a",
-    noise_placeholders=["obs_a_noise_scale"],
-)
-problem.add_parameter("a0", lb=0, ub=10, nominal_value=1)
-problem.add_parameter("b0", lb=0, ub=10, nominal_value=0)
-problem.add_parameter("k1", lb=0, ub=10, nominal_value=0.8)
-problem.add_parameter("k2", lb=0, ub=10, nominal_value=0.6)
-problem.add_parameter("noise", lb=0, ub=10, nominal_value=5)
-
-
-# solutions ------------------------------------------------------------------
-
-simulation_df = problem.measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-simulation_df[SIMULATION] = [
-    analytical_a(t, 1, 0, 0.8, 0.6) for t in simulation_df[TIME]
-]
-
-
-case = PetabV2TestCase(
-    id=21,
-    brief="Observable-dependent noise formula.",
-    description=DESCRIPTION,
-    model=DEFAULT_SBML_FILE,
-    condition_dfs=[],
-    observable_dfs=[problem.observable_df],
-    measurement_dfs=[problem.measurement_df],
-    simulation_dfs=[simulation_df],
-    parameter_df=problem.parameter_df,
-)
+BRIEF = "Observable-dependent noise formula."
+
+
+def build() -> PetabV2TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
+
+    problem = Problem()
+    problem.add_measurement(
+        "obs_a", time=0, measurement=0.7, noise_parameters=["noise"]
+    )
+    problem.add_measurement(
+        "obs_a", time=10, measurement=0.1, noise_parameters=["noise"]
+    )
+    problem.add_observable(
+        "obs_a",
+        "A",
+        noise_formula="obs_a_noise_scale * obs_a",
+        noise_placeholders=["obs_a_noise_scale"],
+    )
+    problem.add_parameter("a0", lb=0, ub=10, nominal_value=1)
+    problem.add_parameter("b0", lb=0, ub=10, nominal_value=0)
+    problem.add_parameter("k1", lb=0, ub=10, nominal_value=0.8)
+    problem.add_parameter("k2", lb=0, ub=10, nominal_value=0.6)
+    problem.add_parameter("noise", lb=0, ub=10, nominal_value=5)
+
+    # solutions ---------------------------------------------------------------
+
+    simulation_df = problem.measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
+    )
+    simulation_df[SIMULATION] = [
+        analytical_a(t, 1, 0, 0.8, 0.6) for t in simulation_df[TIME]
+    ]
+
+    return PetabV2TestCase(
+        id=21,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=DEFAULT_SBML_FILE,
+        condition_dfs=[],
+        observable_dfs=[problem.observable_df],
+        measurement_dfs=[problem.measurement_df],
+        simulation_dfs=[simulation_df],
+        parameter_df=problem.parameter_df,
+    )
@@ -5,10 +5,9 @@ from petab.v2 import Problem
 from petabtests import (
     PetabV2TestCase,
     analytical_a,
-    antimony_to_sbml_str,
+    AntimonyModel,
     analytical_b,
 )
-from pathlib import Path
 
 DESCRIPTION = cleandoc("""
 ## Objective
@@ -40,29 +39,33 @@ This leads to the following model state at time 10:
   change.
 * The amount of `b` remains at `4`, unaffected by the compartment size change.
 """)
+BRIEF = (
+    "Simultaneous re-initialization of compartment size and contained species."
+)
+
 
-# problem --------------------------------------------------------------------
-
-sbml_file = Path(__file__).parent / "model.xml"
-
-# kinetic parameters
-k1 = 2
-k2 = 1
-# Initial values
-# [A], [B], compartment volume
-a_c0 = 2
-b_c0 = 1
-vol0 = 2
-# Condition table values
-a_update = 5
-vol_update = 4
-# Values after re-initialization
-# [A], [B], compartment volume
-a_c10 = 5
-b_c10 = 2
-vol_10 = vol_update
-
-ant_model = f"""
+def build() -> PetabV2TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
+
+    # kinetic parameters
+    k1 = 2
+    k2 = 1
+    # Initial values
+    # [A], [B], compartment volume
+    a_c0 = 2
+    b_c0 = 1
+    vol0 = 2
+    # Condition table values
+    a_update = 5
+    vol_update = 4
+    # Values after re-initialization
+    # [A], [B], compartment volume
+    a_c10 = 5
+    b_c10 = 2
+    vol_10 = vol_update
+
+    ant_model = f"""
 model petab_test_0022
     compartment default_compartment = {vol0}
     initial_conc_A = {a_c0}
@@ -83,75 +86,72 @@ model petab_test_0022
     b' = - k2 * b + k1 * a
 end
 """
-sbml_file.write_text(antimony_to_sbml_str(ant_model))
-
-
-problem = Problem()
-problem.add_observable("obs_a", "a", noise_formula="1")
-problem.add_observable("obs_A", "A", noise_formula="1")
-problem.add_observable("obs_b", "b", noise_formula="1")
-problem.add_observable("obs_B", "B", noise_formula="1")
-
-problem.add_parameter("k1", lb=0, ub=10, nominal_value=k1)
-problem.add_experiment("experiment1", 0, "", 10, "condition2")
-problem.add_condition(
-    "condition2",
-    "condition2",
-    a=a_update * vol_10,
-    A=a_update,
-    default_compartment=vol_10,
-)
 
-
-ts = [0, 5, 10, 15]
-for t in ts:
-    problem.add_measurement(
-        "obs_a", experiment_id="experiment1", time=t, measurement=2
-    )
-    problem.add_measurement(
-        "obs_A", experiment_id="experiment1", time=t, measurement=2
+    problem = Problem()
+    problem.add_observable("obs_a", "a", noise_formula="1")
+    problem.add_observable("obs_A", "A", noise_formula="1")
+    problem.add_observable("obs_b", "b", noise_formula="1")
+    problem.add_observable("obs_B", "B", noise_formula="1")
+
+    problem.add_parameter("k1", lb=0, ub=10, nominal_value=k1)
+    problem.add_experiment("experiment1", 0, "", 10, "condition2")
+    problem.add_condition(
+        "condition2",
+        "condition2",
+        a=a_update * vol_10,
+        A=a_update,
+        default_compartment=vol_10,
     )
-    problem.add_measurement(
-        "obs_b", experiment_id="experiment1", time=t, measurement=1
+
+    ts = [0, 5, 10, 15]
+    for t in ts:
+        problem.add_measurement(
+            "obs_a", experiment_id="experiment1", time=t, measurement=2
+        )
+        problem.add_measurement(
+            "obs_A", experiment_id="experiment1", time=t, measurement=2
+        )
+        problem.add_measurement(
+            "obs_b", experiment_id="experiment1", time=t, measurement=1
+        )
+        problem.add_measurement(
+            "obs_B", experiment_id="experiment1", time=t, measurement=1
+        )
+
+    # solutions ---------------------------------------------------------------
+
+    simulation_df = problem.measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
     )
-    problem.add_measurement(
-        "obs_B", experiment_id="experiment1", time=t, measurement=1
+    simulation_df[SIMULATION] = [
+        # a, A, b, B
+        # t=0
+        a_c0 * vol0,
+        a_c0,
+        b_c0 * vol0,
+        b_c0,
+        # t=5
+        analytical_a(5, a_c0, b_c0, k1, k2) * vol0,
+        analytical_a(5, a_c0, b_c0, k1, k2),
+        analytical_b(5, a_c0, b_c0, k1, k2) * vol0,
+        analytical_b(5, a_c0, b_c0, k1, k2),
+        # t=10, re-initialize compartment size and contained species
+        a_c10 * vol_10,
+        a_c10,
+        b_c10 * vol0,
+        b_c10,
+        # t=15 (5s after re-initialization)
+        analytical_a(5, a_c10 * vol_10, b_c10 * vol0, k1, k2),
+        analytical_a(5, a_c10, b_c10, k1, k2),
+        analytical_b(5, a_c10 * vol_10, b_c10 * vol0, k1, k2),
+        analytical_b(5, a_c10, b_c10, k1, k2),
+    ]
+
+    return PetabV2TestCase.from_problem(
+        id=22,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=AntimonyModel(ant_model),
+        problem=problem,
+        simulation_df=simulation_df,
     )
-
-# solutions ------------------------------------------------------------------
-
-simulation_df = problem.measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-simulation_df[SIMULATION] = [
-    # a, A, b, B
-    # t=0
-    a_c0 * vol0,
-    a_c0,
-    b_c0 * vol0,
-    b_c0,
-    # t=5
-    analytical_a(5, a_c0, b_c0, k1, k2) * vol0,
-    analytical_a(5, a_c0, b_c0, k1, k2),
-    analytical_b(5, a_c0, b_c0, k1, k2) * vol0,
-    analytical_b(5, a_c0, b_c0, k1, k2),
-    # t=10, re-initialize compartment size and contained species
-    a_c10 * vol_10,
-    a_c10,
-    b_c10 * vol0,
-    b_c10,
-    # t=15 (5s after re-initialization)
-    analytical_a(5, a_c10 * vol_10, b_c10 * vol0, k1, k2),
-    analytical_a(5, a_c10, b_c10, k1, k2),
-    analytical_b(5, a_c10 * vol_10, b_c10 * vol0, k1, k2),
-    analytical_b(5, a_c10, b_c10, k1, k2),
-]
-
-case = PetabV2TestCase.from_problem(
-    id=22,
-    brief="Simultaneous re-initialization of compartment size and contained species.",
-    description=DESCRIPTION,
-    model=sbml_file,
-    problem=problem,
-    simulation_df=simulation_df,
-)
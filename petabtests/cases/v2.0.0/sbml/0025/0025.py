@@ -5,9 +5,8 @@ from petab.v2.C import *
 from petab.v2 import Problem
 from petabtests import (
     PetabV2TestCase,
-    antimony_to_sbml_str,
+    AntimonyModel,
 )
-from pathlib import Path
 from petab.v2 import PriorDistribution
 
 DESCRIPTION = cleandoc(r"""
@@ -20,75 +19,77 @@ implicit uniform priors and fixed parameters.
 
 A simple model with all constant parameters.
 """)
+BRIEF = "Non-truncated prior distributions."
 
-# problem --------------------------------------------------------------------
 
-priors = [
-    (PriorDistribution.UNIFORM, (2, 8), 2, 8),
-    (PriorDistribution.NORMAL, (4, 2), -inf, inf),
-    (PriorDistribution.LOG_NORMAL, (5, 2), 0.0, inf),
-    (PriorDistribution.CAUCHY, (3, 5), -inf, inf),
-    (PriorDistribution.CHI_SQUARED, (4), 0.0, inf),
-    (PriorDistribution.EXPONENTIAL, (3), 0.0, inf),
-    (PriorDistribution.GAMMA, (3, 5), 0, inf),
-    (PriorDistribution.LAPLACE, (3, 5), -inf, inf),
-    (PriorDistribution.LOG_LAPLACE, (3, 5), 0, inf),
-    (PriorDistribution.LOG_UNIFORM, (3, 5), 3, 5),
-    (PriorDistribution.RAYLEIGH, (3), 0, inf),
-]
+def build() -> PetabV2TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
 
-tested_prior_distrs = {pd for pd, _, _, _ in priors}
-untested_distrs = [
-    pd.value for pd in PriorDistribution if pd not in tested_prior_distrs
-]
-if untested_distrs:
-    print("Untested prior distributions:", untested_distrs)
+    priors = [
+        (PriorDistribution.UNIFORM, (2, 8), 2, 8),
+        (PriorDistribution.NORMAL, (4, 2), -inf, inf),
+        (PriorDistribution.LOG_NORMAL, (5, 2), 0.0, inf),
+        (PriorDistribution.CAUCHY, (3, 5), -inf, inf),
+        (PriorDistribution.CHI_SQUARED, (4), 0.0, inf),
+        (PriorDistribution.EXPONENTIAL, (3), 0.0, inf),
+        (PriorDistribution.GAMMA, (3, 5), 0, inf),
+        (PriorDistribution.LAPLACE, (3, 5), -inf, inf),
+        (PriorDistribution.LOG_LAPLACE, (3, 5), 0, inf),
+        (PriorDistribution.LOG_UNIFORM, (3, 5), 3, 5),
+        (PriorDistribution.RAYLEIGH, (3), 0, inf),
+    ]
 
-sbml_file = Path(__file__).parent / "_model.xml"
+    tested_prior_distrs = {pd for pd, _, _, _ in priors}
+    untested_distrs = [
+        pd.value for pd in PriorDistribution if pd not in tested_prior_distrs
+    ]
+    if untested_distrs:
+        print("Untested prior distributions:", untested_distrs)
 
-parameters = "\n".join(
-    f"p_{prior_type.value.replace('-', '_')} = 5;" for prior_type, _, _, _ in priors
-)
-ant_model = f"""
+    parameters = "\n".join(
+        f"p_{prior_type.value.replace('-', '_')} = 5;"
+        for prior_type, _, _, _ in priors
+    )
+    ant_model = f"""
 model petab_test_0025
     {parameters}
 end
 """
-sbml_file.write_text(antimony_to_sbml_str(ant_model))
 
-problem = Problem()
-for prior_type, prior_pars, support_lb, support_ub in priors:
-    problem.add_parameter(
-        f"p_{prior_type.value.replace('-', '_')}",
-        estimate=True,
-        lb=support_lb,
-        ub=support_ub,
-        nominal_value=5,
-        prior_distribution=prior_type,
-        prior_parameters=prior_pars,
-    )
-# implicit uniform prior
-problem.add_parameter("p1", estimate=True, nominal_value=1, lb=0, ub=2)
-# fixed, i.e., no prior
-problem.add_parameter("p_fixed", estimate=False, nominal_value=1)
-# we need some observable and measurement
-problem.add_observable("obs_p1", "p1", noise_formula="p_fixed")
-problem.add_measurement("obs_p1", experiment_id="", time=0, measurement=1)
+    problem = Problem()
+    for prior_type, prior_pars, support_lb, support_ub in priors:
+        problem.add_parameter(
+            f"p_{prior_type.value.replace('-', '_')}",
+            estimate=True,
+            lb=support_lb,
+            ub=support_ub,
+            nominal_value=5,
+            prior_distribution=prior_type,
+            prior_parameters=prior_pars,
+        )
+    # implicit uniform prior
+    problem.add_parameter("p1", estimate=True, nominal_value=1, lb=0, ub=2)
+    # fixed, i.e., no prior
+    problem.add_parameter("p_fixed", estimate=False, nominal_value=1)
+    # we need some observable and measurement
+    problem.add_observable("obs_p1", "p1", noise_formula="p_fixed")
+    problem.add_measurement("obs_p1", experiment_id="", time=0, measurement=1)
 
-# solutions ------------------------------------------------------------------
+    # solutions ---------------------------------------------------------------
 
-simulation_df = problem.measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-simulation_df[SIMULATION] = [
-    1,
-]
+    simulation_df = problem.measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
+    )
+    simulation_df[SIMULATION] = [
+        1,
+    ]
 
-case = PetabV2TestCase.from_problem(
-    id=25,
-    brief="Non-truncated prior distributions.",
-    description=DESCRIPTION,
-    model=sbml_file,
-    problem=problem,
-    simulation_df=simulation_df,
-)
+    return PetabV2TestCase.from_problem(
+        id=25,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=AntimonyModel(ant_model),
+        problem=problem,
+        simulation_df=simulation_df,
+    )
@@ -2,7 +2,12 @@ from inspect import cleandoc
 
 from petab.v2.C import *
 from petab.v2 import Problem
-from petabtests import PetabV2TestCase, analytical_a, analytical_b, DEFAULT_SBML_FILE
+from petabtests import (
+    PetabV2TestCase,
+    analytical_a,
+    analytical_b,
+    DEFAULT_SBML_FILE,
+)
 
 DESCRIPTION = cleandoc("""
 ## Objective
@@ -16,50 +21,58 @@ measurements.
 A simple conversion reaction `A <=> B` in a single compartment, following
 mass action kinetics.
 """)
-
-# problem --------------------------------------------------------------------
-a0 = 1
-b0 = 1
-k1 = 0.8
-k2 = 0.6
-problem = Problem()
-
-problem.add_condition(
-    "condition1",
-    "condition1",
-    A="A + 5.0",
+BRIEF = (
+    "Simulation. None t0 condition applied at time-point "
+    "without measurements."
 )
-problem.add_experiment("experiment1", 0, "", 7, "condition1")
 
 
-problem.add_observable("obs_a", "A", noise_formula="0.5")
-problem.add_measurement("obs_a", experiment_id="experiment1", time=0, measurement=0.7)
-problem.add_measurement("obs_a", experiment_id="experiment1", time=10, measurement=0.1)
+def build() -> PetabV2TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
+    a0 = 1
+    b0 = 1
+    k1 = 0.8
+    k2 = 0.6
+    problem = Problem()
 
-problem.add_parameter("k1", lb=0, ub=10, nominal_value=k1, estimate=True)
-problem.add_parameter("k2", lb=0, ub=10, nominal_value=k2, estimate=True)
+    problem.add_condition(
+        "condition1",
+        "condition1",
+        A="A + 5.0",
+    )
+    problem.add_experiment("experiment1", 0, "", 7, "condition1")
 
+    problem.add_observable("obs_a", "A", noise_formula="0.5")
+    problem.add_measurement(
+        "obs_a", experiment_id="experiment1", time=0, measurement=0.7
+    )
+    problem.add_measurement(
+        "obs_a", experiment_id="experiment1", time=10, measurement=0.1
+    )
 
-# solutions ------------------------------------------------------------------
+    problem.add_parameter("k1", lb=0, ub=10, nominal_value=k1, estimate=True)
+    problem.add_parameter("k2", lb=0, ub=10, nominal_value=k2, estimate=True)
 
-simulation_df = problem.measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-# in the model, concentrations are used, which do not depend on the
-#  compartment size, so that the species values should stay the same
-a7 = analytical_a(7.0, a0=a0, b0=b0, k1=k1, k2=k2)
-b7 = analytical_b(7.0, a0=a0, b0=b0, k1=k1, k2=k2)
-simulation_df[SIMULATION] = [
-    a0,
-    analytical_a(3.0, a0=(a7 + 5.0), b0=b7, k1=k1, k2=k2)
-]
+    # solutions ---------------------------------------------------------------
 
-case = PetabV2TestCase.from_problem(
-    id=28,
-    brief="Simulation. None t0 condition applied at time-point "
-    "without measurements.",
-    description=DESCRIPTION,
-    model=DEFAULT_SBML_FILE,
-    problem=problem,
-    simulation_df=simulation_df,
-)
+    simulation_df = problem.measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
+    )
+    # in the model, concentrations are used, which do not depend on the
+    #  compartment size, so that the species values should stay the same
+    a7 = analytical_a(7.0, a0=a0, b0=b0, k1=k1, k2=k2)
+    b7 = analytical_b(7.0, a0=a0, b0=b0, k1=k1, k2=k2)
+    simulation_df[SIMULATION] = [
+        a0,
+        analytical_a(3.0, a0=(a7 + 5.0), b0=b7, k1=k1, k2=k2),
+    ]
+
+    return PetabV2TestCase.from_problem(
+        id=28,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=DEFAULT_SBML_FILE,
+        problem=problem,
+        simulation_df=simulation_df,
+    )
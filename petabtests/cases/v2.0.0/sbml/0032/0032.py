@@ -7,9 +7,8 @@ from petabtests import (
     PetabV2TestCase,
     analytical_a,
     analytical_b,
-    antimony_to_sbml_str,
+    AntimonyModel,
 )
-from pathlib import Path
 
 DESCRIPTION = cleandoc("""
 ## Objective
@@ -25,9 +24,16 @@ setting the concentration of A appears in the observable formulas. For species
 A simple conversion reaction `A <=> B` in a single compartment, following
 mass action kinetics.
 """)
+BRIEF = (
+    "Simulation. A parameter to estimate both sets initial value and appears in observable \
+        formulas"
+)
+
 
-# problem --------------------------------------------------------------------
-ant_model = """
+def build() -> PetabV2TestCase:
+    """Build the test case."""
+    # problem -----------------------------------------------------------------
+    ant_model = """
 model *petab_test_0032()
   compartment compartment_ = 1;
   species A in compartment_, B in compartment_;
@@ -42,46 +48,55 @@ model *petab_test_0032()
   k2 = 0;
 end
 """
-model_file = Path(__file__).parent / "_model.xml"
-model_file.write_text(antimony_to_sbml_str(ant_model))
-
-problem = Problem()
-
-problem.add_condition("c0", A="initial_A", B="initial_B")
-problem.add_experiment("e1", 0, "c0")
-
-problem.add_observable("obs_a", "A + initial_A", noise_formula="0.5")
-problem.add_observable("obs_b", "B", noise_formula="0.5")
-problem.add_measurement("obs_a", experiment_id="e1", time=0, measurement=0.7)
-problem.add_measurement("obs_a", experiment_id="e1", time=10, measurement=0.1)
-problem.add_measurement("obs_b", experiment_id="e1", time=0, measurement=0.7)
-problem.add_measurement("obs_b", experiment_id="e1", time=10, measurement=0.1)
-
-problem.add_parameter("k1", lb=0, ub=10, nominal_value=0.8, estimate=True)
-problem.add_parameter("k2", lb=0, ub=10, nominal_value=0.6, estimate=True)
-problem.add_parameter("initial_A", lb=1, ub=10, nominal_value=2, estimate=True)
-problem.add_parameter(
-    "initial_B", lb=0, ub=10, nominal_value=3, estimate=False
-)
-
 
-# solutions ------------------------------------------------------------------
-
-simulation_df = problem.measurement_df.copy(deep=True).rename(
-    columns={MEASUREMENT: SIMULATION}
-)
-initial_A = 2.0
-simulation_df[SIMULATION] = [
-    *(analytical_a(t, initial_A, 3, 0.8, 0.6) + initial_A for t in (0, 10)),
-    *(analytical_b(t, initial_A, 3, 0.8, 0.6) for t in (0, 10)),
-]
-
-case = PetabV2TestCase.from_problem(
-    id=32,
-    brief="Simulation. A parameter to estimate both sets initial value and appears in observable \
-        formulas",
-    description=DESCRIPTION,
-    model=model_file,
-    problem=problem,
-    simulation_df=simulation_df,
-)
+    problem = Problem()
+
+    problem.add_condition("c0", A="initial_A", B="initial_B")
+    problem.add_experiment("e1", 0, "c0")
+
+    problem.add_observable("obs_a", "A + initial_A", noise_formula="0.5")
+    problem.add_observable("obs_b", "B", noise_formula="0.5")
+    problem.add_measurement(
+        "obs_a", experiment_id="e1", time=0, measurement=0.7
+    )
+    problem.add_measurement(
+        "obs_a", experiment_id="e1", time=10, measurement=0.1
+    )
+    problem.add_measurement(
+        "obs_b", experiment_id="e1", time=0, measurement=0.7
+    )
+    problem.add_measurement(
+        "obs_b", experiment_id="e1", time=10, measurement=0.1
+    )
+
+    problem.add_parameter("k1", lb=0, ub=10, nominal_value=0.8, estimate=True)
+    problem.add_parameter("k2", lb=0, ub=10, nominal_value=0.6, estimate=True)
+    problem.add_parameter(
+        "initial_A", lb=1, ub=10, nominal_value=2, estimate=True
+    )
+    problem.add_parameter(
+        "initial_B", lb=0, ub=10, nominal_value=3, estimate=False
+    )
+
+    # solutions ---------------------------------------------------------------
+
+    simulation_df = problem.measurement_df.copy(deep=True).rename(
+        columns={MEASUREMENT: SIMULATION}
+    )
+    initial_A = 2.0
+    simulation_df[SIMULATION] = [
+        *(
+            analytical_a(t, initial_A, 3, 0.8, 0.6) + initial_A
+            for t in (0, 10)
+        ),
+        *(analytical_b(t, initial_A, 3, 0.8, 0.6) for t in (0, 10)),
+    ]
+
+    return PetabV2TestCase.from_problem(
+        id=32,
+        brief=BRIEF,
+        description=DESCRIPTION,
+        model=AntimonyModel(ant_model),
+        problem=problem,
+        simulation_df=simulation_df,
+    )
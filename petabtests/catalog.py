@@ -0,0 +1,179 @@
+"""Catalog of generated test cases.
+
+For each PEtab version and model format, the catalog lists all test cases
+with their brief description, generated files, table sizes and the PEtab
+features they cover. It is written alongside the generated files, so that
+test cases can be listed and selected without importing the case definition
+modules.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import petab.v1.C as C1
+import petab.v2.C as C2
+
+from .C import CASES_DIR
+from .file import test_id_str
+from .util import as_list
+
+__all__ = [
+    "CATALOG_FILE",
+    "TAG_MAPPING_TABLE",
+    "TAG_MULTIPLE_EXPERIMENTS",
+    "TAG_PREEQUILIBRATION",
+    "TAG_PRIORS",
+    "create_catalog_entry",
+    "read_catalog",
+    "render_catalog",
+]
+
+#: Name of the catalog file inside a version/format directory
+CATALOG_FILE = "_catalog.json"
+
+# feature tags
+TAG_PREEQUILIBRATION = "preequilibration"
+TAG_MAPPING_TABLE = "mapping_table"
+TAG_PRIORS = "priors"
+TAG_MULTIPLE_EXPERIMENTS = "multiple_experiments"
+
+#: Memoized catalogs: path -> (modification time, catalog)
+_catalogs: dict[Path, tuple[int, dict[str, dict]]] = {}
+
+
+def read_catalog(
+    format_: str, version: str, root: Path | str = None
+) -> dict[str, dict] | None:
+    """Read the test case catalog for the given PEtab version and model
+    format.
+
+    The catalog is only parsed again if the file was modified.
+
+    Parameters
+    ----------
+    format_: Model format (SBML/PySB)
+    version: PEtab version
+    root: Root directory of the generated test suite (see
+        :func:`petabtests.file.get_case_dir`).
+
+    Returns
+    -------
+    Catalog entries by test case ID, or ``None`` if there is no catalog.
+    The result must not be modified.
+    """
+    root = Path(root) if root is not None else CASES_DIR
+    path = root / version / format_ / CATALOG_FILE
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    if (cached := _catalogs.get(path)) and cached[0] == mtime:
+        return cached[1]
+
+    with open(path) as f:
+        catalog = json.load(f)
+    _catalogs[path] = mtime, catalog
+    return catalog
+
+
+def render_catalog(entries: Iterable[dict]) -> str:
+    """Render catalog entries to the content of the catalog file."""
+    catalog = {entry["id"]: entry for entry in entries}
+    return json.dumps(catalog, indent=2, sort_keys=True) + "\n"
+
+
+def create_catalog_entry(
+    case, format_: str, version: str, files: Iterable[str]
+) -> dict:
+    """Create the catalog entry of a test case.
+
+    Parameters
+    ----------
+    case: The test case (:class:`petabtests.PetabV1TestCase` or
+        :class:`petabtests.PetabV2TestCase`).
+    format_: Model format (SBML/PySB)
+    version: PEtab version
+    files: Names of the generated files of the test case.
+    """
+    tables = {
+        "conditions": as_list(case.condition_dfs),
+        "observables": as_list(case.observable_dfs),
+        "measurements": as_list(case.measurement_dfs),
+        "parameters": as_list(case.parameter_df),
+        "simulations": as_list(case.simulation_dfs),
+    }
+    if version != "v1.0.0":
+        tables["experiments"] = as_list(case.experiment_dfs)
+        tables["mapping"] = as_list(case.mapping_df)
+
+    return {
+        "id": test_id_str(case.id),
+        "version": version,
+        "format": format_,
+        "brief": case.brief,
+        "files": sorted(files),
+        "rows": {
+            name: sum(len(df) for df in dfs) for name, dfs in tables.items()
+        },
+        "tags": _get_tags(tables, version),
+    }
+
+
+def _get_tags(tables: dict[str, list[pd.DataFrame]], version: str):
+    """Get the feature tags for the given test case tables."""
+    measurement_df = _concat(tables["measurements"])
+    parameter_df = _concat(tables["parameters"])
+
+    tags = []
+    if version == "v1.0.0":
+        if _has_values(measurement_df, C1.PREEQUILIBRATION_CONDITION_ID):
+            tags.append(TAG_PREEQUILIBRATION)
+        if _has_values(parameter_df, C1.OBJECTIVE_PRIOR_TYPE):
+            tags.append(TAG_PRIORS)
+        experiment_cols = [
+            col
+            for col in (
+                C1.PREEQUILIBRATION_CONDITION_ID,
+                C1.SIMULATION_CONDITION_ID,
+            )
+            if col in measurement_df
+        ]
+        n_experiments = len(
+            measurement_df[experiment_cols].fillna("").drop_duplicates()
+        )
+    else:
+        if any(
+            (pd.to_numeric(df[C2.TIME]) == -np.inf).any()
+            for df in tables["experiments"]
+        ):
+            tags.append(TAG_PREEQUILIBRATION)
+        if any(not df.empty for df in tables["mapping"]):
+            tags.append(TAG_MAPPING_TABLE)
+        if _has_values(parameter_df, C2.PRIOR_DISTRIBUTION):
+            tags.append(TAG_PRIORS)
+        n_experiments = (
+            measurement_df[C2.EXPERIMENT_ID].nunique()
+            if C2.EXPERIMENT_ID in measurement_df
+            else 1
+        )
+
+    if n_experiments > 1:
+        tags.append(TAG_MULTIPLE_EXPERIMENTS)
+
+    return sorted(tags)
+
+
+def _has_values(df: pd.DataFrame, column: str) -> bool:
+    """Check whether the given column exists and has any non-empty values."""
+    return column in df and df[column].replace("", np.nan).notna().any()
+
+
+def _concat(dfs: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate tables, allowing for an empty list."""
+    return pd.concat(dfs) if dfs else pd.DataFrame()
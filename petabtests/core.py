@@ -2,19 +2,59 @@ import itertools
 import logging
 import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+
+from petab import v1, v2
 
 from .C import CASES_DIR
 from .file import (
+    FileChecker,
+    FileDifference,
+    FileWriter,
     PetabV1TestCase,
     get_case_dir,
+    problem_yaml_name,
     test_id_str,
     write_info,
     PetabV2TestCase,
 )
+from .bundle import SOLUTION_BUNDLE_FILE, render_solution_bundle
+from .catalog import (
+    CATALOG_FILE,
+    TAG_MAPPING_TABLE,
+    TAG_MULTIPLE_EXPERIMENTS,
+    TAG_PREEQUILIBRATION,
+    TAG_PRIORS,
+    create_catalog_entry,
+    read_catalog,
+    render_catalog,
+)
+from .lint import LintResult, get_cached_lint_result, lint_problem
+from .manifest import (
+    MANIFEST_FILE,
+    is_up_to_date,
+    read_manifest,
+    write_manifest,
+)
+from .profiling import (
+    CaseProfile,
+    format_profile_summary,
+    phase,
+    profile_case,
+    write_profile_report,
+)
 
-__all__ = ["get_cases", "create_all", "clear", "get_cases_dir"]
+__all__ = [
+    "get_cases",
+    "create_all",
+    "clear",
+    "get_cases_dir",
+    "parse_case_ids",
+]
 
 test_formats = ("sbml", "pysb")
 test_versions = ("v1.0.0", "v2.0.0")
@@ -22,15 +62,61 @@ test_versions = ("v1.0.0", "v2.0.0")
 logger = logging.getLogger("petab_test_suite")
 
 
-def get_cases_dir(format_: str, version: str) -> Path:
+def get_cases_dir(format_: str, version: str, root: Path | str = None) -> Path:
     """Get the directory of the test cases for the given PEtab version and
-    model format."""
-    return CASES_DIR / version / format_
+    model format.
+
+    Parameters
+    ----------
+    format_: Model format (SBML/PySB)
+    version: PEtab version
+    root: Root directory of the test suite (see :func:`get_case_dir`).
+    """
+    return Path(root if root is not None else CASES_DIR) / version / format_
 
 
-def get_cases(format_: str, version: str) -> Iterable[str]:
+def get_cases(
+    format_: str,
+    version: str,
+    tags: Iterable[str] = None,
+    root: Path | str = None,
+) -> list[str]:
     """Get the list of test case IDs for the given PEtab version and model
-    format."""
+    format.
+
+    The test cases are taken from the catalog (see
+    :mod:`petabtests.catalog`). Only if there is no catalog, the cases
+    directory is scanned.
+
+    Parameters
+    ----------
+    format_: Model format (SBML/PySB)
+    version: PEtab version
+    tags: Only include test cases that have all of these feature tags.
+    root: Root directory of the generated test suite to take the catalog
+        from (see :func:`get_case_dir`).
+    """
+    catalog = read_catalog(format_=format_, version=version, root=root)
+    if catalog is None:
+        if tags:
+            raise ValueError(
+                f"Selecting test cases by tags requires a catalog, but there "
+                f"is no catalog for {version}/{format_}. Run "
+                "`petabtests_create` first."
+            )
+        return _scan_cases(format_=format_, version=version)
+
+    tags = set(tags or ())
+    return sorted(
+        case_id
+        for case_id, entry in catalog.items()
+        if tags.issubset(entry["tags"])
+    )
+
+
+def _scan_cases(format_: str, version: str) -> list[str]:
+    """Get the list of test case IDs for the given PEtab version and model
+    format from the cases directory."""
     cases_dir = get_cases_dir(format_=format_, version=version)
     if not cases_dir.exists():
         return []
@@ -41,77 +127,748 @@ def get_cases(format_: str, version: str) -> Iterable[str]:
     )
 
 
-def create_all():
-    """Create all test files."""
+def parse_case_ids(spec: str) -> list[str]:
+    """Parse a comma-separated list of test case IDs and ID ranges.
+
+    >>> parse_case_ids("0001,0010-0012")
+    ['0001', '0010', '0011', '0012']
+
+    Parameters
+    ----------
+    spec: Test case IDs (``0001``) or inclusive ranges of test case IDs
+        (``0010-0015``), separated by commas.
+
+    Returns
+    -------
+    The sorted test case IDs.
+    """
+    case_ids = set()
+    for item in spec.split(","):
+        if not (item := item.strip()):
+            continue
+        if not (match := re.fullmatch(r"(\d+)(?:\s*-\s*(\d+))?", item)):
+            raise ValueError(f"Invalid test case ID or range: {item!r}")
+        start = int(match.group(1))
+        stop = int(match.group(2) or start)
+        if stop < start:
+            raise ValueError(f"Invalid test case range: {item!r}")
+        case_ids.update(map(test_id_str, range(start, stop + 1)))
+    return sorted(case_ids)
+
+
+def _select_cases(
+    versions: Iterable[str] = None,
+    formats: Iterable[str] = None,
+    cases: Iterable[str] = None,
+    tags: Iterable[str] = None,
+    root: Path | str = None,
+) -> dict[tuple[str, str], list[str]]:
+    """Select test cases.
+
+    Parameters
+    ----------
+    versions: Only include these PEtab versions. Default: all.
+    formats: Only include these model formats. Default: all.
+    cases: Only include these test case IDs. Default: all.
+    tags: Only include test cases that have all of these feature tags
+        (see :func:`get_cases`).
+    root: Root directory of the generated test suite for selecting by
+        `tags`. If there is no catalog below `root` yet, the catalog of
+        :data:`CASES_DIR` is used.
+
+    Returns
+    -------
+    The selected test case IDs for each existing (format, version)
+    combination.
+    """
+    versions = test_versions if versions is None else set(versions)
+    formats = test_formats if formats is None else set(formats)
+    if cases is not None:
+        cases = {test_id_str(case_id) for case_id in cases}
+
+    selected = {}
     for version, format_ in itertools.product(test_versions, test_formats):
-        case_list = get_cases(format_=format_, version=version)
+        if version not in versions or format_ not in formats:
+            continue
+        if not get_cases_dir(format_=format_, version=version).exists():
+            continue
+        if not tags:
+            case_ids = _scan_cases(format_=format_, version=version)
+        else:
+            catalog_root = (
+                root
+                if read_catalog(format_=format_, version=version, root=root)
+                is not None
+                else None
+            )
+            case_ids = get_cases(
+                format_=format_, version=version, tags=tags, root=catalog_root
+            )
+        selected[format_, version] = [
+            case_id
+            for case_id in case_ids
+            if cases is None or case_id in cases
+        ]
+    return selected
+
+
+def create_all(
+    jobs: int | None = 1,
+    force: bool = False,
+    check: bool = False,
+    versions: Iterable[str] = None,
+    formats: Iterable[str] = None,
+    cases: Iterable[str] = None,
+    tags: Iterable[str] = None,
+    profile: Path | str = None,
+    profile_top: int = 0,
+    output_root: Path | str = None,
+) -> list[FileDifference]:
+    """Create all test files.
+
+    Test cases whose inputs did not change since they were last generated
+    are skipped (see :mod:`petabtests.manifest`). Besides the test case
+    files, this writes a table of contents (``README.md``), a catalog
+    (see :mod:`petabtests.catalog`) and a solution bundle (see
+    :mod:`petabtests.bundle`) for each PEtab version and model format.
+
+    Once all test cases are written, their PEtab problems are validated in a
+    separate stage. Cached validation results are reused (see
+    :mod:`petabtests.lint`).
+
+    The test cases can be restricted via `versions`, `formats`, `cases` and
+    `tags`. The table of contents, the catalog and the solution bundle of
+    each selected PEtab version and model format still cover all of its
+    test cases; unselected test cases are taken from the existing catalog,
+    or, for an `output_root`, from the catalog and solution files of
+    :data:`CASES_DIR`. Only test cases missing from both are created in
+    addition to the selection.
+
+    Parameters
+    ----------
+    jobs: Number of worker processes to create the test cases in parallel.
+        ``1`` creates all cases sequentially in the current process,
+        ``0`` or ``None`` uses one worker per CPU.
+    force: Regenerate all test cases, even if they are up to date.
+    check: Only check whether the test files are up to date. All files are
+        generated in memory and compared to the files on disk. Nothing is
+        written. Implies `force`.
+    versions: Only create test cases for these PEtab versions.
+        Default: all.
+    formats: Only create test cases for these model formats. Default: all.
+    cases: Only create the test cases with these IDs (see
+        :func:`parse_case_ids`). Default: all.
+    tags: Only create test cases that have all of these feature tags (see
+        :mod:`petabtests.catalog`).
+    profile: Directory to write a report of the time spent in the different
+        phases of generating each test case to, and print a summary (see
+        :mod:`petabtests.profiling`). Only the selected test cases that are
+        generated are profiled, skipped test cases are not; combine with
+        `force` to profile all selected test cases.
+    profile_top: Number of slowest test cases to write :mod:`cProfile`
+        statistics for. Requires `profile`. The test cases are ranked by
+        their timings without :mod:`cProfile`, whose overhead would distort
+        them. The slowest test cases are then generated again under
+        :mod:`cProfile`, without writing any files.
+    output_root: Root directory to generate the test suite in (see
+        :func:`get_case_dir`), e.g., a scratch directory. The test case
+        definitions are always taken from :data:`CASES_DIR`. Defaults to
+        :data:`CASES_DIR`.
+
+    Returns
+    -------
+    Files on disk that do not match the generated content. Only populated if
+    `check` is set.
+    """
+    jobs = jobs or None
+    selected = _select_cases(
+        versions=versions,
+        formats=formats,
+        cases=cases,
+        tags=tags,
+        root=output_root,
+    )
+    catalogs = {
+        (format_, version): read_catalog(
+            format_=format_, version=version, root=output_root
+        )
+        or {}
+        for format_, version in selected
+    }
+    if output_root is not None:
+        # unselected cases that were not generated below the output root yet
+        #  are taken from the in-tree catalog
+        for (format_, version), catalog in catalogs.items():
+            catalogs[format_, version] = {
+                **(read_catalog(format_=format_, version=version) or {}),
+                **catalog,
+            }
+    all_cases = {
+        (format_, version): _scan_cases(format_=format_, version=version)
+        for format_, version in selected
+    }
+    # cases missing from the catalog need to be loaded in any case
+    cases = [
+        (format_, version, case_id)
+        for (format_, version), case_list in all_cases.items()
+        for case_id in case_list
+        if case_id in selected[format_, version]
+        or case_id not in catalogs[format_, version]
+    ]
+    tasks = []
+    for format_, version, case_id in cases:
+        # only selected cases are profiled, and only if they are generated
+        profiled = (
+            profile is not None and case_id in selected[format_, version]
+        )
+        tasks.append(
+            (
+                format_,
+                version,
+                case_id,
+                force or check or case_id not in catalogs[format_, version],
+                check,
+                profiled,
+                output_root,
+            )
+        )
+
+    results = dict(zip(cases, _run_tasks(_create_case_task, tasks, jobs)))
+    created_entries = {
+        case: entry for case, (entry, _, _, _) in results.items()
+    }
+    differences = [
+        difference
+        for _, case_differences, _, _ in results.values()
+        for difference in case_differences
+    ]
+
+    case_profiles = {
+        case: case_profile
+        for case, (_, _, case_profile, _) in results.items()
+        if case_profile is not None
+    }
+    _lint_cases(
+        {
+            case: lint
+            for case, (_, _, _, lint) in results.items()
+            if lint is not None
+        },
+        jobs=jobs,
+        root=output_root,
+        profiles=case_profiles,
+    )
+
+    if profile is not None:
+        profiles = list(case_profiles.values())
+        slowest = sorted(profiles, key=lambda p: p.total.wall, reverse=True)[
+            :profile_top
+        ]
+        stats = _run_tasks(
+            _cprofile_case_task,
+            [(p.format, p.version, p.id, output_root) for p in slowest],
+            jobs,
+        )
+        for case_profile, case_stats in zip(slowest, stats, strict=True):
+            case_profile.stats = case_stats
+        write_profile_report(profiles, output_dir=profile, top=profile_top)
+        print(format_profile_summary(profiles))
+
+    output = (
+        FileChecker(root=output_root)
+        if check
+        else FileWriter(root=output_root)
+    )
+    for (format_, version), case_list in all_cases.items():
         if not case_list:
             continue
 
+        # unselected and skipped cases are taken from the existing catalog
+        entries = [
+            created_entries.get((format_, version, case_id))
+            or catalogs[format_, version][case_id]
+            for case_id in case_list
+        ]
+
         # Table of contents markdown string for the current format x version
         #  directory README
         toc = ""
+        for entry in entries:
+            id_str = entry["id"]
+            toc += f"# [{id_str}]({id_str}/)\n\n{entry['brief']}\n\n"
 
-        for case_id in case_list:
-            case_dir = get_case_dir(
-                format_=format_, version=version, id_=case_id
-            )
-            logger.info(
-                f"Processing {version}/{format_} #{case_id} at {case_dir}"
-            )
+        cases_dir = get_cases_dir(
+            format_=format_, version=version, root=output_root
+        )
+        output.write(cases_dir / "README.md", toc)
+        output.write(cases_dir / CATALOG_FILE, render_catalog(entries))
+        output.write(
+            cases_dir / SOLUTION_BUNDLE_FILE,
+            render_solution_bundle(
+                case_list,
+                format_=format_,
+                version=version,
+                root=output_root,
+                fallback_root=CASES_DIR if output_root is not None else None,
+            ),
+        )
 
-            if version == "v1.0.0":
-                case = PetabV1TestCase.load(case_dir, case_id)
-            elif version == "v2.0.0":
-                case = PetabV2TestCase.load(case_dir, case_id)
-            else:
-                raise NotImplementedError(f"Unknown PEtab version {version}")
+    if check:
+        differences.extend(output.differences)
+    return differences
 
-            id_str = test_id_str(case.id)
-            toc += f"# [{id_str}]({id_str}/)\n\n{case.brief}\n\n"
 
-            create_case(format_, version, case_id)
+def create_case(
+    format_: str,
+    version: str,
+    id_: str,
+    output: FileWriter = None,
+    output_root: Path | str = None,
+    lint: bool = True,
+) -> PetabV1TestCase | PetabV2TestCase:
+    """Create a single test case.
 
-        toc_path = (
-            get_cases_dir(format_=format_, version=version) / "README.md"
-        )
-        with open(toc_path, "w") as f:
-            f.write(toc)
+    Writing the test case removes the solution bundle of the PEtab version
+    and model format, which :func:`create_all` recreates.
+
+    Once written, the PEtab problem is validated in memory as in
+    :func:`create_all`, unless `lint` is unset or `output` does not write
+    to disk.
 
+    Parameters
+    ----------
+    format_: Model format (SBML/PySB)
+    version: PEtab version
+    id_: Test case ID
+    output: Destination of the generated files. Defaults to writing them
+        to the test case directory under `output_root`.
+    output_root: Root directory to generate the test case in, if `output`
+        is not given (see :func:`get_case_dir`). Defaults to
+        :data:`CASES_DIR`.
+    lint: Whether to validate the written PEtab problem. Cached validation
+        results are reused (see :mod:`petabtests.lint`).
 
-def create_case(format_: str, version: str, id_: str) -> None:
-    """Create a single test case."""
+    Returns
+    -------
+    The test case that was written.
+
+    Raises
+    ------
+    RuntimeError: If the PEtab v1 problem is invalid. Invalid PEtab v2
+        problems are only logged.
+    """
+    output = output or FileWriter(root=output_root)
     case_dir = get_case_dir(format_=format_, version=version, id_=id_)
+    output_dir = get_case_dir(
+        format_=format_, version=version, id_=id_, root=output.root
+    )
+    logger.info(f"Processing {version}/{format_} #{id_} at {output_dir}")
 
-    if version == "v1.0.0":
-        case = PetabV1TestCase.load(case_dir, id_)
-    elif version == "v2.0.0":
-        case = PetabV2TestCase.load(case_dir, id_)
-    else:
-        raise NotImplementedError(f"Unknown PEtab version {version}")
+    with phase("load"):
+        if version == "v1.0.0":
+            case = PetabV1TestCase.load(case_dir, id_)
+        elif version == "v2.0.0":
+            case = PetabV2TestCase.load(case_dir, id_)
+        else:
+            raise NotImplementedError(f"Unknown PEtab version {version}")
 
-    write_info(case, format_, version=version)
+    write_info(case, format_, version=version, output=output)
 
     case.write(
         format_=format_,
         version=version,
+        output=output,
     )
 
+    if output.persistent:
+        with phase("manifest"):
+            write_manifest(case_dir, output_dir)
+        # solutions are served from the bundle without checking the solution
+        #  files, so a bundle that may be stale is removed. It is recreated by
+        #  create_all.
+        (
+            get_cases_dir(format_=format_, version=version, root=output.root)
+            / SOLUTION_BUNDLE_FILE
+        ).unlink(missing_ok=True)
+        if lint:
+            _lint_cases(
+                {
+                    (format_, version, id_): _prepare_lint(
+                        case, format_, version, id_, root=output.root
+                    )
+                },
+                root=output.root,
+            )
 
-def clear() -> None:
-    """Clear all model folders."""
-    for version, format_ in itertools.product(test_versions, test_formats):
-        case_list = get_cases(format_=format_, version=version)
+    return case
 
+
+def _create_case_task(
+    format_: str,
+    version: str,
+    id_: str,
+    force: bool = False,
+    check: bool = False,
+    profile: bool = False,
+    output_root: Path | str = None,
+) -> tuple[
+    dict | None,
+    list[FileDifference],
+    CaseProfile | None,
+    LintResult | v1.Problem | v2.Problem | None,
+]:
+    """Create or check a single test case, unless it is up to date.
+
+    Any error is re-raised with the case identifier attached, so that failures
+    in worker processes can be traced back to the offending case.
+
+    Returns
+    -------
+    The catalog entry of the test case, or ``None`` if it was skipped,
+    the mismatching files in case of `check`, the timings of the
+    generation phases in case of `profile` (see :mod:`petabtests.profiling`),
+    and what is needed to validate the written test case (see
+    :func:`_prepare_lint`), or ``None`` if nothing was written.
+    """
+    try:
+        if not force:
+            case_dir = get_case_dir(format_=format_, version=version, id_=id_)
+            output_dir = get_case_dir(
+                format_=format_, version=version, id_=id_, root=output_root
+            )
+            if is_up_to_date(case_dir, read_manifest(output_dir), output_dir):
+                logger.info(f"Skipping up-to-date {version}/{format_} #{id_}")
+                return None, [], None, None
+
+        output = (
+            FileChecker(root=output_root)
+            if check
+            else FileWriter(root=output_root)
+        )
+        with (
+            profile_case(version, format_, id_) if profile else nullcontext()
+        ) as case_profile:
+            # create_all validates all created test cases at once
+            case = create_case(
+                format_=format_,
+                version=version,
+                id_=id_,
+                output=output,
+                lint=False,
+            )
+            lint = (
+                _prepare_lint(case, format_, version, id_, root=output_root)
+                if output.persistent
+                else None
+            )
+        entry = create_catalog_entry(
+            case,
+            format_=format_,
+            version=version,
+            files={path.name for path in output.paths},
+        )
+        return (
+            entry,
+            output.differences if check else [],
+            case_profile,
+            lint,
+        )
+    except Exception as e:
+        raise RuntimeError(
+            f"Failed to create test case {version}/{format_} #{id_}: {e}"
+        ) from e
+
+
+def _cprofile_case_task(
+    format_: str, version: str, id_: str, output_root: Path | str = None
+) -> dict:
+    """Generate a single test case under :mod:`cProfile`, without writing
+    any files.
+
+    Returns
+    -------
+    The :mod:`cProfile` statistics (see :attr:`CaseProfile.stats`).
+    """
+    try:
+        with profile_case(
+            version, format_, id_, cprofile=True
+        ) as case_profile:
+            create_case(
+                format_=format_,
+                version=version,
+                id_=id_,
+                output=FileChecker(root=output_root),
+            )
+    except Exception as e:
+        raise RuntimeError(
+            f"Failed to profile test case {version}/{format_} #{id_}: {e}"
+        ) from e
+    return case_profile.stats
+
+
+def _prepare_lint(
+    case: PetabV1TestCase | PetabV2TestCase,
+    format_: str,
+    version: str,
+    id_: str,
+    root: Path | str = None,
+) -> LintResult | v1.Problem | v2.Problem:
+    """Get the cached validation result of a written test case, or else its
+    PEtab problem, built in memory, for :func:`_lint_cases` to validate."""
+    yaml_path = get_case_dir(
+        format_=format_, version=version, id_=id_, root=root
+    ) / problem_yaml_name(id_)
+    with phase("lint"):
+        result = get_cached_lint_result(yaml_path, version)
+    if result is not None:
+        return result
+    with phase("problem"):
+        return case.to_problem(format_=format_)
+
+
+def _lint_cases(
+    cases: dict[tuple[str, str, str], LintResult | v1.Problem | v2.Problem],
+    jobs: int | None = 1,
+    root: Path | str = None,
+    profiles: dict[tuple[str, str, str], CaseProfile] = None,
+) -> None:
+    """Validate the PEtab problems of the given written test cases.
+
+    The problems are validated in memory, in parallel for ``jobs != 1``.
+    Cached validation results are reused (see :mod:`petabtests.lint`).
+
+    Parameters
+    ----------
+    cases: For the ``(format, version, id)`` of each test case to validate,
+        its cached validation result or its PEtab problem (see
+        :func:`_prepare_lint`).
+    jobs: Number of worker processes (see :func:`create_all`).
+    root: Root directory of the generated test suite (see
+        :func:`get_case_dir`).
+    profiles: The generation profiles of the test cases (see
+        :mod:`petabtests.profiling`), if profiled. The time spent validating
+        is added to them as ``lint`` phase.
+
+    Raises
+    ------
+    RuntimeError: If any PEtab v1 problem is invalid. Invalid PEtab v2
+        problems are only logged.
+    """
+    profiles = profiles or {}
+    results: dict[tuple[str, str, str], LintResult] = {
+        case: result
+        for case, result in cases.items()
+        if isinstance(result, LintResult)
+    }
+    todo = [case for case in cases if case not in results]
+    logger.info(
+        f"Validating {len(todo)} test case(s), "
+        f"{len(results)} cached validation result(s)"
+    )
+    tasks = [(*case, cases[case], root, case in profiles) for case in todo]
+    for case, (result, lint_profile) in zip(
+        todo, _run_tasks(_lint_case_task, tasks, jobs), strict=True
+    ):
+        results[case] = result
+        if lint_profile is not None:
+            profiles[case].add(lint_profile)
+
+    invalid = []
+    for (format_, version, id_), result in results.items():
+        if result.valid:
+            continue
+        logger.critical(
+            f"Invalid PEtab problem generated for {version}/{format_} #{id_}."
+        )
+        for message in result.messages:
+            logger.error(message)
+        # make sure the case is regenerated and validated again next time
+        output_dir = get_case_dir(
+            format_=format_, version=version, id_=id_, root=root
+        )
+        (output_dir / MANIFEST_FILE).unlink(missing_ok=True)
+        if version == "v1.0.0":
+            invalid.append(f"{version}/{format_} #{id_}")
+    if invalid:
+        raise RuntimeError(
+            f"Invalid PEtab problems: {', '.join(invalid)}. "
+            "See messages above."
+        )
+
+
+def _lint_case_task(
+    format_: str,
+    version: str,
+    id_: str,
+    problem: v1.Problem | v2.Problem,
+    root: Path | str = None,
+    profile: bool = False,
+) -> tuple[LintResult, CaseProfile | None]:
+    """Validate the PEtab problem of a single written test case, and cache
+    the result.
+
+    Returns
+    -------
+    The validation result, and the timings of the validation in case of
+    `profile` (see :mod:`petabtests.profiling`).
+    """
+    yaml_path = get_case_dir(
+        format_=format_, version=version, id_=id_, root=root
+    ) / problem_yaml_name(id_)
+    try:
+        with (
+            profile_case(version, format_, id_) if profile else nullcontext()
+        ) as lint_profile:
+            with phase("lint"):
+                result = lint_problem(problem, version, yaml_path=yaml_path)
+        return result, lint_profile
+    except Exception as e:
+        raise RuntimeError(
+            f"Failed to validate test case {version}/{format_} #{id_}: {e}"
+        ) from e
+
+
+def _run_tasks(
+    func: Callable, tasks: list[tuple], jobs: int | None = 1
+) -> list:
+    """Apply `func` to each argument tuple in `tasks`.
+
+    Results are returned in the order of `tasks`. For ``jobs != 1``, the
+    tasks are distributed across a pool of worker processes. The first
+    failing task (in task order) aborts all pending tasks.
+    """
+    if jobs == 1 or len(tasks) <= 1:
+        return [func(*task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(func, *task) for task in tasks]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def clear(
+    versions: Iterable[str] = None,
+    formats: Iterable[str] = None,
+    cases: Iterable[str] = None,
+    tags: Iterable[str] = None,
+    output_root: Path | str = None,
+) -> None:
+    """Remove the generated files of test cases.
+
+    The solution bundle of each PEtab version and model format with cleared
+    test cases is removed as well.
+
+    Parameters
+    ----------
+    versions: Only clear test cases for these PEtab versions. Default: all.
+    formats: Only clear test cases for these model formats. Default: all.
+    cases: Only clear the test cases with these IDs. Default: all.
+    tags: Only clear test cases that have all of these feature tags.
+    output_root: Root directory of the generated test suite (see
+        :func:`create_all`).
+    """
+    selected = _select_cases(
+        versions=versions,
+        formats=formats,
+        cases=cases,
+        tags=tags,
+        root=output_root,
+    )
+    for (format_, version), case_list in selected.items():
         for case_id in case_list:
             case_dir = get_case_dir(
-                format_=format_, version=version, id_=case_id
+                format_=format_, version=version, id_=case_id, root=output_root
             )
+            if not case_dir.is_dir():
+                continue
 
+            # this includes the manifest
             for file_ in os.scandir(case_dir):
                 if file_.name.startswith("_") and not file_.is_dir():
                     os.remove(file_.path)
 
+        if case_list:
+            # the solution bundle is recreated by create_all
+            (
+                get_cases_dir(
+                    format_=format_, version=version, root=output_root
+                )
+                / SOLUTION_BUNDLE_FILE
+            ).unlink(missing_ok=True)
+
+
+def _add_selection_arguments(parser) -> None:
+    """Add the test case selection arguments to an argument parser."""
+    parser.add_argument(
+        "--version",
+        dest="versions",
+        action="append",
+        choices=test_versions,
+        help="Only include this PEtab version. Can be repeated.",
+    )
+    parser.add_argument(
+        "--format",
+        dest="formats",
+        action="append",
+        choices=test_formats,
+        help="Only include this model format. Can be repeated.",
+    )
+    parser.add_argument(
+        "--cases",
+        type=parse_case_ids,
+        help="Only include these test cases, e.g. `0001,0010-0015`.",
+    )
+    parser.add_argument(
+        "--tag",
+        dest="tags",
+        action="append",
+        choices=sorted(
+            (
+                TAG_MAPPING_TABLE,
+                TAG_MULTIPLE_EXPERIMENTS,
+                TAG_PREEQUILIBRATION,
+                TAG_PRIORS,
+            )
+        ),
+        help="Only include test cases with this feature. Can be repeated "
+        "to require multiple features.",
+    )
+
+
+def _add_output_root_argument(parser) -> None:
+    """Add the output root argument to an argument parser."""
+    parser.add_argument(
+        "--output-root",
+        metavar="DIR",
+        type=Path,
+        help="Root directory of the generated test suite, if not the test "
+        "case definitions directory.",
+    )
+
+
+def _cli_clear():
+    """`petabtests_clear` entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Remove generated PEtab test case files."
+    )
+    _add_selection_arguments(parser)
+    _add_output_root_argument(parser)
+    args = parser.parse_args()
+
+    clear(
+        versions=args.versions,
+        formats=args.formats,
+        cases=args.cases,
+        tags=args.tags,
+        output_root=args.output_root,
+    )
+
 
 def _cli_create():
     """`petabtests_create` entry point."""
@@ -121,9 +878,63 @@ def _cli_create():
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Verbose output."
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of parallel worker processes (0: one per CPU).",
+    )
+    parser.add_argument(
+        "--force",
+        "-f",
+        action="store_true",
+        help="Regenerate all test cases, even if they are up to date.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check whether all generated files are up to date, "
+        "without writing anything. Exits with a non-zero status and reports "
+        "the differences if not.",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        type=Path,
+        help="Record the time spent in the different generation phases of "
+        "each created test case, write a report (profile.json, profile.csv) "
+        "to DIR, and print a summary.",
+    )
+    parser.add_argument(
+        "--profile-top",
+        metavar="N",
+        type=int,
+        default=0,
+        help="With --profile, also write cProfile statistics for the N "
+        "slowest test cases to DIR.",
+    )
+    _add_selection_arguments(parser)
+    _add_output_root_argument(parser)
     args = parser.parse_args()
 
     if args.verbose:
         logging.basicConfig(level=logging.INFO)
 
-    create_all()
+    differences = create_all(
+        jobs=args.jobs,
+        force=args.force,
+        check=args.check,
+        versions=args.versions,
+        formats=args.formats,
+        cases=args.cases,
+        tags=args.tags,
+        profile=args.profile,
+        profile_top=args.profile_top,
+        output_root=args.output_root,
+    )
+    if differences:
+        for difference in differences:
+            print(difference)
+        print(f"{len(differences)} generated file(s) are not up to date.")
+        sys.exit(1)
@@ -1,15 +1,50 @@
+import struct
+import zipfile
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 
+from .C import (
+    CHI2,
+    LLH,
+    LOG_PRIOR,
+    SIMULATION_DFS,
+    TOL_CHI2,
+    TOL_LLH,
+    TOL_LOG_PRIOR,
+    TOL_SIMULATIONS,
+    TOL_UNNORM_LOG_POSTERIOR,
+    UNNORM_LOG_POSTERIOR,
+)
+from .file import load_solution, test_id_str
+
 __all__ = [
     "evaluate_llh",
     "evaluate_chi2",
+    "evaluate_log_prior",
+    "evaluate_unnorm_log_posterior",
     "evaluate_simulations",
+    "evaluate_simulation_files",
+    "evaluate_suite",
     "absolute_simulations_distance_for_tables",
     "absolute_simulations_distance_for_array",
+    "absolute_simulations_distance_for_chunks",
+    "absolute_simulations_distance_for_file",
     "absolute_simulations_distance_for_table",
+    "read_simulation_file",
+    "SimulationDiagnostics",
+    "simulation_diagnostics_for_chunks",
+    "simulation_diagnostics_for_table",
 ]
 
+#: Default number of rows per chunk for reading simulation tables
+DEFAULT_CHUNKSIZE = 100_000
+
 
 def evaluate_chi2(chi2: float, gt_chi2: float, tol: float = 1e-3):
     """Evaluate whether chi square values match."""
@@ -25,6 +60,171 @@ def evaluate_llh(llh: float, gt_llh: float, tol: float = 1e-3):
     return abs(llh - gt_llh) < tol
 
 
+def evaluate_log_prior(
+    log_prior: Mapping[str, float]
+    | Iterable[Mapping[str, float]]
+    | pd.DataFrame
+    | np.ndarray
+    | None,
+    gt_log_prior: Mapping[str, float],
+    tol: float = 1e-14,
+    parameter_ids: Iterable[str] = None,
+    return_distance: bool = False,
+):
+    """Evaluate whether log-prior values match.
+
+    Values are compared per parameter, after aligning them with the ground
+    truth by parameter ID. They match if all parameters of the ground truth,
+    and no others, are present and each value is within the tolerance.
+
+    Parameters
+    ----------
+    log_prior: The log-prior value of each parameter, as a mapping from
+        parameter ID to value, or an array ordered as ``parameter_ids``.
+        A batch of results, e.g. for multiple posterior samples, can be
+        passed as a mapping from parameter ID to an array of values, a
+        sequence of mappings, a data frame with one column per parameter ID
+        and one row per result, or a 2D array with one row per result.
+        ``None`` values count as missing.
+    gt_log_prior: The ground truth log-prior value of each parameter.
+    tol: Tolerance for the absolute difference of each value.
+    parameter_ids: The parameter IDs of the columns of an array
+        ``log_prior``.
+    return_distance: Whether to also return the distance, i.e. the maximum
+        absolute difference over all parameters, or NaN if the parameters do
+        not match.
+
+    Returns
+    -------
+    Whether the values match, as a boolean array for a batch, and the
+    distance, if ``return_distance`` is set.
+    """
+    distance, batch = _log_prior_distance(
+        log_prior, gt_log_prior, parameter_ids
+    )
+    return _evaluate_distance(distance, tol, batch, return_distance)
+
+
+def evaluate_unnorm_log_posterior(
+    unnorm_log_posterior: float | Iterable[float] | None,
+    gt_unnorm_log_posterior: float,
+    tol: float = 1e-3,
+    return_distance: bool = False,
+):
+    """Evaluate whether unnormalized log-posterior values match.
+
+    Parameters
+    ----------
+    unnorm_log_posterior: The unnormalized log-posterior value, or an array
+        of values for a batch of results. ``None`` or NaN values fail.
+    gt_unnorm_log_posterior: The ground truth unnormalized log-posterior.
+    tol: Tolerance for the absolute difference.
+    return_distance: Whether to also return the absolute difference.
+
+    Returns
+    -------
+    Whether the values match, as a boolean array for a batch, and the
+    absolute difference, if ``return_distance`` is set.
+    """
+    distance, batch = _unnorm_log_posterior_distance(
+        unnorm_log_posterior, gt_unnorm_log_posterior
+    )
+    return _evaluate_distance(distance, tol, batch, return_distance)
+
+
+def _evaluate_distance(
+    distance: np.ndarray, tol: float, batch: bool, return_distance: bool
+):
+    """Compare distances to the tolerance, unwrapping single results."""
+    # NaN distances fail
+    passed = distance < tol
+    if not batch:
+        passed, distance = bool(passed), float(distance)
+    return (passed, distance) if return_distance else passed
+
+
+def _unnorm_log_posterior_distance(
+    unnorm_log_posterior: float | Iterable[float] | None,
+    gt_unnorm_log_posterior: float,
+) -> tuple[np.ndarray, bool]:
+    """Compute the absolute difference of unnormalized log-posterior values.
+
+    Returns
+    -------
+    The distances, and whether ``unnorm_log_posterior`` is a batch.
+    """
+    if unnorm_log_posterior is None:
+        unnorm_log_posterior = np.nan
+    values = np.asarray(unnorm_log_posterior, dtype=float)
+    return np.abs(values - gt_unnorm_log_posterior), values.ndim > 0
+
+
+def _log_prior_distance(
+    log_prior: Mapping[str, float]
+    | Iterable[Mapping[str, float]]
+    | pd.DataFrame
+    | np.ndarray
+    | None,
+    gt_log_prior: Mapping[str, float],
+    parameter_ids: Iterable[str] = None,
+) -> tuple[np.ndarray, bool]:
+    """Compute the maximum absolute difference of log-prior values per result.
+
+    See :func:`evaluate_log_prior`.
+
+    Returns
+    -------
+    The distances, and whether ``log_prior`` is a batch.
+    """
+    if log_prior is None:
+        return np.array(np.nan), False
+
+    if isinstance(log_prior, pd.DataFrame):
+        batch = True
+        df = log_prior
+    elif isinstance(log_prior, Mapping):
+        batch = any(np.ndim(value) for value in log_prior.values())
+        # scalar values are broadcast over the batch
+        df = pd.DataFrame(
+            {
+                parameter_id: np.asarray(value, dtype=float)
+                if np.ndim(value)
+                else np.nan
+                if value is None
+                else float(value)
+                for parameter_id, value in log_prior.items()
+            },
+            index=None if batch else [0],
+        )
+    elif isinstance(log_prior, np.ndarray) and parameter_ids is None:
+        raise ValueError(
+            "`parameter_ids` must be given for an array of log-prior values."
+        )
+    elif parameter_ids is not None:
+        values = np.asarray(log_prior, dtype=float)
+        batch = values.ndim > 1
+        df = pd.DataFrame(np.atleast_2d(values), columns=list(parameter_ids))
+    else:
+        batch = True
+        df = pd.DataFrame.from_records(list(log_prior))
+
+    if df.columns.has_duplicates:
+        raise ValueError("Duplicate parameter IDs in log-prior values.")
+    gt_ids = pd.Index(list(gt_log_prior), dtype=object)
+    gt_values = np.fromiter(gt_log_prior.values(), dtype=float)
+    values = df.to_numpy(dtype=float)
+    positions = gt_ids.get_indexer(df.columns.astype(object))
+
+    # missing parameters fail, also within a sequence of mappings
+    aligned = np.full((len(df), len(gt_ids)), np.nan)
+    aligned[:, positions[positions != -1]] = values[:, positions != -1]
+    distance = np.max(np.abs(aligned - gt_values), axis=1, initial=0.0)
+    # parameters without ground truth fail, unless they are absent for a
+    #  result of a sequence of mappings
+    distance[~np.isnan(values[:, positions == -1]).all(axis=1)] = np.nan
+    return (distance if batch else distance[0]), batch
+
+
 def evaluate_simulations(
     simulation_dfs: list[pd.DataFrame] | pd.DataFrame,
     gt_simulation_dfs: list[pd.DataFrame] | pd.DataFrame,
@@ -39,6 +239,194 @@ def evaluate_simulations(
     )
 
 
+#: Name of the simulation metric in :func:`evaluate_suite`
+SIMULATIONS = "simulations"
+
+
+def evaluate_suite(
+    results: Mapping[str | int, Mapping],
+    version: str,
+    format_: str,
+    jobs: int | None = None,
+    root: Path | str = None,
+) -> pd.DataFrame:
+    """Evaluate the results of a tool for multiple test cases.
+
+    Parameters
+    ----------
+    results: The results of the tool under review by test case ID. Each
+        result is a mapping with the simulation tables (``simulation_dfs``),
+        the chi2 (``chi2``) and log-likelihood (``llh``) values, and the
+        per-parameter log-prior (``log_prior``) and unnormalized
+        log-posterior (``unnorm_log_posterior``) values, as in
+        the solution (see :func:`petabtests.file.load_solution`). Missing or
+        ``None`` entries fail the respective metric.
+    version: PEtab version of the test cases.
+    format_: Model format of the test cases.
+    jobs: Number of threads to load the solutions with. ``None`` uses the
+        default of :class:`concurrent.futures.ThreadPoolExecutor`.
+    root: Root directory of the generated test suite (see
+        :func:`petabtests.file.get_case_dir`).
+
+    Returns
+    -------
+    One row per test case and metric (``simulations``, ``chi2``, ``llh``,
+    and ``log_prior`` and ``unnorm_log_posterior`` for test cases with
+    priors), with the columns ``case``, ``metric``, ``value`` and
+    ``expected`` (for scalar metrics, otherwise NaN), the absolute
+    ``distance`` (see :func:`absolute_simulations_distance_for_tables` for
+    simulations and :func:`evaluate_log_prior` for log-priors; NaN if the
+    result is missing or the simulation tables or parameters do not match),
+    the ``tolerance``, and whether the metric ``passed``.
+
+    Raises
+    ------
+    ValueError: If a result contains a batch of log-prior or unnormalized
+        log-posterior values (see :func:`evaluate_log_prior`). Batches are
+        evaluated via :func:`evaluate_log_prior` and
+        :func:`evaluate_unnorm_log_posterior`.
+    """
+    case_ids = [test_id_str(case_id) for case_id in results]
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        solutions = list(
+            executor.map(
+                lambda case_id: load_solution(
+                    case_id, format_, version=version, root=root
+                ),
+                case_ids,
+            )
+        )
+
+    # simulations need to be matched case by case
+    simulation_distances = np.array(
+        [
+            _simulations_distance(
+                result.get(SIMULATION_DFS), solution[SIMULATION_DFS]
+            )
+            for result, solution in zip(
+                results.values(), solutions, strict=True
+            )
+        ],
+        dtype=float,
+    )
+    frames = [
+        pd.DataFrame(
+            {
+                "case": case_ids,
+                "metric": SIMULATIONS,
+                "value": np.nan,
+                "expected": np.nan,
+                "distance": simulation_distances,
+                "tolerance": [
+                    solution[TOL_SIMULATIONS] for solution in solutions
+                ],
+            }
+        )
+    ]
+    for metric, tol in ((CHI2, TOL_CHI2), (LLH, TOL_LLH)):
+        values = np.array(
+            [
+                np.nan if (value := result.get(metric)) is None else value
+                for result in results.values()
+            ],
+            dtype=float,
+        )
+        expected = np.array(
+            [solution[metric] for solution in solutions], dtype=float
+        )
+        frames.append(
+            pd.DataFrame(
+                {
+                    "case": case_ids,
+                    "metric": metric,
+                    "value": values,
+                    "expected": expected,
+                    "distance": np.abs(values - expected),
+                    "tolerance": [solution[tol] for solution in solutions],
+                }
+            )
+        )
+
+    # only some cases have priors
+    for metric, tol, distance_func in (
+        (LOG_PRIOR, TOL_LOG_PRIOR, _log_prior_distance),
+        (
+            UNNORM_LOG_POSTERIOR,
+            TOL_UNNORM_LOG_POSTERIOR,
+            _unnorm_log_posterior_distance,
+        ),
+    ):
+        rows = [
+            (case_id, result.get(metric), solution)
+            for case_id, result, solution in zip(
+                case_ids, results.values(), solutions, strict=True
+            )
+            if metric in solution
+        ]
+        if not rows:
+            continue
+        scalar = metric == UNNORM_LOG_POSTERIOR
+        frames.append(
+            pd.DataFrame(
+                {
+                    "case": [case_id for case_id, _, _ in rows],
+                    "metric": metric,
+                    "value": [
+                        np.nan if not scalar or value is None else value
+                        for _, value, _ in rows
+                    ],
+                    "expected": [
+                        solution[metric] if scalar else np.nan
+                        for _, _, solution in rows
+                    ],
+                    "distance": [
+                        _scalar_distance(
+                            distance_func, value, solution[metric], metric, id_
+                        )
+                        for id_, value, solution in rows
+                    ],
+                    "tolerance": [solution[tol] for _, _, solution in rows],
+                }
+            )
+        )
+
+    evaluation = pd.concat(frames, ignore_index=True)
+    # NaN distances fail
+    evaluation["passed"] = evaluation["distance"] < evaluation["tolerance"]
+    return evaluation.sort_values("case", kind="stable", ignore_index=True)
+
+
+def _scalar_distance(
+    distance_func, value, gt_value, metric: str, case_id: str
+) -> float:
+    """Compute the distance of a single result via `distance_func`
+    (:func:`_log_prior_distance` or :func:`_unnorm_log_posterior_distance`),
+    rejecting batches."""
+    distance, batch = distance_func(value, gt_value)
+    if batch:
+        raise ValueError(
+            f"Expected a single {metric} result for test case {case_id}, "
+            "got a batch."
+        )
+    return float(distance)
+
+
+def _simulations_distance(
+    simulation_dfs: list[pd.DataFrame] | pd.DataFrame | None,
+    gt_simulation_dfs: list[pd.DataFrame],
+) -> float:
+    """Compute the simulation distance, or NaN if the simulation tables are
+    missing or do not match."""
+    if simulation_dfs is None:
+        return np.nan
+    try:
+        return absolute_simulations_distance_for_tables(
+            simulation_dfs, gt_simulation_dfs
+        )
+    except AssertionError:
+        return np.nan
+
+
 def absolute_simulations_distance_for_tables(
     simulation_dfs: list[pd.DataFrame] | pd.DataFrame,
     gt_simulation_dfs: list[pd.DataFrame] | pd.DataFrame,
@@ -76,13 +464,413 @@ def absolute_simulations_distance_for_tables(
 def absolute_simulations_distance_for_table(
     simulations: pd.DataFrame, gt_simulations: pd.DataFrame
 ):
-    """Compute absolute normalized distance between simulations."""
+    """Compute absolute normalized distance between simulations.
+
+    Rows are matched on observable, experiment (PEtab v2) or simulation and
+    preequilibration condition (PEtab v1), and time, where times are
+    matched up to floating point tolerance (see :func:`numpy.isclose`). Rows
+    with identical keys are matched in the order of their simulated values.
+    """
+    return absolute_simulations_distance_for_chunks(
+        [simulations], gt_simulations
+    )
+
+
+def absolute_simulations_distance_for_chunks(
+    chunks: Iterable[pd.DataFrame], gt_simulations: pd.DataFrame
+):
+    """Compute absolute normalized distance between simulations, where the
+    simulation table is provided in chunks of rows.
+
+    Apart from the ground truth, only a single chunk needs to be held in
+    memory at a time, and rows whose key occurs multiple times in the ground
+    truth. See :func:`absolute_simulations_distance_for_table`.
+
+    Parameters
+    ----------
+    chunks: Consecutive parts of the simulation table proposed by the tool
+        under review, e.g., from :func:`pandas.read_csv` with `chunksize`.
+    gt_simulations: Ground truth simulation table.
+
+    Returns
+    -------
+    distance: The normalized absolute distance.
+    """
+    return _match_chunks(chunks, gt_simulations, strict=True).distance()
+
+
+def absolute_simulations_distance_for_file(
+    simulation_file: Path | str,
+    gt_simulations: pd.DataFrame,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+):
+    """Compute absolute normalized distance between simulations, reading the
+    simulation table from a file in chunks.
+
+    See :func:`absolute_simulations_distance_for_chunks` and
+    :func:`read_simulation_file`.
+
+    Parameters
+    ----------
+    simulation_file: PEtab simulation table file proposed by the tool under
+        review.
+    gt_simulations: Ground truth simulation table.
+    chunksize: Number of rows to read at a time.
+
+    Returns
+    -------
+    distance: The normalized absolute distance.
+    """
+    with closing(read_simulation_file(simulation_file, chunksize)) as chunks:
+        return absolute_simulations_distance_for_chunks(chunks, gt_simulations)
+
+
+def evaluate_simulation_files(
+    test_id: int | str,
+    simulation_files: list[Path | str] | Path | str,
+    format_: str,
+    version: str,
+    tol: float = None,
+    root: Path | str = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+):
+    """Evaluate whether simulation table files written by a tool match the
+    solution of a test case.
+
+    The files are read in chunks (see :func:`read_simulation_file`).
+
+    Parameters
+    ----------
+    test_id: Test case ID
+    simulation_files: Simulation table files proposed by the tool under
+        review, one for each simulation table of the solution.
+    format_: Model format (SBML/PySB)
+    version: PEtab version
+    tol: Tolerance of the simulation distance. Defaults to the tolerance of
+        the solution.
+    root: Root directory of the test suite (see
+        :func:`petabtests.file.get_case_dir`).
+    chunksize: Number of rows to read at a time.
+    """
+    solution = load_solution(test_id, format_, version, root=root)
+    if isinstance(simulation_files, Path | str):
+        simulation_files = [simulation_files]
+    if len(simulation_files) != len(solution[SIMULATION_DFS]):
+        raise AssertionError("Simulation dataframes do not match.")
+    if tol is None:
+        tol = solution[TOL_SIMULATIONS]
+
+    distances = [
+        absolute_simulations_distance_for_file(
+            simulation_file, gt_simulation_df, chunksize=chunksize
+        )
+        for simulation_file, gt_simulation_df in zip(
+            simulation_files, solution[SIMULATION_DFS]
+        )
+    ]
+    return sum(distances) / len(distances) < tol
+
+
+def read_simulation_file(
+    simulation_file: Path | str, chunksize: int = DEFAULT_CHUNKSIZE
+) -> Iterator[pd.DataFrame]:
+    """Read a PEtab simulation table file in chunks.
+
+    The file format is determined by the file extension:
+
+    * TSV (``.tsv``), read via :mod:`pyarrow.csv` if available, or
+      :func:`pandas.read_csv` otherwise,
+    * Parquet (``.parquet``), requires :mod:`pyarrow`,
+    * Arrow IPC (``.arrow``, ``.feather``), memory-mapped, requires
+      :mod:`pyarrow`,
+    * NPZ (``.npz``), with one array per column. String columns with empty
+      strings for missing IDs. Arrays stored uncompressed (see
+      :func:`numpy.savez`) are memory-mapped, compressed arrays (see
+      :func:`numpy.savez_compressed`) are read at once.
+
+    ID columns are read as categorical columns, so that no object columns
+    are created.
+
+    Parameters
+    ----------
+    simulation_file: The simulation table file.
+    chunksize: Number of rows to read at a time. This is approximate for
+        TSV files read via :mod:`pyarrow.csv`.
+
+    Returns
+    -------
+    The chunks of the simulation table.
+    """
+    suffix = Path(simulation_file).suffix.lower()
+    if suffix == ".npz":
+        yield from _read_npz(simulation_file, chunksize)
+        return
+    if suffix not in {".tsv", ".parquet", ".arrow", ".feather"}:
+        raise ValueError(f"Unsupported simulation file: {simulation_file}")
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        if suffix != ".tsv":
+            raise
+        with pd.read_csv(
+            simulation_file,
+            sep="\t",
+            chunksize=chunksize,
+            dtype={col: "category" for col in _id_columns()},
+        ) as chunks:
+            yield from chunks
+        return
+
+    for batch in _read_arrow_batches(simulation_file, suffix, chunksize):
+        yield _arrow_batch_to_frame(batch)
+
+
+def _id_columns() -> list[str]:
+    """Get the columns of PEtab simulation tables that hold IDs."""
+    from petab.v1.C import (
+        OBSERVABLE_ID,
+        PREEQUILIBRATION_CONDITION_ID,
+        SIMULATION_CONDITION_ID,
+    )
+    from petab.v2.C import EXPERIMENT_ID
+
+    return [
+        OBSERVABLE_ID,
+        SIMULATION_CONDITION_ID,
+        PREEQUILIBRATION_CONDITION_ID,
+        EXPERIMENT_ID,
+    ]
+
+
+def _read_npz(
+    simulation_file: Path | str, chunksize: int
+) -> Iterator[pd.DataFrame]:
+    """Read a simulation table from an NPZ file in chunks."""
+    arrays = _load_npz(simulation_file)
+    n_rows = min((len(values) for values in arrays.values()), default=0)
+    for start in range(0, max(n_rows, 1), chunksize):
+        columns = {}
+        for col, values in arrays.items():
+            values = values[start : start + chunksize]
+            if values.dtype.kind in "SU":
+                uniques, codes = np.unique(values, return_inverse=True)
+                values = pd.Categorical.from_codes(
+                    codes.reshape(-1), categories=pd.Index(uniques.tolist())
+                )
+            columns[col] = values
+        yield pd.DataFrame(columns)
+
+
+def _load_npz(simulation_file: Path | str) -> dict[str, np.ndarray]:
+    """Load the arrays of an NPZ file.
+
+    Arrays that are stored uncompressed are memory-mapped, others are read.
+    """
+    read_header = {
+        (1, 0): np.lib.format.read_array_header_1_0,
+        (2, 0): np.lib.format.read_array_header_2_0,
+    }
+    arrays = {}
+    with (
+        zipfile.ZipFile(simulation_file) as archive,
+        open(simulation_file, "rb") as f,
+    ):
+        for info in archive.infolist():
+            name = info.filename.removesuffix(".npy")
+            if info.compress_type == zipfile.ZIP_STORED:
+                # skip the local file header to the .npy data
+                f.seek(info.header_offset + 26)
+                name_size, extra_size = struct.unpack("<HH", f.read(4))
+                f.seek(name_size + extra_size, 1)
+                version = np.lib.format.read_magic(f)
+                if version in read_header:
+                    shape, fortran_order, dtype = read_header[version](f)
+                    if not dtype.hasobject and np.prod(shape) > 0:
+                        arrays[name] = np.memmap(
+                            f,
+                            dtype=dtype,
+                            mode="r",
+                            offset=f.tell(),
+                            shape=shape,
+                            order="F" if fortran_order else "C",
+                        )
+                        continue
+            with archive.open(info) as member:
+                arrays[name] = np.lib.format.read_array(
+                    member, allow_pickle=False
+                )
+    return arrays
+
+
+def _read_arrow_batches(
+    simulation_file: Path | str, suffix: str, chunksize: int
+) -> Iterator:
+    """Read a simulation table file as Arrow record batches."""
+    import pyarrow as pa
+
+    if suffix == ".tsv":
+        from pyarrow import csv
+
+        dictionary = pa.dictionary(pa.int32(), pa.string())
+        with csv.open_csv(
+            simulation_file,
+            # blocks are in bytes, and need to fit the header and full rows
+            read_options=csv.ReadOptions(
+                block_size=max(chunksize * 64, 2**20)
+            ),
+            parse_options=csv.ParseOptions(delimiter="\t"),
+            convert_options=csv.ConvertOptions(
+                column_types={col: dictionary for col in _id_columns()},
+                strings_can_be_null=True,
+            ),
+        ) as reader:
+            yield from reader
+    elif suffix == ".parquet":
+        from pyarrow import parquet
+
+        names = parquet.read_schema(simulation_file).names
+        with parquet.ParquetFile(
+            simulation_file,
+            read_dictionary=[col for col in _id_columns() if col in names],
+        ) as parquet_file:
+            yield from parquet_file.iter_batches(batch_size=chunksize)
+    else:
+        with pa.memory_map(str(simulation_file)) as source:
+            try:
+                reader = pa.ipc.open_file(source)
+            except pa.ArrowInvalid:
+                # streaming format
+                source.seek(0)
+                yield from pa.ipc.open_stream(source)
+            else:
+                for i in range(reader.num_record_batches):
+                    yield reader.get_batch(i)
+
+
+def _arrow_batch_to_frame(batch) -> pd.DataFrame:
+    """Convert an Arrow record batch to a DataFrame, with categorical
+    string columns."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    columns = {}
+    for name, values in zip(batch.schema.names, batch.columns):
+        if pa.types.is_string(values.type) or pa.types.is_large_string(
+            values.type
+        ):
+            values = pc.dictionary_encode(values)
+        if pa.types.is_dictionary(values.type):
+            categories = values.dictionary.to_pylist()
+            if len(set(categories)) != len(categories):
+                values = pc.dictionary_encode(values.dictionary_decode())
+                categories = values.dictionary.to_pylist()
+            codes = pc.fill_null(values.indices, -1).to_numpy()
+            values = pd.Categorical.from_codes(
+                codes, categories=pd.Index(categories, dtype=object)
+            )
+        elif pa.types.is_null(values.type):
+            values = np.full(len(values), np.nan)
+        else:
+            values = values.to_numpy(zero_copy_only=False)
+        columns[name] = values
+    return pd.DataFrame(columns)
+
+
+@dataclass
+class SimulationDiagnostics:
+    """Row-level comparison of a simulation table with the ground truth.
+
+    Errors are absolute errors of the matched rows. Rows are matched as in
+    :func:`absolute_simulations_distance_for_table`.
+    """
+
+    #: Ground truth simulation table with the ``expected`` ground truth
+    #:  values, the submitted ``simulation`` values and their absolute
+    #:  ``error``, which are NaN for rows missing from the submission
+    rows: pd.DataFrame
+    #: Maximum and mean error per observable
+    by_observable: pd.DataFrame
+    #: Maximum and mean error per experiment (PEtab v2) or simulation and
+    #:  preequilibration condition (PEtab v1)
+    by_experiment: pd.DataFrame
+    #: The rows with the largest errors, in descending order
+    worst: pd.DataFrame
+    #: Keys of the ground truth rows missing from the submission
+    missing: pd.DataFrame
+    #: Submitted rows without a matching ground truth row
+    extra: pd.DataFrame
+    #: Normalized absolute distance of the matched rows
+    distance: float
+
+    @property
+    def matches(self) -> bool:
+        """Whether the submission matches the ground truth row by row."""
+        return self.missing.empty and self.extra.empty
+
+
+def simulation_diagnostics_for_table(
+    simulations: pd.DataFrame, gt_simulations: pd.DataFrame, top_k: int = 10
+) -> SimulationDiagnostics:
+    """Compare simulations with the ground truth row by row.
+
+    See :func:`simulation_diagnostics_for_chunks`.
+    """
+    return simulation_diagnostics_for_chunks(
+        [simulations], gt_simulations, top_k=top_k
+    )
+
+
+def simulation_diagnostics_for_chunks(
+    chunks: Iterable[pd.DataFrame],
+    gt_simulations: pd.DataFrame,
+    top_k: int = 10,
+) -> SimulationDiagnostics:
+    """Compare simulations with the ground truth row by row, where the
+    simulation table is provided in chunks of rows.
+
+    Unlike :func:`absolute_simulations_distance_for_chunks`, mismatching
+    rows are reported instead of raising an error.
+
+    Parameters
+    ----------
+    chunks: Consecutive parts of the simulation table proposed by the tool
+        under review.
+    gt_simulations: Ground truth simulation table.
+    top_k: Number of rows with the largest errors to report.
+
+    Returns
+    -------
+    The diagnostics.
+    """
+    return _match_chunks(chunks, gt_simulations, strict=False).diagnostics(
+        top_k
+    )
+
+
+def _match_chunks(
+    chunks: Iterable[pd.DataFrame], gt_simulations: pd.DataFrame, strict: bool
+) -> "_SimulationMatcher":
+    """Match the rows of a chunked simulation table to the ground truth."""
+    matcher = None
+    for chunk in chunks:
+        if matcher is None:
+            matcher = _SimulationMatcher(
+                gt_simulations, _get_grouping_columns(chunk), strict=strict
+            )
+        matcher.add(chunk)
+    if matcher is None:
+        raise ValueError("No simulations provided.")
+    return matcher
+
+
+def _get_grouping_columns(simulations: pd.DataFrame) -> list[str]:
+    """Get the columns identifying a simulation."""
     from petab.v1.C import (
         OBSERVABLE_ID,
         SIMULATION_CONDITION_ID,
         TIME,
         PREEQUILIBRATION_CONDITION_ID,
-        SIMULATION,
     )
     from petab.v2.C import EXPERIMENT_ID
 
@@ -92,49 +880,341 @@ def absolute_simulations_distance_for_table(
         and EXPERIMENT_ID not in simulations
     ):
         # v1
-        # grouping columns
         grouping_cols = [OBSERVABLE_ID, SIMULATION_CONDITION_ID, TIME]
         if PREEQUILIBRATION_CONDITION_ID in simulations:
             grouping_cols.append(PREEQUILIBRATION_CONDITION_ID)
-    elif (
+        return grouping_cols
+    if (
         EXPERIMENT_ID in simulations
         and SIMULATION_CONDITION_ID not in simulations
     ):
         # v2
-        # grouping columns
-        grouping_cols = [OBSERVABLE_ID, EXPERIMENT_ID, TIME]
-    else:
-        raise AssertionError("Unable to determine PEtab version.")
-
-    relevant_cols = grouping_cols.copy()
-    # append simulation column last for correct sorting
-    relevant_cols.append(SIMULATION)
-
-    # restrict tables, fillna to simplify comparisons (nan!=nan)
-    simulations = simulations[relevant_cols].fillna("")
-    gt_simulations = gt_simulations[relevant_cols].fillna("")
-
-    # sort both in the same way to enable direct comparison
-    # and to get the smallest distance
-    simulations = simulations.sort_values(by=relevant_cols)
-    gt_simulations = gt_simulations.sort_values(by=relevant_cols)
-
-    # check if equal grouping is applied
-    for col in grouping_cols:
-        vals, gt_vals = simulations[col], gt_simulations[col]
-        if col == TIME:
-            vals, gt_vals = vals.astype(float), gt_vals.astype(float)
-            matches = np.isclose(vals, gt_vals).all()
-        else:
-            vals, gt_vals = vals.astype(str), gt_vals.astype(str)
-            matches = (vals == gt_vals).all()
-        if not matches:
+        return [OBSERVABLE_ID, EXPERIMENT_ID, TIME]
+    raise AssertionError("Unable to determine PEtab version.")
+
+
+class _SimulationIndex:
+    """Index of the rows of a ground truth simulation table by their key.
+
+    The key of a row are the values of the grouping columns. ID columns are
+    compared as strings, with empty entries being equal. Times are matched
+    to the closest ground truth time, if they are close (see
+    :func:`numpy.isclose`). Keys are encoded as integers, such that lookups
+    are hash-based.
+    """
+
+    def __init__(self, gt_simulations: pd.DataFrame, grouping_cols: list[str]):
+        from petab.v1.C import TIME
+
+        self.grouping_cols = grouping_cols
+        #: Distinct ground truth values per ID column
+        self._ids: dict[str, pd.Index] = {}
+        #: Sorted distinct ground truth times
+        self._times: np.ndarray | None = None
+        for col in grouping_cols:
+            if col == TIME:
+                self._times = np.unique(
+                    np.asarray(gt_simulations[col], dtype=float)
+                )
+            else:
+                self._ids[col] = pd.Index(
+                    _id_strings(pd.unique(gt_simulations[col])).unique()
+                )
+
+        #: For each grouping column, the distinct ground truth keys up to
+        #:  this column, to compact the keys as columns are added
+        self._partial_keys: list[pd.Index] = []
+        keys = np.zeros(len(gt_simulations), dtype=np.int64)
+        for col in grouping_cols:
+            combined = keys * self._n_codes(col) + self._encode_column(
+                gt_simulations[col], col
+            )
+            self._partial_keys.append(pd.Index(pd.unique(combined)))
+            keys = self._partial_keys[-1].get_indexer(combined)
+        #: Key of each ground truth row
+        self.keys = keys
+        #: Number of ground truth rows per key
+        self.counts = np.bincount(keys, minlength=self.n_keys)
+        #: Position of the ground truth row with each key, or -1 if multiple
+        #:  rows have this key
+        self.positions = np.full(self.n_keys, -1, dtype=np.int64)
+        unique = self.counts[keys] == 1
+        self.positions[keys[unique]] = np.flatnonzero(unique)
+
+    @property
+    def n_keys(self) -> int:
+        """Number of distinct keys."""
+        return len(self._partial_keys[-1]) if self._partial_keys else 1
+
+    def get_keys(self, simulations: pd.DataFrame) -> np.ndarray:
+        """Get the keys of the rows of a simulation table.
+
+        Returns
+        -------
+        The key of each row, or -1 if it does not occur in the ground truth.
+        """
+        keys = np.zeros(len(simulations), dtype=np.int64)
+        for col, partial_keys in zip(
+            self.grouping_cols, self._partial_keys, strict=True
+        ):
+            codes = self._encode_column(simulations[col], col)
+            missing = (keys == -1) | (codes == -1)
+            keys = partial_keys.get_indexer(keys * self._n_codes(col) + codes)
+            keys[missing] = -1
+        return keys
+
+    def _n_codes(self, col: str) -> int:
+        """Number of distinct codes of a grouping column."""
+        if col in self._ids:
+            return len(self._ids[col])
+        return len(self._times)
+
+    def _encode_column(self, values: pd.Series, col: str) -> np.ndarray:
+        """Encode the values of a grouping column as integers, or -1 if they
+        do not occur in the ground truth."""
+        if col in self._ids:
+            # map the distinct values only
+            codes, uniques = pd.factorize(values, use_na_sentinel=False)
+            return self._ids[col].get_indexer(_id_strings(uniques))[codes]
+
+        times = np.asarray(values, dtype=float)
+        if not len(self._times):
+            return np.full(len(times), -1, dtype=np.int64)
+        # match to the closest ground truth time
+        right = np.minimum(
+            np.searchsorted(self._times, times), len(self._times) - 1
+        )
+        left = np.maximum(right - 1, 0)
+        with np.errstate(invalid="ignore"):
+            # (inf - inf)
+            closest = np.where(
+                np.abs(times - self._times[left])
+                <= np.abs(times - self._times[right]),
+                left,
+                right,
+            )
+        return np.where(np.isclose(times, self._times[closest]), closest, -1)
+
+
+class _SimulationMatcher:
+    """Matches simulation table rows to ground truth rows one-to-one, and
+    records the absolute error of each matched row.
+
+    See :func:`absolute_simulations_distance_for_table`.
+
+    Parameters
+    ----------
+    gt_simulations: Ground truth simulation table.
+    grouping_cols: Columns identifying a simulation.
+    strict: Whether to raise an :class:`AssertionError` as soon as a row
+        cannot be matched, instead of recording it.
+    """
+
+    def __init__(
+        self,
+        gt_simulations: pd.DataFrame,
+        grouping_cols: list[str],
+        strict: bool = True,
+    ):
+        from petab.v1.C import SIMULATION
+
+        for col in grouping_cols:
+            if col not in gt_simulations:
+                raise AssertionError("Simulation dataframes do not match.")
+        self.gt_simulations = gt_simulations
+        self.grouping_cols = grouping_cols
+        self.strict = strict
+        self.index = _SimulationIndex(gt_simulations, grouping_cols)
+        self.gt_values = np.asarray(gt_simulations[SIMULATION], dtype=float)
+        n_gt = len(gt_simulations)
+        #: Whether a simulation row was matched to each ground truth row
+        self.matched = np.zeros(n_gt, dtype=bool)
+        #: Matched simulated value for each ground truth row
+        self.values = np.full(n_gt, np.nan)
+        #: Absolute error for each ground truth row
+        self.errors = np.full(n_gt, np.nan)
+        self.n_rows = 0
+        # rows with duplicate keys can only be matched once all rows are known
+        self._deferred_keys: list[np.ndarray] = []
+        self._deferred_values: list[np.ndarray] = []
+        # unmatched rows with unknown keys, and with known keys
+        self._extra_rows: list[pd.DataFrame] = []
+        self._extra_keys: list[np.ndarray] = []
+        self._extra_values: list[np.ndarray] = []
+
+    def add(self, simulations: pd.DataFrame) -> None:
+        """Match the rows of (a chunk of) the simulation table."""
+        from petab.v1.C import SIMULATION
+
+        keys = self.index.get_keys(simulations)
+        values = np.asarray(simulations[SIMULATION], dtype=float)
+        self.n_rows += len(values)
+
+        unknown = keys == -1
+        if unknown.any():
+            self._check_strict()
+            self._extra_rows.append(
+                simulations.iloc[np.flatnonzero(unknown)][
+                    [*self.grouping_cols, SIMULATION]
+                ]
+            )
+            keys, values = keys[~unknown], values[~unknown]
+
+        gt_idxs = self.index.positions[keys]
+        deferred = gt_idxs == -1
+        if deferred.any():
+            self._deferred_keys.append(keys[deferred])
+            self._deferred_values.append(values[deferred])
+            gt_idxs, values = gt_idxs[~deferred], values[~deferred]
+        self._match(gt_idxs, values)
+
+    def distance(self) -> float:
+        """Get the normalized absolute distance of all rows.
+
+        Raises
+        ------
+        AssertionError: If the rows could not be matched one-to-one.
+        """
+        self._match_deferred()
+        if self.n_rows != len(self.gt_values) or not self.matched.all():
             raise AssertionError("Simulation dataframes do not match.")
+        if not self.n_rows:
+            return np.nan
+        return self.errors.sum() / self.n_rows
+
+    def diagnostics(self, top_k: int) -> SimulationDiagnostics:
+        """Get the row-level diagnostics of all rows."""
+        from petab.v1.C import OBSERVABLE_ID, SIMULATION, TIME
+
+        self._match_deferred()
+        rows = self.gt_simulations[self.grouping_cols].reset_index(drop=True)
+        rows["expected"] = self.gt_values
+        rows[SIMULATION] = self.values
+        rows["error"] = self.errors
+
+        experiment_cols = [
+            col
+            for col in self.grouping_cols
+            if col not in {OBSERVABLE_ID, TIME}
+        ]
+        return SimulationDiagnostics(
+            rows=rows,
+            by_observable=_error_summary(rows, [OBSERVABLE_ID]),
+            by_experiment=_error_summary(rows, experiment_cols),
+            worst=rows.nlargest(top_k, "error"),
+            missing=rows.loc[~self.matched, self.grouping_cols],
+            extra=self._get_extra_rows(),
+            distance=(
+                self.errors[self.matched].mean()
+                if self.matched.any()
+                else np.nan
+            ),
+        )
+
+    def _check_strict(self) -> None:
+        """Raise an error for an unmatched row in strict mode."""
+        if self.strict:
+            raise AssertionError("Simulation dataframes do not match.")
+
+    def _match(self, gt_idxs: np.ndarray, values: np.ndarray) -> None:
+        """Record matched rows.
+
+        Only the first row matched to a ground truth row is matched, any
+        further rows are extra.
+        """
+        _, first = np.unique(gt_idxs, return_index=True)
+        first = first[~self.matched[gt_idxs[first]]]
+        if len(first) < len(gt_idxs):
+            self._check_strict()
+            extra = np.ones(len(gt_idxs), dtype=bool)
+            extra[first] = False
+            self._extra_keys.append(self.index.keys[gt_idxs[extra]])
+            self._extra_values.append(values[extra])
+        gt_idxs, values = gt_idxs[first], values[first]
+        self.matched[gt_idxs] = True
+        self.values[gt_idxs] = values
+        self.errors[gt_idxs] = np.abs(values - self.gt_values[gt_idxs])
+
+    def _match_deferred(self) -> None:
+        """Match the rows with keys that occur multiple times in the ground
+        truth, in the order of their simulated values."""
+        if not self._deferred_keys:
+            return
+        keys = np.concatenate(self._deferred_keys)
+        values = np.concatenate(self._deferred_values)
+        self._deferred_keys, self._deferred_values = [], []
 
-    # compute distance
-    return absolute_simulations_distance_for_array(
-        np.array(simulations[SIMULATION]), np.array(gt_simulations[SIMULATION])
+        gt_idxs = np.flatnonzero(self.index.counts[self.index.keys] > 1)
+        gt_keys = self.index.keys[gt_idxs]
+        n_ranks = len(self.gt_values)
+        gt_ranked_keys = pd.Index(
+            gt_keys * n_ranks
+            + _rank_within_groups(gt_keys, self.gt_values[gt_idxs])
+        )
+        ranked_keys = keys * n_ranks + _rank_within_groups(keys, values)
+        matches = gt_ranked_keys.get_indexer(ranked_keys)
+        unmatched = matches == -1
+        if unmatched.any():
+            self._check_strict()
+            self._extra_keys.append(keys[unmatched])
+            self._extra_values.append(values[unmatched])
+        self._match(gt_idxs[matches[~unmatched]], values[~unmatched])
+
+    def _get_extra_rows(self) -> pd.DataFrame:
+        """Get the unmatched simulation rows."""
+        from petab.v1.C import SIMULATION
+
+        extra_rows = [rows.reset_index(drop=True) for rows in self._extra_rows]
+        if self._extra_keys:
+            # rows with known keys are represented by the ground truth keys
+            keys = np.concatenate(self._extra_keys)
+            _, first_idxs = np.unique(self.index.keys, return_index=True)
+            rows = self.gt_simulations[self.grouping_cols].iloc[
+                first_idxs[keys]
+            ]
+            extra_rows.append(
+                rows.assign(
+                    **{SIMULATION: np.concatenate(self._extra_values)}
+                ).reset_index(drop=True)
+            )
+        if not extra_rows:
+            return pd.DataFrame(columns=[*self.grouping_cols, SIMULATION])
+        return pd.concat(extra_rows, ignore_index=True)
+
+
+def _error_summary(rows: pd.DataFrame, by: list[str]) -> pd.DataFrame:
+    """Get the maximum and mean error per group of rows."""
+    return rows.groupby(by, dropna=False, sort=True)["error"].agg(
+        ["max", "mean"]
+    )
+
+
+def _id_strings(values) -> pd.Index:
+    """Convert ID column entries to strings, with ``""`` for empty
+    entries."""
+    return pd.Index(
+        ["" if pd.isna(value) else str(value) for value in values],
+        dtype=object,
+    )
+
+
+def _rank_within_groups(keys: np.ndarray, values: pd.Series) -> np.ndarray:
+    """Rank `values` within the groups given by `keys`.
+
+    Returns
+    -------
+    The 0-based rank of each value among all values with the same key.
+    """
+    values = np.asarray(values, dtype=float)
+    order = np.lexsort((values, keys))
+    sorted_keys = keys[order]
+    group_starts = np.flatnonzero(
+        np.concatenate([[True], sorted_keys[1:] != sorted_keys[:-1]])
     )
+    group_sizes = np.diff(np.append(group_starts, len(keys)))
+    ranks = np.empty(len(keys), dtype=np.int64)
+    ranks[order] = np.arange(len(keys)) - np.repeat(group_starts, group_sizes)
+    return ranks
 
 
 def absolute_simulations_distance_for_array(
@@ -1,11 +1,15 @@
 """File input and output."""
 
 from __future__ import annotations
+import copy
+import difflib
+import functools
 import os
+import shutil
 from dataclasses import dataclass
-from shutil import copyfile, SameFileError
 from collections.abc import Callable
 from pathlib import Path
+import numpy as np
 import pandas as pd
 from petab import v1
 from petab import v2
@@ -13,19 +17,37 @@ import yaml
 import petab.v1.C as C1
 import petab.v2.C as C2
 from .C import *  # noqa: F403
+from .antimony import AntimonyModel
+from .profiling import phase
+from .residuals import compute_residuals
+from .solution import Solution
+from .util import as_list
 import logging
-from petab.v1.lint import lint_problem as lint_problem_v1
-from petab.v2.lint import lint_problem as lint_problem_v2
-import importlib
-import sys
+from petab.v1.models.model import Model, model_factory
+from petab.v1.models.sbml_model import SbmlModel
+import hashlib
+import importlib.util
+from types import ModuleType
 from math import log
 
 logger = logging.getLogger("petab_test_suite")
 
+#: Maximum number of solution files memoized per process
+SOLUTION_CACHE_SIZE = 1024
+#: YAML loader, using libyaml if available
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 __all__ = [
+    "FileChecker",
+    "FileDifference",
+    "FileWriter",
+    "LazyTestCase",
     "get_case_dir",
+    "load_case",
+    "load_case_module",
     "load_solution",
+    "load_solution_files",
     "PetabV1TestCase",
     "PetabV2TestCase",
     "problem_yaml_name",
@@ -36,6 +58,141 @@ __all__ = [
 ]
 
 
+class FileWriter:
+    """Writes generated test case files to disk.
+
+    Files are only written if their content changes, so that unchanged files
+    keep their modification time. Files are replaced atomically.
+
+    Parameters
+    ----------
+    root: Root directory of the generated test suite (see
+        :func:`get_case_dir`). Defaults to the test case definitions
+        directory.
+    """
+
+    #: Whether the written files can be used afterwards, e.g., for linting
+    persistent = True
+
+    def __init__(self, root: Path | str = None):
+        #: Root directory of the generated test suite
+        self.root = Path(root) if root is not None else None
+        #: All files generated via this writer
+        self.paths: list[Path] = []
+        #: The generated files whose content changed
+        self.changed_paths: list[Path] = []
+
+    def write(self, path: Path, data: str | bytes) -> None:
+        """Write `data` to `path`, unless `path` already has that content."""
+        self.paths.append(path)
+        if isinstance(data, str):
+            data = data.encode()
+        if _has_content(path, data):
+            return
+        self.changed_paths.append(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _replace(path, lambda tmp_path: tmp_path.write_bytes(data))
+
+    def copy(self, src: Path, dst: Path) -> None:
+        """Copy `src` to `dst`, unless `dst` already has the same content.
+
+        If possible, `dst` is created as a hard link to `src`.
+        """
+        self.paths.append(dst)
+        if dst.exists() and (
+            os.path.samefile(src, dst) or _has_content(dst, src.read_bytes())
+        ):
+            return
+        self.changed_paths.append(dst)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            _replace(dst, lambda tmp_path: os.link(src, tmp_path))
+        except OSError:
+            # e.g., across file systems
+            _replace(dst, lambda tmp_path: shutil.copyfile(src, tmp_path))
+
+
+def _has_content(path: Path, data: bytes) -> bool:
+    """Check whether the file `path` exists and has content `data`."""
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def _replace(path: Path, create: Callable[[Path], None]) -> None:
+    """Atomically replace `path` by a file created via ``create(tmp_path)``
+    at a temporary path in the same directory."""
+    tmp_path = path.with_name(f".tmp{os.getpid()}_{path.name}")
+    try:
+        tmp_path.unlink(missing_ok=True)
+        create(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@dataclass
+class FileDifference:
+    """A generated file that does not match the file on disk."""
+
+    #: The file on disk
+    path: Path
+    #: Unified diff from the file on disk to the generated content, or a
+    #:  short description for missing or binary files
+    diff: str
+
+    def __str__(self):
+        return f"{self.path}:\n{self.diff}"
+
+
+class FileChecker(FileWriter):
+    """Compares generated test case files to the files on disk.
+
+    Nothing is written. Any mismatches are collected in
+    :attr:`differences`.
+    """
+
+    persistent = False
+
+    def __init__(self, root: Path | str = None):
+        super().__init__(root=root)
+        self.differences: list[FileDifference] = []
+
+    def copy(self, src: Path, dst: Path) -> None:
+        """Compare the content of `src` to the content of `dst`."""
+        self.write(dst, src.read_bytes())
+
+    def write(self, path: Path, data: str | bytes) -> None:
+        """Compare `data` to the content of `path`."""
+        self.paths.append(path)
+        if isinstance(data, str):
+            data = data.encode()
+        try:
+            actual = path.read_bytes()
+        except FileNotFoundError:
+            self.differences.append(FileDifference(path, "File is missing."))
+            return
+        if actual == data:
+            return
+
+        try:
+            diff = "".join(
+                difflib.unified_diff(
+                    actual.decode().splitlines(keepends=True),
+                    data.decode().splitlines(keepends=True),
+                    fromfile=f"{path} (on disk)",
+                    tofile=f"{path} (generated)",
+                )
+            )
+        except UnicodeDecodeError:
+            diff = "Binary files differ."
+        self.differences.append(FileDifference(path, diff))
+
+
 @dataclass
 class PetabV1TestCase:
     """A PEtab test case"""
@@ -43,7 +200,7 @@ class PetabV1TestCase:
     id: int
     brief: str
     description: str
-    model: Path
+    model: Path | AntimonyModel
     condition_dfs: list[pd.DataFrame]
     observable_dfs: list[pd.DataFrame]
     measurement_dfs: list[pd.DataFrame]
@@ -51,56 +208,91 @@ class PetabV1TestCase:
     parameter_df: pd.DataFrame
 
     @staticmethod
-    def load(case_dir: Path, case_id: str) -> PetabV1TestCase:
-        """Load a test case definition module."""
-        sys.path.append(str(case_dir))
-        case_module = importlib.import_module(case_id)
-        sys.path.pop()
-        # noinspection PyUnresolvedReferences
-        case: PetabV1TestCase = case_module.case
-        del sys.modules[case_id]
-        return case
-
-    def write(self, version: str, format_: str):
-        """Write the test case to files."""
-        from petab.v1.calculate import calculate_chi2, calculate_llh
+    def load(case_dir: Path, case_id: str) -> PetabV1TestCase | LazyTestCase:
+        """Load a test case definition module.
+
+        See :func:`load_case`.
+        """
+        return load_case(case_dir, case_id)
+
+    def write(
+        self, version: str, format_: str, output: FileWriter = None
+    ) -> None:
+        """Write the test case to files.
+
+        The PEtab problem is not validated, except for the YAML file (see
+        :meth:`to_problem` and :mod:`petabtests.lint`).
+        """
+        output = output or FileWriter()
+
+        with phase("residuals"):
+            residuals = compute_residuals(
+                self.measurement_dfs,
+                self.simulation_dfs,
+                self.observable_dfs,
+                self.parameter_df,
+                version=version,
+            )
 
         self.write_problem(
             format_=format_,
+            output=output,
         )
-
-        chi2 = calculate_chi2(
-            self.measurement_dfs,
-            self.simulation_dfs,
-            self.observable_dfs,
-            self.parameter_df,
-        )
-        llh = calculate_llh(
-            self.measurement_dfs,
-            self.simulation_dfs,
-            self.observable_dfs,
-            self.parameter_df,
-        )
-
         write_solution(
             test_id=self.id,
             simulation_dfs=self.simulation_dfs,
-            chi2=chi2,
-            llh=llh,
+            chi2=residuals.chi2,
+            llh=residuals.llh,
             version=version,
             format_=format_,
+            output=output,
+        )
+
+    def to_problem(self, format_: str = "sbml") -> v1.Problem:
+        """Create the PEtab problem of the test case in memory, e.g., for
+        validation, without reading any written files.
+
+        Parameters
+        ----------
+        format_: Model format (SBML/PySB)
+        """
+        model_files = (
+            [self.model]
+            if isinstance(self.model, Path | str | AntimonyModel)
+            else self.model
+        )
+        if len(model_files) != 1:
+            raise ValueError("PEtab v1 problems require exactly one model.")
+        dir_ = get_case_dir(id_=self.id, format_=format_, version="v1.0.0")
+
+        return v1.Problem(
+            model=_load_model(dir_, model_files[0], format_),
+            condition_df=_concat_tables(
+                self.condition_dfs, v1.get_condition_df
+            ),
+            measurement_df=_concat_tables(
+                self.measurement_dfs, v1.get_measurement_df
+            ),
+            observable_df=_concat_tables(
+                self.observable_dfs, v1.get_observable_df
+            ),
+            parameter_df=v1.get_parameter_df(self.parameter_df),
         )
 
     def write_problem(
         self,
         format_: str = "sbml",
+        output: FileWriter = None,
     ) -> None:
         """Write the PEtab problem for a given test to files.
 
         Parameters
         ----------
         format_: Model format (SBML/PySB)
+        output: Destination of the generated files. Defaults to writing them
+            to the test case directory.
         """
+        output = output or FileWriter()
         test_id = self.id
         version = "v1.0.0"
         format_version = 1
@@ -124,12 +316,17 @@ class PetabV1TestCase:
             else self.measurement_dfs
         )
         model_files = (
-            [self.model] if isinstance(self.model, Path | str) else self.model
+            [self.model]
+            if isinstance(self.model, Path | str | AntimonyModel)
+            else self.model
         )
         parameter_df = self.parameter_df
 
         # id to string
-        dir_ = get_case_dir(id_=test_id, format_=format_, version=version)
+        model_dir = get_case_dir(id_=test_id, format_=format_, version=version)
+        dir_ = get_case_dir(
+            id_=test_id, format_=format_, version=version, root=output.root
+        )
 
         # petab yaml
         config = {
@@ -151,21 +348,18 @@ class PetabV1TestCase:
                 copied_model_file = f"_model{suffix}"
             else:
                 copied_model_file = f"_model{i_sbml}{suffix}"
-            try:
-                copyfile(
-                    dir_ / model_file,
-                    dir_ / copied_model_file,
-                )
-            except SameFileError:
-                pass
+            _write_model(
+                output, model_dir, model_file, dir_ / copied_model_file
+            )
             copied_model_files.append(copied_model_file)
 
         config[C1.PROBLEMS][0][C1.SBML_FILES] = copied_model_files
 
         # write parameters
         parameters_file = "_parameters.tsv"
-        petab.write_parameter_df(
-            parameter_df, os.path.join(dir_, parameters_file)
+        output.write(
+            dir_ / parameters_file,
+            _render_table(petab.write_parameter_df, parameter_df),
         )
         config[C1.PARAMETER_FILE] = parameters_file
 
@@ -176,6 +370,7 @@ class PetabV1TestCase:
             petab.write_condition_df,
             condition_dfs,
             config[C1.PROBLEMS][0][C1.CONDITION_FILES],
+            output=output,
         )
 
         # write observables
@@ -185,6 +380,7 @@ class PetabV1TestCase:
             petab.write_observable_df,
             observable_dfs,
             config[C1.PROBLEMS][0][C1.OBSERVABLE_FILES],
+            output=output,
         )
 
         # write measurements
@@ -194,21 +390,18 @@ class PetabV1TestCase:
             petab.write_measurement_df,
             measurement_dfs,
             config[C1.PROBLEMS][0][C1.MEASUREMENT_FILES],
+            output=output,
         )
 
-        # validate petab yaml
-        v1.validate(config, path_prefix=dir_)
-
         # write yaml
+        if output.persistent:
+            # the tables and the model are validated in memory, see
+            #  to_problem
+            with phase("validate"):
+                v1.validate_yaml_syntax(config)
         yaml_file = problem_yaml_name(test_id)
-        yaml_path = os.path.join(dir_, yaml_file)
-        with open(yaml_path, "w") as outfile:
-            yaml.dump(config, outfile, default_flow_style=False)
-
-        # validate written PEtab files
-        problem = petab.Problem.from_yaml(yaml_path)
-        if lint_problem_v1(problem):
-            raise RuntimeError("Invalid PEtab problem, see messages above.")
+        yaml_path = dir_ / yaml_file
+        output.write(yaml_path, yaml.dump(config, default_flow_style=False))
 
 
 @dataclass
@@ -218,7 +411,7 @@ class PetabV2TestCase:
     id: int
     brief: str
     description: str
-    model: Path
+    model: Path | AntimonyModel
     condition_dfs: list[pd.DataFrame]
     observable_dfs: list[pd.DataFrame]
     measurement_dfs: list[pd.DataFrame]
@@ -263,84 +456,137 @@ class PetabV2TestCase:
         )
 
     @staticmethod
-    def load(case_dir: Path, case_id: str) -> PetabV2TestCase:
-        """Load a test case definition module."""
-        sys.path.append(str(case_dir))
-        case_module = importlib.import_module(case_id)
-        sys.path.pop()
-        # noinspection PyUnresolvedReferences
-        case: PetabV2TestCase = case_module.case
-        del sys.modules[case_id]
-        return case
-
-    def write(self, version: str, format_: str):
-        """Write the test case to files."""
-        from petab.v2.calculate import calculate_chi2, calculate_llh
-        from petab.v2 import Problem
-        from petab.v2 import Uniform
+    def load(case_dir: Path, case_id: str) -> PetabV2TestCase | LazyTestCase:
+        """Load a test case definition module.
 
-        self.write_problem(
-            format_=format_,
-        )
+        See :func:`load_case`.
+        """
+        return load_case(case_dir, case_id)
 
-        chi2 = calculate_chi2(
-            self.measurement_dfs,
-            self.simulation_dfs,
-            self.observable_dfs,
-            self.parameter_df,
-        )
-        llh = calculate_llh(
-            self.measurement_dfs,
-            self.simulation_dfs,
-            self.observable_dfs,
-            self.parameter_df,
-        )
+    def write(
+        self, version: str, format_: str, output: FileWriter = None
+    ) -> None:
+        """Write the test case to files.
+
+        The PEtab problem is not validated (see :meth:`to_problem` and
+        :mod:`petabtests.lint`).
+        """
+        from petab.v2 import Uniform
 
-        yaml_path = get_case_dir(
-            id_=self.id, format_=format_, version=self.version
-        ) / problem_yaml_name(self.id)
-        problem = Problem.from_yaml(yaml_path)
+        output = output or FileWriter()
 
-        if problem.has_ml_objective:
-            log_prior = None
-            unnorm_log_posterior = None
-        else:
-            log_prior = {
-                p.id: log(
-                    float(
-                        (
-                            p.prior_dist
-                            if p.prior_dist
-                            else Uniform(p.lb, p.ub)
-                        ).pdf(p.nominal_value)
-                    )
-                )
-                for p in problem.parameters
+        with phase("residuals"):
+            residuals = compute_residuals(
+                self.measurement_dfs,
+                self.simulation_dfs,
+                self.observable_dfs,
+                self.parameter_df,
+                version=version,
+            )
+
+        with phase("priors"):
+            # only the parameter table is needed, not the whole problem
+            parameters = [
+                p
+                for p in _table_from_df(
+                    v2.ParameterTable, self.parameter_df
+                ).parameters
                 if p.estimate
-            }
-            unnorm_log_posterior = llh + sum(log_prior.values())
+            ]
+            if all(p.prior_distribution is None for p in parameters):
+                # maximum likelihood objective
+                log_prior = None
+                unnorm_log_posterior = None
+            else:
+                log_prior = {
+                    p.id: log(
+                        float(
+                            (
+                                p.prior_dist
+                                if p.prior_dist
+                                else Uniform(p.lb, p.ub)
+                            ).pdf(p.nominal_value)
+                        )
+                    )
+                    for p in parameters
+                }
+                unnorm_log_posterior = residuals.llh + sum(log_prior.values())
 
+        self.write_problem(
+            format_=format_,
+            output=output,
+        )
         write_solution(
             test_id=self.id,
             simulation_dfs=self.simulation_dfs,
-            chi2=chi2,
-            llh=llh,
+            chi2=residuals.chi2,
+            llh=residuals.llh,
             version=version,
             format_=format_,
             log_prior=log_prior,
             unnorm_log_posterior=unnorm_log_posterior,
+            output=output,
+        )
+
+    def to_problem(self, format_: str = "sbml") -> v2.Problem:
+        """Create the PEtab problem of the test case in memory, e.g., for
+        validation, without reading any written files.
+
+        Parameters
+        ----------
+        format_: Model format (SBML/PySB)
+        """
+        model_files = (
+            [self.model]
+            if isinstance(self.model, Path | AntimonyModel)
+            else self.model
+        )
+        dir_ = get_case_dir(id_=self.id, format_=format_, version=self.version)
+
+        return v2.Problem(
+            models=[
+                _load_model(dir_, model_file, format_, f"model_{model_idx}")
+                for model_idx, model_file in enumerate(model_files)
+            ],
+            condition_tables=[
+                _table_from_df(v2.ConditionTable, df)
+                for df in as_list(self.condition_dfs)
+                if not df.empty
+            ],
+            experiment_tables=[
+                _table_from_df(v2.ExperimentTable, df)
+                for df in as_list(self.experiment_dfs)
+            ],
+            observable_tables=[
+                _table_from_df(v2.ObservableTable, df)
+                for df in as_list(self.observable_dfs)
+            ],
+            measurement_tables=[
+                _table_from_df(v2.MeasurementTable, df)
+                for df in as_list(self.measurement_dfs)
+            ],
+            parameter_tables=[
+                _table_from_df(v2.ParameterTable, self.parameter_df)
+            ],
+            mapping_tables=[_table_from_df(v2.MappingTable, self.mapping_df)]
+            if self.mapping_df is not None
+            else None,
         )
 
     def write_problem(
         self,
         format_: str = "sbml",
+        output: FileWriter = None,
     ) -> None:
         """Write the PEtab problem for a given test to files.
 
         Parameters
         ----------
         format_: Model format (SBML/PySB)
+        output: Destination of the generated files. Defaults to writing them
+            to the test case directory.
         """
+        output = output or FileWriter()
         format_version = self.version[1:]
         test_id = self.id
         print(f"Writing case {self.version} {format_} {test_id}...")
@@ -367,12 +613,22 @@ class PetabV2TestCase:
         )
         mapping_df = self.mapping_df
         model_files = (
-            [self.model] if isinstance(self.model, Path) else self.model
+            [self.model]
+            if isinstance(self.model, Path | AntimonyModel)
+            else self.model
         )
         parameter_dfs = [self.parameter_df]
 
         # id to string
-        dir_ = get_case_dir(id_=test_id, format_=format_, version=self.version)
+        model_dir = get_case_dir(
+            id_=test_id, format_=format_, version=self.version
+        )
+        dir_ = get_case_dir(
+            id_=test_id,
+            format_=format_,
+            version=self.version,
+            root=output.root,
+        )
 
         # petab yaml
         config = {
@@ -395,13 +651,9 @@ class PetabV2TestCase:
                 copied_model_file = f"_model{suffix}"
             else:
                 copied_model_file = f"_model{i_sbml}{suffix}"
-            try:
-                copyfile(
-                    dir_ / model_file,
-                    dir_ / copied_model_file,
-                )
-            except SameFileError:
-                pass
+            _write_model(
+                output, model_dir, model_file, dir_ / copied_model_file
+            )
             copied_model_files.append(copied_model_file)
 
         petab = v2
@@ -420,6 +672,7 @@ class PetabV2TestCase:
             petab.write_parameter_df,
             parameter_dfs,
             config[C2.PARAMETER_FILES],
+            output=output,
         )
 
         # write conditions
@@ -430,6 +683,7 @@ class PetabV2TestCase:
             condition_dfs,
             config[C2.CONDITION_FILES],
             skip_empty=True,
+            output=output,
         )
 
         # write observables
@@ -439,6 +693,7 @@ class PetabV2TestCase:
             petab.write_observable_df,
             observable_dfs,
             config[C2.OBSERVABLE_FILES],
+            output=output,
         )
 
         # write measurements
@@ -448,6 +703,7 @@ class PetabV2TestCase:
             petab.write_measurement_df,
             measurement_dfs,
             config[C2.MEASUREMENT_FILES],
+            output=output,
         )
 
         # write experiments
@@ -459,34 +715,145 @@ class PetabV2TestCase:
                 v2.write_experiment_df,
                 experiment_dfs,
                 config[C2.EXPERIMENT_FILES],
+                output=output,
             )
 
         if mapping_df is not None:
             # write mapping table
             mappings_file = "_mapping.tsv"
-            petab.write_mapping_df(
-                mapping_df, os.path.join(dir_, mappings_file)
+            output.write(
+                dir_ / mappings_file,
+                _render_table(petab.write_mapping_df, mapping_df),
             )
             config[C2.MAPPING_FILES] = [mappings_file]
 
         # write yaml
         yaml_file = problem_yaml_name(test_id)
-        yaml_path = os.path.join(dir_, yaml_file)
-        with open(yaml_path, "w") as outfile:
-            yaml.dump(config, outfile, default_flow_style=False)
+        yaml_path = dir_ / yaml_file
+        output.write(yaml_path, yaml.dump(config, default_flow_style=False))
+
+
+class LazyTestCase:
+    """A test case whose tables and models are only built on first use.
+
+    Test case definition modules provide the cheap metadata ``BRIEF`` and
+    ``DESCRIPTION`` and a ``build()`` function returning the
+    :class:`PetabV1TestCase` or :class:`PetabV2TestCase`. ``build()`` is
+    called at most once, when any attribute other than the metadata is
+    accessed, e.g., by :meth:`PetabV2TestCase.write`.
+    """
+
+    def __init__(
+        self,
+        id: int,
+        brief: str,
+        description: str,
+        build: Callable[[], PetabV1TestCase | PetabV2TestCase],
+    ):
+        self.id = id
+        self.brief = brief
+        self.description = description
+        self._build = build
+        self._case = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(id={self.id!r})"
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the test case was built already."""
+        return self._case is not None
+
+    def materialize(self) -> PetabV1TestCase | PetabV2TestCase:
+        """Build the test case, if not done before, and return it."""
+        if self._case is None:
+            with phase("build"):
+                case = self._build()
+            if case.id != self.id:
+                raise ValueError(
+                    f"Test case {self.id} built a test case with ID {case.id}."
+                )
+            self._case = case
+        return self._case
 
-        # validate written PEtab files
-        if validation_results := lint_problem_v2(yaml_path):
-            logger.critical(f"Invalid PEtab problem generated for {dir_}.")
-            validation_results.log(logger=logger)
+    def __getattr__(self, name):
+        # only called for attributes not set in __init__
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
 
 
-def get_case_dir(id_: int | str, format_: str, version: str) -> Path:
-    """Get the directory of a test case."""
-    id_str = test_id_str(id_)
-    dir_ = CASES_DIR / version / format_ / id_str
-    dir_.mkdir(parents=True, exist_ok=True)
-    return dir_
+def load_case(
+    case_dir: Path, case_id: str
+) -> PetabV1TestCase | PetabV2TestCase | LazyTestCase:
+    """Load a test case definition module.
+
+    Modules defining ``build()`` are not built yet, but returned as
+    :class:`LazyTestCase`. For other modules, the test case defined at import
+    as ``case`` is returned.
+
+    Parameters
+    ----------
+    case_dir: Directory of the test case.
+    case_id: ID of the test case (``XXXX``).
+    """
+    case_module = load_case_module(Path(case_dir, f"{case_id}.py"))
+    if hasattr(case_module, "build"):
+        return LazyTestCase(
+            id=int(case_id),
+            brief=case_module.BRIEF,
+            description=case_module.DESCRIPTION,
+            build=case_module.build,
+        )
+    # noinspection PyUnresolvedReferences
+    return case_module.case
+
+
+def load_case_module(case_file: Path) -> ModuleType:
+    """Execute a test case definition file and return it as module.
+
+    The module is given a unique name derived from its path. Neither
+    ``sys.path`` nor ``sys.modules`` are modified, so that test cases can be
+    loaded concurrently from multiple threads.
+
+    Parameters
+    ----------
+    case_file: Path of the test case definition module (``XXXX.py``).
+    """
+    case_file = Path(case_file).resolve()
+    path_hash = hashlib.sha1(str(case_file).encode()).hexdigest()[:12]
+    module_name = f"petabtests_case_{case_file.stem}_{path_hash}"
+
+    spec = importlib.util.spec_from_file_location(module_name, case_file)
+    if spec is None:
+        raise ValueError(f"Not a Python module: {case_file}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_case_dir(
+    id_: int | str, format_: str, version: str, root: Path | str = None
+) -> Path:
+    """Get the directory of a test case.
+
+    The directory is not created.
+
+    Parameters
+    ----------
+    id_: Test case ID
+    format_: Model format (SBML/PySB)
+    version: PEtab version
+    root: Root directory of the test suite. Defaults to :data:`CASES_DIR`,
+        which contains the test case definitions. Test cases can be
+        generated to a different root directory.
+    """
+    return (
+        Path(root if root is not None else CASES_DIR)
+        / version
+        / format_
+        / test_id_str(id_)
+    )
 
 
 def problem_yaml_name(_id: int | str) -> str:
@@ -505,17 +872,22 @@ def test_id_str(_id: int | str) -> str:
 
 
 def write_info(
-    case: PetabV1TestCase | PetabV2TestCase, format_: str, version: str
+    case: PetabV1TestCase | PetabV2TestCase,
+    format_: str,
+    version: str,
+    output: FileWriter = None,
 ) -> None:
     """Write test info markdown file"""
+    output = output or FileWriter()
     # id to string
-    dir_ = get_case_dir(id_=case.id, format_=format_, version=version)
+    dir_ = get_case_dir(
+        id_=case.id, format_=format_, version=version, root=output.root
+    )
     id_str = test_id_str(case.id)
-    filename = dir_ / "README.md"
-    with open(filename, "w") as f:
-        f.write(f"# PEtab test case {id_str}\n\n")
-        f.write(case.description)
-        f.write("\n")
+    output.write(
+        dir_ / "README.md",
+        f"# PEtab test case {id_str}\n\n{case.description}\n",
+    )
 
 
 def write_solution(
@@ -530,6 +902,7 @@ def write_solution(
     tol_llh: float = 1e-3,
     log_prior: dict[str, float] = None,
     unnorm_log_posterior: float = None,
+    output: FileWriter = None,
 ):
     """Write solution to files.
 
@@ -540,13 +913,18 @@ def write_solution(
     chi2: True chi square value.
     llh: True log likelihood value.
     format_: Model format (SBML/PySB)
+    output: Destination of the generated files. Defaults to writing them
+        to the test case directory.
     """
+    output = output or FileWriter()
 
     if isinstance(simulation_dfs, pd.DataFrame):
         simulation_dfs = [simulation_dfs]
 
     # id to string
-    dir_ = get_case_dir(id_=test_id, format_=format_, version=version)
+    dir_ = get_case_dir(
+        id_=test_id, format_=format_, version=version, root=output.root
+    )
 
     # solution yaml
     config = {
@@ -576,12 +954,75 @@ def write_solution(
         v1.write_measurement_df,
         simulation_dfs,
         config[SIMULATION_FILES],
+        output=output,
     )
 
     # write yaml
     yaml_file = solution_yaml_name(test_id)
-    with open(os.path.join(dir_, yaml_file), "w") as outfile:
-        yaml.safe_dump(config, outfile, default_flow_style=False)
+    output.write(
+        dir_ / yaml_file, yaml.safe_dump(config, default_flow_style=False)
+    )
+
+
+def _table_from_df(
+    table_cls: type[v2.core.BaseTable], df: pd.DataFrame
+) -> v2.core.BaseTable:
+    """Create a PEtab v2 table from a test case table.
+
+    Empty strings are treated as missing values, as they would be when
+    reading the table from a file.
+    """
+    return table_cls.from_df(df.replace("", np.nan))
+
+
+def _concat_tables(
+    dfs: list[pd.DataFrame] | pd.DataFrame | None, get_df: Callable
+) -> pd.DataFrame | None:
+    """Concatenate PEtab v1 tables as :meth:`petab.v1.Problem.from_yaml`
+    would do for the corresponding files."""
+    if not (dfs := as_list(dfs)):
+        return None
+    return get_df(v1.core.concat_tables(dfs))
+
+
+def _load_model(
+    dir_: Path,
+    model: Path | str | AntimonyModel,
+    model_language: str,
+    model_id: str = None,
+) -> Model:
+    """Load a test case model as PEtab model.
+
+    Model files are relative to `dir_`.
+    """
+    if isinstance(model, AntimonyModel):
+        with phase("antimony"):
+            sbml_str = model.to_sbml_str()
+        with phase("load_model"):
+            return SbmlModel.from_string(sbml_str, model_id=model_id)
+    with phase("load_model"):
+        return model_factory(
+            dir_ / model, model_language=model_language, model_id=model_id
+        )
+
+
+def _write_model(
+    output: FileWriter,
+    model_dir: Path,
+    model: Path | str | AntimonyModel,
+    path: Path,
+) -> None:
+    """Write a model to `path`.
+
+    Antimony models are converted to SBML, model files relative to
+    `model_dir` are copied.
+    """
+    if isinstance(model, AntimonyModel):
+        with phase("antimony"):
+            sbml_str = model.to_sbml_str()
+        output.write(path, sbml_str)
+    else:
+        output.copy(model_dir / model, path)
 
 
 def _write_dfs_to_files(
@@ -591,8 +1032,14 @@ def _write_dfs_to_files(
     dfs: list[pd.DataFrame],
     config_list: list[str] = None,
     skip_empty: bool = False,
+    output: FileWriter = None,
 ):
-    """Write data frames to files and add them to config."""
+    """Write data frames to files and add them to config.
+
+    `writer` is the PEtab function for writing the respective table type,
+    the table is rendered equivalently by :func:`_render_table`.
+    """
+    output = output or FileWriter()
     dfs = [
         df for df in dfs if df is not None and (not skip_empty or not df.empty)
     ]
@@ -600,26 +1047,125 @@ def _write_dfs_to_files(
         if len(dfs) == 1:
             idx = ""
         fname = f"_{name}{idx}.tsv"
-        writer(df, Path(dir_, fname))
+        output.write(Path(dir_, fname), _render_table(writer, df))
         if config_list is not None:
             config_list.append(fname)
 
 
-def load_solution(test_id: int | str, format: str, version: str):
-    dir_ = get_case_dir(test_id, format, version=version)
+#: PEtab table writers, and the corresponding table getters and whether the
+#:  writers include the index, for rendering tables without writing files
+_TABLE_RENDERERS = {
+    v1.write_condition_df: (v1.get_condition_df, True),
+    v1.write_mapping_df: (v1.get_mapping_df, True),
+    v1.write_measurement_df: (v1.get_measurement_df, False),
+    v1.write_observable_df: (v1.get_observable_df, True),
+    v1.write_parameter_df: (v1.get_parameter_df, True),
+    v2.write_condition_df: (v2.get_condition_df, False),
+    v2.write_experiment_df: (v2.get_experiment_df, False),
+}
 
-    # load yaml
-    yaml_file = solution_yaml_name(test_id)
-    with open(os.path.join(dir_, yaml_file)) as f:
-        config = yaml.full_load(f)
 
-    # load data
-    simulation_dfs = [
-        pd.read_csv(os.path.join(dir_, simulation_file), sep="\t")
-        for simulation_file in config[SIMULATION_FILES]
-    ]
+def _render_table(writer: Callable, df: pd.DataFrame) -> str:
+    """Render a PEtab table to a string, as `writer` would write it."""
+    get_df, index = _TABLE_RENDERERS[writer]
+    with phase("write_tables"):
+        return get_df(df).to_csv(sep="\t", index=index)
+
+
+def load_solution(
+    test_id: int | str,
+    format: str,
+    version: str,
+    root: Path | str = None,
+    as_solutions: bool = False,
+):
+    """Load the solution of a test case.
+
+    Solutions are read from the solution bundle of the PEtab version and
+    model format, if it contains the test case, without accessing the
+    solution files (see :mod:`petabtests.bundle`). Otherwise, solutions
+    are read from the solution files, which are memoized per process until
+    they change.
+
+    Parameters
+    ----------
+    test_id: Test case ID
+    format: Model format (SBML/PySB)
+    version: PEtab version
+    root: Root directory of the test suite (see :func:`get_case_dir`).
+    as_solutions: Whether to return the simulation tables as
+        :class:`petabtests.solution.Solution` objects, for fast lookup of
+        expected values, instead of DataFrames.
+
+    Returns
+    -------
+    The solution configuration, with the simulation tables under
+    :data:`SIMULATION_DFS`. The returned objects are copies that may be
+    modified.
+    """
+    from .bundle import read_solution_bundle
+
+    bundle = read_solution_bundle(format_=format, version=version, root=root)
+    if bundle is None or test_id_str(test_id) not in bundle:
+        solution = load_solution_files(test_id, format, version, root=root)
+    else:
+        solution = bundle.load_solution(test_id)
 
-    config.pop(SIMULATION_FILES)
-    config[SIMULATION_DFS] = simulation_dfs
+    if as_solutions:
+        solution[SIMULATION_DFS] = [
+            Solution.from_frame(df) for df in solution[SIMULATION_DFS]
+        ]
+    return solution
+
+
+def load_solution_files(
+    test_id: int | str, format: str, version: str, root: Path | str = None
+):
+    """Load the solution of a test case from the solution files, ignoring
+    any solution bundle.
 
+    See :func:`load_solution`.
+    """
+    dir_ = get_case_dir(test_id, format, version=version, root=root)
+
+    yaml_path = dir_ / solution_yaml_name(test_id)
+    config = copy.deepcopy(
+        _load_solution_config(yaml_path, _file_stamp(yaml_path))
+    )
+
+    simulation_files = config.pop(SIMULATION_FILES)
+    config[SIMULATION_DFS] = [
+        _load_simulation_table(path, _file_stamp(path)).copy()
+        for path in (
+            dir_ / simulation_file for simulation_file in simulation_files
+        )
+    ]
     return config
+
+
+def _file_stamp(path: Path) -> tuple[int, int, int]:
+    """Get a stamp of a file that changes when the file is replaced or
+    modified."""
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=SOLUTION_CACHE_SIZE)
+def _load_solution_config(path: Path, stamp: tuple[int, int, int]) -> dict:
+    """Load a solution yaml file.
+
+    `stamp` (see :func:`_file_stamp`) invalidates the memoized result.
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+@functools.lru_cache(maxsize=SOLUTION_CACHE_SIZE)
+def _load_simulation_table(
+    path: Path, stamp: tuple[int, int, int]
+) -> pd.DataFrame:
+    """Load a simulation table file.
+
+    `stamp` (see :func:`_file_stamp`) invalidates the memoized result.
+    """
+    return pd.read_csv(path, sep="\t")
@@ -0,0 +1,229 @@
+"""Validation of the generated PEtab problems.
+
+PEtab problems are validated either in memory (see :func:`lint_problem`), as
+built from the test case definition, or as read from the written files (see
+:func:`lint_problem_files`). Validation results are cached on disk (see
+:mod:`petabtests.cache`), keyed by the content of the written problem YAML
+file, all files it references, and the versions of PEtab and libsbml. A
+problem whose files did not change is not validated again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from importlib.metadata import version as package_version
+from pathlib import Path
+
+import libsbml
+import yaml
+from petab import v1, v2
+
+from .cache import DiskCache
+
+__all__ = [
+    "LintResult",
+    "get_cached_lint_result",
+    "lint_problem",
+    "lint_problem_files",
+]
+
+#: Namespace of the lint result cache
+LINT_CACHE = "lint"
+
+
+@dataclass
+class LintResult:
+    """Result of validating a PEtab problem."""
+
+    #: Whether the problem is valid
+    valid: bool
+    #: Issues found during validation
+    messages: list[str] = field(default_factory=list)
+
+
+def lint_problem(
+    problem: v1.Problem | v2.Problem, version: str, yaml_path: Path = None
+) -> LintResult:
+    """Validate a PEtab problem in memory.
+
+    The problem is invalid if linting fails (PEtab v1) or reports any issue
+    (PEtab v2).
+
+    Parameters
+    ----------
+    problem: The PEtab problem.
+    version: PEtab version of the problem.
+    yaml_path: PEtab problem YAML file the problem was written to. If given,
+        the result is cached for the written files (see
+        :func:`get_cached_lint_result`).
+
+    Returns
+    -------
+    The validation result.
+    """
+    result = _lint(problem, version)
+    if yaml_path is not None:
+        _cache_result(yaml_path, version, result)
+    return result
+
+
+def lint_problem_files(
+    yaml_path: Path, version: str, cache: bool = True
+) -> LintResult:
+    """Validate the PEtab problem defined in `yaml_path`.
+
+    The problem is invalid if it cannot be loaded, or if linting fails
+    (PEtab v1) or reports any issue (PEtab v2).
+
+    Parameters
+    ----------
+    yaml_path: PEtab problem YAML file.
+    version: PEtab version of the problem.
+    cache: Whether to use the lint result cache.
+
+    Returns
+    -------
+    The validation result.
+    """
+    if (
+        cache
+        and (result := get_cached_lint_result(yaml_path, version)) is not None
+    ):
+        return result
+
+    result = _lint(yaml_path, version)
+    if cache:
+        _cache_result(yaml_path, version, result)
+    return result
+
+
+def get_cached_lint_result(yaml_path: Path, version: str) -> LintResult | None:
+    """Get the cached validation result for the PEtab problem defined in
+    `yaml_path`, or ``None`` if it is not cached."""
+    disk_cache = DiskCache(LINT_CACHE)
+    if not disk_cache.enabled:
+        return None
+    data = disk_cache.get(_cache_key(disk_cache, yaml_path, version))
+    if data is None:
+        return None
+    return LintResult(**json.loads(data))
+
+
+def _cache_result(yaml_path: Path, version: str, result: LintResult) -> None:
+    """Cache the validation result for the PEtab problem defined in
+    `yaml_path`."""
+    disk_cache = DiskCache(LINT_CACHE)
+    if not disk_cache.enabled:
+        return
+    disk_cache.put(
+        _cache_key(disk_cache, yaml_path, version),
+        json.dumps(asdict(result)).encode(),
+    )
+
+
+def _lint(problem: v1.Problem | v2.Problem | Path, version: str) -> LintResult:
+    """Validate a PEtab problem, or the PEtab problem defined in a YAML
+    file."""
+    if version == "v1.0.0":
+        return _lint_v1(problem)
+    if version == "v2.0.0":
+        return _lint_v2(problem)
+    raise NotImplementedError(f"Unknown PEtab version {version}")
+
+
+def _lint_v1(problem: v1.Problem | Path) -> LintResult:
+    """Validate a PEtab v1 problem."""
+    from petab.v1.lint import lint_problem as lint_problem_v1
+
+    with _capture_logs("petab") as messages:
+        try:
+            if not isinstance(problem, v1.Problem):
+                v1.validate(problem)
+                problem = v1.Problem.from_yaml(problem)
+        except Exception as e:
+            return LintResult(valid=False, messages=[*messages, repr(e)])
+        valid = not lint_problem_v1(problem)
+    return LintResult(valid=valid, messages=messages)
+
+
+def _lint_v2(problem: v2.Problem | Path) -> LintResult:
+    """Validate a PEtab v2 problem."""
+    from petab.v2.lint import lint_problem as lint_problem_v2
+
+    try:
+        validation_results = lint_problem_v2(problem)
+    except Exception as e:
+        return LintResult(valid=False, messages=[repr(e)])
+    return LintResult(
+        valid=not validation_results,
+        messages=[
+            f"{result.level.name}: {result.message} [{result.task}]"
+            for result in validation_results
+        ],
+    )
+
+
+@contextmanager
+def _capture_logs(logger_name: str) -> Iterator[list[str]]:
+    """Collect the warnings and errors logged to `logger_name` in the
+    enclosed block."""
+    messages = []
+
+    class Handler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            messages.append(f"{record.levelname}: {record.getMessage()}")
+
+    handler = Handler(level=logging.WARNING)
+    logger = logging.getLogger(logger_name)
+    logger.addHandler(handler)
+    try:
+        yield messages
+    finally:
+        logger.removeHandler(handler)
+
+
+def _cache_key(disk_cache: DiskCache, yaml_path: Path, version: str) -> str:
+    """Get the lint cache key for a PEtab problem."""
+    yaml_path = Path(yaml_path)
+    yaml_bytes = yaml_path.read_bytes()
+    parts = [
+        package_version("petab"),
+        libsbml.getLibSBMLDottedVersion(),
+        version,
+        yaml_bytes,
+    ]
+    for file_name in _referenced_files(yaml.safe_load(yaml_bytes)):
+        path = yaml_path.parent / file_name
+        parts.append(file_name)
+        # missing files make the problem invalid, and are part of the key
+        parts.append(path if path.is_file() else b"")
+    return disk_cache.key(*parts)
+
+
+def _referenced_files(config) -> list[str]:
+    """Get the names of all files referenced in a PEtab problem YAML
+    configuration.
+
+    The file names are all string values in the configuration, except for
+    the format version and model languages.
+    """
+    if isinstance(config, dict):
+        return [
+            file_name
+            for key, value in config.items()
+            if key not in {"format_version", "language"}
+            for file_name in _referenced_files(value)
+        ]
+    if isinstance(config, list):
+        return [
+            file_name
+            for value in config
+            for file_name in _referenced_files(value)
+        ]
+    if isinstance(config, str):
+        return [config]
+    return []
@@ -0,0 +1,186 @@
+"""Manifests for incremental test case generation.
+
+Each generated test case directory holds a manifest recording hashes of
+everything the generated files depend on (the case definition module, model
+files, the generator code and the versions of the relevant libraries), and
+hashes of the generated files themselves. A case whose manifest still matches
+does not need to be regenerated.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from .C import BASE_DIR, DEFAULT_PYSB_FILE, DEFAULT_SBML_FILE
+from .cache import file_digest
+from .file import FileWriter
+from .version import __version__
+
+__all__ = [
+    "MANIFEST_FILE",
+    "create_manifest",
+    "is_up_to_date",
+    "read_manifest",
+    "write_manifest",
+]
+
+#: Name of the manifest file inside a test case directory
+MANIFEST_FILE = "_manifest.json"
+
+#: Modules of the generator whose code affects the generated files. Changes
+#:  to the other modules, e.g., the evaluation code, do not invalidate any
+#:  manifest.
+GENERATOR_MODULES = (
+    "C.py",
+    "antimony.py",
+    "catalog.py",
+    "core.py",
+    "file.py",
+    "manifest.py",
+    "model.py",
+    "residuals.py",
+    "util.py",
+)
+
+INPUTS = "inputs"
+OUTPUTS = "outputs"
+VERSIONS = "versions"
+
+
+def create_manifest(case_dir: Path, output_dir: Path = None) -> dict:
+    """Create the manifest for the current state of a test case directory.
+
+    Parameters
+    ----------
+    case_dir: Directory of the test case definition.
+    output_dir: Directory of the generated files of the test case.
+        Defaults to `case_dir`.
+
+    Returns
+    -------
+    The manifest as dictionary.
+    """
+    return {
+        VERSIONS: _get_versions(),
+        INPUTS: _get_input_digests(case_dir),
+        OUTPUTS: {
+            path.name: file_digest(path)
+            for path in _get_output_files(output_dir or case_dir)
+        },
+    }
+
+
+def write_manifest(case_dir: Path, output_dir: Path = None) -> None:
+    """Write the manifest for the current state of a test case directory to
+    `output_dir` (see :func:`create_manifest`)."""
+    manifest = create_manifest(case_dir, output_dir)
+    FileWriter().write(
+        (output_dir or case_dir) / MANIFEST_FILE,
+        json.dumps(manifest, indent=2, sort_keys=True) + "\n",
+    )
+
+
+def read_manifest(case_dir: Path) -> dict | None:
+    """Read the manifest of a test case directory.
+
+    For test cases generated to a different directory than their definition,
+    `case_dir` is the directory of the generated files.
+
+    Returns
+    -------
+    The manifest, or ``None`` if there is no readable manifest.
+    """
+    try:
+        with open(case_dir / MANIFEST_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_up_to_date(
+    case_dir: Path, manifest: dict | None, output_dir: Path = None
+) -> bool:
+    """Check whether the generated files of a test case are up to date.
+
+    This is the case if neither the inputs nor the generator changed since
+    the manifest was written, and all generated files recorded in the
+    manifest are still present and unmodified.
+
+    Parameters
+    ----------
+    case_dir: Directory of the test case definition.
+    manifest: The manifest of the generated files.
+    output_dir: Directory of the generated files of the test case.
+        Defaults to `case_dir`.
+    """
+    if not manifest:
+        return False
+
+    if manifest.get(VERSIONS) != _get_versions():
+        return False
+
+    if manifest.get(INPUTS) != _get_input_digests(case_dir):
+        return False
+
+    for name, digest in manifest.get(OUTPUTS, {}).items():
+        path = (output_dir or case_dir) / name
+        if not path.is_file() or file_digest(path) != digest:
+            return False
+
+    return True
+
+
+def _get_input_digests(case_dir: Path) -> dict[str, str]:
+    """Hash all files in the case directory that are not generated, and the
+    default model files."""
+    digests = {
+        path.name: file_digest(path) for path in _get_input_files(case_dir)
+    }
+    digests["DEFAULT_SBML_FILE"] = file_digest(DEFAULT_SBML_FILE)
+    digests["DEFAULT_PYSB_FILE"] = file_digest(DEFAULT_PYSB_FILE)
+    return digests
+
+
+def _get_input_files(case_dir: Path) -> list[Path]:
+    """Get the files of a test case directory that were not generated."""
+    return sorted(
+        path
+        for path in case_dir.iterdir()
+        if path.is_file()
+        and not path.name.startswith("_")
+        and path.name != "README.md"
+    )
+
+
+def _get_output_files(case_dir: Path) -> list[Path]:
+    """Get the generated files of a test case directory."""
+    return sorted(
+        path
+        for path in case_dir.iterdir()
+        if path.is_file()
+        and (path.name.startswith("_") or path.name == "README.md")
+        and path.name != MANIFEST_FILE
+    )
+
+
+@functools.cache
+def _get_versions() -> dict[str, str]:
+    """Get the versions of everything involved in generating test cases."""
+    versions = {"petabtests": __version__}
+    for package in ("petab", "antimony"):
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = None
+
+    # the generator code itself may change without a version bump
+    hasher = hashlib.sha256()
+    for module in GENERATOR_MODULES:
+        hasher.update((BASE_DIR / module).read_bytes())
+    versions["generator"] = hasher.hexdigest()
+
+    return versions
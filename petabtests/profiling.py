@@ -0,0 +1,275 @@
+"""Timing and profiling of test case generation.
+
+While a test case is generated inside :func:`profile_case`, the wall and CPU
+time spent in the different generation phases (see :func:`phase`) is
+recorded. Outside of :func:`profile_case`, :func:`phase` does nothing.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import cProfile
+import csv
+import json
+import marshal
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+__all__ = [
+    "CaseProfile",
+    "PhaseTiming",
+    "format_profile_summary",
+    "phase",
+    "profile_case",
+    "write_profile_report",
+]
+
+#: Name of the pseudo-phase for time not spent in any recorded phase
+OTHER_PHASE = "other"
+
+#: The profile of the test case currently being generated
+_current_profile: contextvars.ContextVar[CaseProfile | None] = (
+    contextvars.ContextVar("_current_profile", default=None)
+)
+
+
+@dataclass
+class PhaseTiming:
+    """Time spent in a generation phase."""
+
+    #: Wall time in seconds
+    wall: float = 0.0
+    #: CPU time of the current process in seconds
+    cpu: float = 0.0
+    #: Number of times the phase was entered
+    calls: int = 0
+
+
+@dataclass
+class CaseProfile:
+    """Timings of the generation of a single test case."""
+
+    version: str
+    format: str
+    id: str
+    #: Total time
+    total: PhaseTiming = field(default_factory=PhaseTiming)
+    #: Time per phase, in order of first occurrence
+    phases: dict[str, PhaseTiming] = field(default_factory=dict)
+    #: cProfile statistics (see :meth:`cProfile.Profile.create_stats`), if
+    #:  requested
+    stats: dict | None = field(default=None, repr=False)
+
+    @property
+    def name(self) -> str:
+        """Human-readable identifier of the test case."""
+        return f"{self.version}/{self.format} #{self.id}"
+
+    def add(self, other: CaseProfile) -> None:
+        """Add the timings of another profile of the same test case, e.g.,
+        of a later stage of generating it."""
+        self.total.wall += other.total.wall
+        self.total.cpu += other.total.cpu
+        for name, timing in other.phases.items():
+            total = self.phases.setdefault(name, PhaseTiming())
+            total.wall += timing.wall
+            total.cpu += timing.cpu
+            total.calls += timing.calls
+
+    def phases_with_other(self) -> dict[str, PhaseTiming]:
+        """The timings per phase, including the time not spent in any
+        phase."""
+        other = PhaseTiming(
+            wall=self.total.wall - sum(p.wall for p in self.phases.values()),
+            cpu=self.total.cpu - sum(p.cpu for p in self.phases.values()),
+            calls=1,
+        )
+        return {**self.phases, OTHER_PHASE: other}
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "version": self.version,
+            "format": self.format,
+            "id": self.id,
+            "total": asdict(self.total),
+            "phases": {
+                name: asdict(timing)
+                for name, timing in self.phases_with_other().items()
+            },
+        }
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Record the time spent in the enclosed block as generation phase
+    `name` of the test case that is currently profiled.
+
+    Phases should not be nested, as the time of nested phases would be
+    counted twice.
+    """
+    if (profile := _current_profile.get()) is None:
+        yield
+        return
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield
+    finally:
+        timing = profile.phases.setdefault(name, PhaseTiming())
+        timing.wall += time.perf_counter() - wall_start
+        timing.cpu += time.process_time() - cpu_start
+        timing.calls += 1
+
+
+@contextmanager
+def profile_case(
+    version: str, format_: str, id_: str, cprofile: bool = False
+) -> Iterator[CaseProfile]:
+    """Profile the generation of a test case in the enclosed block.
+
+    Parameters
+    ----------
+    version: PEtab version
+    format_: Model format (SBML/PySB)
+    id_: Test case ID
+    cprofile: Whether to additionally collect :mod:`cProfile` statistics.
+
+    Returns
+    -------
+    The profile, which is complete after the block was left.
+    """
+    profile = CaseProfile(version=version, format=format_, id=id_)
+    token = _current_profile.set(profile)
+    profiler = cProfile.Profile() if cprofile else None
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    if profiler:
+        profiler.enable()
+    try:
+        yield profile
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.create_stats()
+            profile.stats = profiler.stats
+        profile.total = PhaseTiming(
+            wall=time.perf_counter() - wall_start,
+            cpu=time.process_time() - cpu_start,
+            calls=1,
+        )
+        _current_profile.reset(token)
+
+
+def write_profile_report(
+    profiles: Iterable[CaseProfile], output_dir: Path | str, top: int = 0
+) -> None:
+    """Write the timings of the given test cases to ``profile.json`` and
+    ``profile.csv`` in `output_dir`.
+
+    Parameters
+    ----------
+    profiles: The test case profiles.
+    output_dir: Directory for the report files.
+    top: Number of slowest test cases for which to dump cProfile statistics
+        (``{version}_{format}_{id}.prof``, to be read with :mod:`pstats`).
+        Only cases that were profiled with `cprofile` are considered.
+    """
+    profiles = _rank(profiles)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    with open(output_dir / "profile.json", "w") as f:
+        json.dump([p.to_dict() for p in profiles], f, indent=2)
+        f.write("\n")
+
+    with open(output_dir / "profile.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            ["version", "format", "id", "phase", "wall", "cpu", "calls"]
+        )
+        for p in profiles:
+            for name, timing in [
+                ("total", p.total),
+                *p.phases_with_other().items(),
+            ]:
+                writer.writerow(
+                    [
+                        p.version,
+                        p.format,
+                        p.id,
+                        name,
+                        timing.wall,
+                        timing.cpu,
+                        timing.calls,
+                    ]
+                )
+
+    for p in [p for p in profiles if p.stats is not None][:top]:
+        with open(
+            output_dir / f"{p.version}_{p.format}_{p.id}.prof", "wb"
+        ) as f:
+            marshal.dump(p.stats, f)
+
+
+def format_profile_summary(
+    profiles: Iterable[CaseProfile], n: int = 10
+) -> str:
+    """Summarize the given test case profiles.
+
+    The summary ranks the phases by their total wall time across all test
+    cases, and lists the `n` slowest test cases with their slowest phase.
+    """
+    profiles = _rank(profiles)
+    if not profiles:
+        return "No test cases were profiled."
+
+    totals: dict[str, PhaseTiming] = {}
+    for p in profiles:
+        for name, timing in p.phases_with_other().items():
+            total = totals.setdefault(name, PhaseTiming())
+            total.wall += timing.wall
+            total.cpu += timing.cpu
+            total.calls += timing.calls
+    wall = sum(p.total.wall for p in profiles)
+
+    lines = [
+        f"Profiled {len(profiles)} test case(s), total wall time "
+        f"{wall:.3f}s.",
+        "",
+        f"{'phase':<20} {'wall [s]':>10} {'cpu [s]':>10} {'share':>7} "
+        f"{'calls':>6}",
+    ]
+    for name, timing in sorted(
+        totals.items(), key=lambda item: item[1].wall, reverse=True
+    ):
+        share = timing.wall / wall if wall else 0
+        lines.append(
+            f"{name:<20} {timing.wall:>10.3f} {timing.cpu:>10.3f} "
+            f"{share:>7.1%} {timing.calls:>6}"
+        )
+
+    lines += [
+        "",
+        f"{'slowest test cases':<20} {'wall [s]':>10} {'cpu [s]':>10}  "
+        "slowest phase",
+    ]
+    for p in profiles[:n]:
+        name, timing = max(
+            p.phases_with_other().items(), key=lambda item: item[1].wall
+        )
+        lines.append(
+            f"{p.name:<20} {p.total.wall:>10.3f} {p.total.cpu:>10.3f}  "
+            f"{name} ({timing.wall:.3f}s)"
+        )
+    return "\n".join(lines)
+
+
+def _rank(profiles: Iterable[CaseProfile]) -> list[CaseProfile]:
+    """Sort profiles by decreasing wall time."""
+    return sorted(profiles, key=lambda p: p.total.wall, reverse=True)
@@ -0,0 +1,494 @@
+"""Residuals, chi2 and log-likelihood of the expected simulation results.
+
+This computes the same values as ``petab.v1.calculate`` and
+``petab.v2.calculate``, but evaluates the residuals only once for both chi2
+and log-likelihood, matches measurements and simulations via a join on
+integer-coded keys instead of scanning the simulation table for each
+measurement, parses parameter overrides once per distinct value, and
+evaluates the noise formulas vectorized over all measurements of an
+observable.
+"""
+
+from __future__ import annotations
+
+import functools
+import numbers
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import petab.v1.C as C1
+import petab.v2.C as C2
+import sympy as sp
+from petab.v1 import split_parameter_replacement_list
+from petab.v1.math import sympify_petab
+
+from .C import LLH
+from .util import as_list
+
+__all__ = ["NOISE_VALUE", "Residuals", "compute_residuals"]
+
+#: Column of the noise standard deviation in the residual tables
+NOISE_VALUE = "noiseValue"
+
+
+@dataclass
+class Residuals:
+    """Residuals of a set of simulation tables."""
+
+    #: For each measurement table, a copy with the matched simulation
+    #:  (``simulation``), the noise standard deviation (``noiseValue``), the
+    #:  normalized residual (``residual``) and the log-likelihood
+    #:  contribution (``llh``) of each measurement.
+    residual_dfs: list[pd.DataFrame]
+    #: Sum of squared normalized residuals
+    chi2: float
+    #: Log-likelihood
+    llh: float
+
+
+def compute_residuals(
+    measurement_dfs: list[pd.DataFrame] | pd.DataFrame,
+    simulation_dfs: list[pd.DataFrame] | pd.DataFrame,
+    observable_dfs: list[pd.DataFrame] | pd.DataFrame,
+    parameter_df: pd.DataFrame,
+    version: str = "v2.0.0",
+) -> Residuals:
+    """Compute residuals, chi2 and log-likelihood.
+
+    Parameters
+    ----------
+    measurement_dfs: PEtab measurement tables.
+    simulation_dfs: Simulation tables corresponding to the measurement tables.
+    observable_dfs: PEtab observable tables.
+    parameter_df: PEtab parameter table.
+    version: PEtab version of the tables.
+
+    Returns
+    -------
+    The residuals, chi2 and log-likelihood.
+    """
+    measurement_dfs = as_list(measurement_dfs)
+    simulation_dfs = as_list(simulation_dfs)
+    if len(measurement_dfs) != len(simulation_dfs):
+        raise ValueError(
+            "Number of measurement tables and simulation tables differ."
+        )
+
+    observable_df = _indexed(
+        pd.concat(as_list(observable_dfs)), C1.OBSERVABLE_ID
+    )
+    parameter_df = _indexed(parameter_df, C1.PARAMETER_ID)
+    nominal_values = dict(
+        zip(parameter_df.index, parameter_df[C1.NOMINAL_VALUE], strict=True)
+    )
+    observables = {
+        observable_id: _Observable.from_row(observable_id, row, version)
+        for observable_id, row in observable_df.iterrows()
+    }
+
+    residual_dfs = [
+        _compute_residuals_for_table(
+            measurement_df,
+            simulation_df,
+            observables,
+            nominal_values,
+            version,
+        )
+        for measurement_df, simulation_df in zip(
+            measurement_dfs, simulation_dfs, strict=True
+        )
+    ]
+
+    # aggregate as petab does, to get identical results
+    chi2 = float(
+        sum(float((df[C1.RESIDUAL].values ** 2).sum()) for df in residual_dfs)
+    )
+    llh = float(sum(sum(df[LLH].tolist()) for df in residual_dfs))
+    return Residuals(residual_dfs=residual_dfs, chi2=chi2, llh=llh)
+
+
+@dataclass
+class _Observable:
+    """Noise model of an observable."""
+
+    id: str
+    #: Noise formula
+    noise_formula: str | numbers.Number
+    #: Scale on which the noise model is applied
+    scale: str
+    #: Noise distribution on `scale`
+    distribution: str
+    #: Observable and noise placeholders (PEtab v2 only)
+    placeholders: list[str]
+
+    @staticmethod
+    def from_row(observable_id: str, row: pd.Series, version: str):
+        noise_distribution = _get(row, C1.NOISE_DISTRIBUTION) or C1.NORMAL
+        placeholders = []
+        if version == "v1.0.0":
+            scale = _get(row, C1.OBSERVABLE_TRANSFORMATION) or C1.LIN
+        else:
+            if noise_distribution.startswith("log-"):
+                scale = C2.LOG
+                noise_distribution = noise_distribution.removeprefix("log-")
+            elif noise_distribution.startswith("log10-"):
+                scale = C2.LOG10
+                noise_distribution = noise_distribution.removeprefix("log10-")
+            else:
+                scale = C2.LIN
+            placeholders = [
+                placeholder.strip()
+                for column in (
+                    C2.OBSERVABLE_PLACEHOLDERS,
+                    C2.NOISE_PLACEHOLDERS,
+                )
+                for placeholder in str(_get(row, column) or "").split(
+                    C2.PARAMETER_SEPARATOR
+                )
+                if placeholder.strip()
+            ]
+        return _Observable(
+            id=observable_id,
+            noise_formula=row[C1.NOISE_FORMULA],
+            scale=scale,
+            distribution=noise_distribution,
+            placeholders=placeholders,
+        )
+
+
+def _compute_residuals_for_table(
+    measurement_df: pd.DataFrame,
+    simulation_df: pd.DataFrame,
+    observables: dict[str, _Observable],
+    nominal_values: dict[str, numbers.Number],
+    version: str,
+) -> pd.DataFrame:
+    """Compute residuals for a single measurement table."""
+    residual_df = measurement_df.reset_index(drop=True)
+    residual_df[C1.SIMULATION] = simulation_df[C1.SIMULATION].values[
+        _match_simulations(residual_df, simulation_df)
+    ]
+    measurements = residual_df[C1.MEASUREMENT].values.astype(float)
+    simulations = residual_df[C1.SIMULATION].values.astype(float)
+
+    noise_values = np.empty(len(residual_df))
+    residuals = np.empty(len(residual_df))
+    llhs = np.empty(len(residual_df))
+    for observable_id, rows in residual_df.groupby(
+        C1.OBSERVABLE_ID, sort=False
+    ).indices.items():
+        observable = observables[observable_id]
+        noise_values[rows] = _evaluate_noise_formula(
+            observable,
+            residual_df.iloc[rows],
+            simulations[rows],
+            nominal_values,
+            version,
+        )
+        residuals[rows] = (
+            _scale(measurements[rows], observable.scale)
+            - _scale(simulations[rows], observable.scale)
+        ) / noise_values[rows]
+        llhs[rows] = _llh(
+            measurements[rows],
+            simulations[rows],
+            noise_values[rows],
+            observable.scale,
+            observable.distribution,
+        )
+
+    residual_df[NOISE_VALUE] = noise_values
+    residual_df[C1.RESIDUAL] = residuals
+    residual_df[LLH] = llhs
+    return residual_df.drop(columns=C1.MEASUREMENT)
+
+
+def _match_simulations(
+    measurement_df: pd.DataFrame, simulation_df: pd.DataFrame
+) -> np.ndarray:
+    """Find the simulation table row for each measurement.
+
+    Measurements and simulations are matched on all columns they have in
+    common, where empty measurement table entries match anything. The first
+    matching simulation is used. Multiple matching simulations must be
+    identical.
+
+    Rows are matched via integer keys, vectorized over all measurements with
+    the same empty columns.
+
+    Returns
+    -------
+    Positional index into `simulation_df` for each measurement.
+    """
+    simulation_df = simulation_df.reset_index(drop=True)
+    n_measurements = len(measurement_df)
+    columns = [
+        col
+        for col in measurement_df.columns
+        if col in simulation_df.columns and col != C1.SIMULATION
+    ]
+    empty = np.column_stack(
+        [_is_empty(measurement_df[col]) for col in columns]
+    ).reshape(n_measurements, len(columns))
+
+    # integer codes of the values, shared between both tables, with -1 for
+    #  missing values
+    codes = np.empty((n_measurements + len(simulation_df), len(columns)), int)
+    for i_col, col in enumerate(columns):
+        codes[:, i_col], _ = pd.factorize(
+            np.concatenate(
+                [
+                    measurement_df[col].values.astype(object),
+                    simulation_df[col].values.astype(object),
+                ]
+            ),
+            use_na_sentinel=True,
+        )
+    measurement_codes = codes[:n_measurements]
+    simulation_codes = codes[n_measurements:]
+    # equal simulation table rows have equal IDs
+    simulation_ids, _ = _unique_rows(_factorize_columns(simulation_df))
+
+    matches = np.empty(n_measurements, int)
+    # measurements with the same empty columns are matched on the same keys
+    patterns, pattern_idxs = np.unique(empty, axis=0, return_inverse=True)
+    for i_pattern, pattern in enumerate(patterns):
+        meas_rows = np.flatnonzero(pattern_idxs.ravel() == i_pattern)
+        key_cols = np.flatnonzero(~pattern)
+        # missing simulation values never match
+        sim_rows = np.flatnonzero(
+            (simulation_codes[:, key_cols] != -1).all(axis=1)
+        )
+        keys, _ = _unique_rows(
+            np.concatenate(
+                [
+                    measurement_codes[np.ix_(meas_rows, key_cols)],
+                    simulation_codes[np.ix_(sim_rows, key_cols)],
+                ]
+            )
+        )
+        meas_keys, sim_keys = keys[: len(meas_rows)], keys[len(meas_rows) :]
+        n_keys = len(keys) and keys.max() + 1
+
+        # first simulation and number of different simulations per key
+        first_sims = np.full(n_keys, -1)
+        sim_key_values, first_idxs = np.unique(sim_keys, return_index=True)
+        first_sims[sim_key_values] = sim_rows[first_idxs]
+        distinct = np.unique(
+            np.column_stack([sim_keys, simulation_ids[sim_rows]]), axis=0
+        )
+        n_distinct = np.bincount(distinct[:, 0], minlength=n_keys)
+
+        if (unmatched := np.flatnonzero(first_sims[meas_keys] == -1)).size:
+            raise ValueError(
+                "Could not find simulation for measurement "
+                f"{measurement_df.iloc[meas_rows[unmatched[0]]]}."
+            )
+        if (ambiguous := np.flatnonzero(n_distinct[meas_keys] > 1)).size:
+            rows = sim_rows[sim_keys == meas_keys[ambiguous[0]]]
+            raise ValueError(
+                "Multiple different simulations found for measurement "
+                f"{measurement_df.iloc[meas_rows[ambiguous[0]]]}:\n"
+                f"{simulation_df.iloc[rows]}"
+            )
+        matches[meas_rows] = first_sims[meas_keys]
+    return matches
+
+
+def _evaluate_noise_formula(
+    observable: _Observable,
+    measurement_df: pd.DataFrame,
+    simulations: np.ndarray,
+    nominal_values: dict[str, numbers.Number],
+    version: str,
+) -> np.ndarray:
+    """Evaluate the noise formula of `observable` for the given
+    measurements of that observable."""
+    symbols, func = _compile_formula(observable.noise_formula)
+
+    # measurement-specific overrides, parsed once per distinct combination
+    #  of override columns
+    override_df = measurement_df[
+        [
+            col
+            for col in (C2.OBSERVABLE_PARAMETERS, C1.NOISE_PARAMETERS)
+            if col in measurement_df.columns
+        ]
+    ]
+    override_idxs, first_rows = _unique_rows(_factorize_columns(override_df))
+    overrides = [
+        _get_overrides(observable, row, version)
+        for row in override_df.iloc[first_rows].to_dict("records")
+    ]
+
+    args = []
+    for symbol in symbols:
+        # parameters take precedence over the observable, which takes
+        #  precedence over placeholders
+        if symbol in nominal_values:
+            args.append(nominal_values[symbol])
+        elif symbol == observable.id:
+            args.append(simulations)
+        elif all(symbol in row_overrides for row_overrides in overrides):
+            values = np.array(
+                [
+                    nominal_values[value] if isinstance(value, str) else value
+                    for value in (
+                        row_overrides[symbol] for row_overrides in overrides
+                    )
+                ],
+                dtype=float,
+            )
+            args.append(values[override_idxs])
+        else:
+            raise ValueError(
+                "Cannot replace all parameters in noise formula "
+                f"{observable.noise_formula} for observable {observable.id}. "
+                f"Missing {symbol}. Note that model states are currently not "
+                "supported."
+            )
+
+    return np.broadcast_to(
+        np.asarray(func(*args), dtype=float), simulations.shape
+    )
+
+
+def _get_overrides(
+    observable: _Observable, row: dict, version: str
+) -> dict[str, numbers.Number | str]:
+    """Get the placeholder overrides of a measurement table row."""
+    noise_overrides = split_parameter_replacement_list(
+        row.get(C1.NOISE_PARAMETERS)
+    )
+    if version == "v1.0.0":
+        return {
+            f"noiseParameter{i + 1}_{observable.id}": value
+            for i, value in enumerate(noise_overrides)
+        }
+
+    observable_overrides = split_parameter_replacement_list(
+        row.get(C2.OBSERVABLE_PARAMETERS)
+    )
+    return dict(
+        zip(
+            observable.placeholders,
+            observable_overrides + noise_overrides,
+            strict=False,
+        )
+    )
+
+
+@functools.cache
+def _compile_formula(
+    formula: str | numbers.Number,
+) -> tuple[tuple[str, ...], Callable]:
+    """Compile a PEtab math expression to a NumPy function.
+
+    Returns
+    -------
+    The names of the arguments, and the function.
+    """
+    expr = sympify_petab(formula)
+    symbols = sorted(expr.free_symbols, key=lambda symbol: symbol.name)
+    func = sp.lambdify(symbols, expr, modules="numpy")
+    return tuple(symbol.name for symbol in symbols), func
+
+
+def _scale(values: np.ndarray, scale: str) -> np.ndarray:
+    """Apply the observable transformation `scale`."""
+    if scale == C1.LIN:
+        return values
+    if scale == C1.LOG:
+        return np.log(values)
+    if scale == C1.LOG10:
+        with np.errstate(divide="ignore"):
+            return np.log10(values)
+    raise ValueError(f"Invalid observable transformation: {scale}")
+
+
+def _llh(
+    m: np.ndarray,
+    s: np.ndarray,
+    sigma: np.ndarray,
+    scale: str,
+    noise_distribution: str,
+) -> np.ndarray:
+    """Compute the log-likelihood contributions of measurements `m` given
+    simulations `s` and noise parameters `sigma`."""
+    pi, log, log10 = np.pi, np.log, np.log10
+
+    if noise_distribution == C1.NORMAL and scale == C1.LIN:
+        nllh = 0.5 * log(2 * pi * sigma**2) + 0.5 * ((s - m) / sigma) ** 2
+    elif noise_distribution == C1.NORMAL and scale == C1.LOG:
+        nllh = (
+            0.5 * log(2 * pi * sigma**2 * m**2)
+            + 0.5 * ((log(s) - log(m)) / sigma) ** 2
+        )
+    elif noise_distribution == C1.NORMAL and scale == C1.LOG10:
+        nllh = (
+            0.5 * log(2 * pi * sigma**2 * m**2 * log(10) ** 2)
+            + 0.5 * ((log10(s) - log10(m)) / sigma) ** 2
+        )
+    elif noise_distribution == C1.LAPLACE and scale == C1.LIN:
+        nllh = log(2 * sigma) + abs((s - m) / sigma)
+    elif noise_distribution == C1.LAPLACE and scale == C1.LOG:
+        nllh = log(2 * sigma * m) + abs((log(s) - log(m)) / sigma)
+    elif noise_distribution == C1.LAPLACE and scale == C1.LOG10:
+        nllh = log(2 * sigma * m * log(10)) + abs(
+            (log10(s) - log10(m)) / sigma
+        )
+    else:
+        raise NotImplementedError(
+            "Unsupported combination of noise_distribution and scale "
+            f"specified: {noise_distribution}, {scale}."
+        )
+    return -nllh
+
+
+def _get(row: pd.Series, column: str):
+    """Get a table entry, or ``None`` if it is missing or empty."""
+    value = row.get(column)
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return value
+
+
+def _is_empty(values: pd.Series) -> np.ndarray:
+    """Check which table entries are empty."""
+    return (values.isna() | (values.astype(object) == "")).values
+
+
+def _factorize_columns(df: pd.DataFrame) -> np.ndarray:
+    """Encode each column of a table as integers, with equal values, including
+    missing values, having equal codes."""
+    codes = np.empty(df.shape, int)
+    for i_col in range(df.shape[1]):
+        codes[:, i_col], _ = pd.factorize(
+            df.iloc[:, i_col], use_na_sentinel=False
+        )
+    return codes
+
+
+def _unique_rows(codes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Number the distinct rows of an integer matrix.
+
+    Returns
+    -------
+    The number of each row, and the position of the first occurrence of
+    each distinct row.
+    """
+    if not codes.shape[1]:
+        codes = np.zeros((len(codes), 1), int)
+    _, first, inverse = np.unique(
+        codes, axis=0, return_index=True, return_inverse=True
+    )
+    return inverse.ravel(), first
+
+
+def _indexed(df: pd.DataFrame, id_column: str) -> pd.DataFrame:
+    """Index a PEtab table by its ID column, if it is not yet."""
+    if id_column in df.columns:
+        return df.set_index(id_column)
+    return df
@@ -0,0 +1,235 @@
+"""Ground truth simulations with fast point lookup."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+from petab.v1.C import SIMULATION, TIME
+
+__all__ = ["Solution"]
+
+
+class Solution:
+    """The ground truth simulation table of a test case, for looking up
+    expected values.
+
+    Simulations are identified by observable, experiment (PEtab v2) or
+    simulation condition (PEtab v1), optionally preequilibration condition
+    (PEtab v1), and time. Times must match exactly. IDs are stored as integer
+    codes into their distinct values, with ``-1`` for missing IDs.
+
+    Use :meth:`from_frame` to create a solution from a simulation table.
+    """
+
+    __slots__ = (
+        "id_columns",
+        "codes",
+        "categories",
+        "times",
+        "values",
+        "_other_columns",
+        "_columns",
+        "_dtypes",
+        "_index",
+        "_index_positions",
+        "_lookup",
+    )
+
+    def __init__(
+        self,
+        id_columns: Sequence[str],
+        codes: Sequence[np.ndarray],
+        categories: Sequence[pd.Index],
+        times: np.ndarray,
+        values: np.ndarray,
+        other_columns: dict[str, np.ndarray] = None,
+        columns: Sequence[str] = None,
+        dtypes: dict[str, object] = None,
+    ):
+        #: ID columns identifying a simulation besides time: observable,
+        #:  experiment or simulation condition, and optionally
+        #:  preequilibration condition
+        self.id_columns = tuple(id_columns)
+        #: Integer codes of the IDs per ID column
+        self.codes = tuple(np.asarray(c, dtype=np.int32) for c in codes)
+        #: Distinct IDs per ID column
+        self.categories = tuple(pd.Index(c, dtype=object) for c in categories)
+        #: Simulation times
+        self.times = np.asarray(times, dtype=float)
+        #: Expected simulated values
+        self.values = np.asarray(values, dtype=float)
+        self._other_columns = other_columns or {}
+        self._columns = (
+            list(columns)
+            if columns is not None
+            else [*self.id_columns, TIME, SIMULATION]
+        )
+        self._dtypes = dtypes or {}
+
+        # distinct keys, and the position of their expected value, or -1 if
+        #  the rows with that key have different values
+        keys = pd.MultiIndex.from_arrays([*self.codes, self.times])
+        first = ~keys.duplicated()
+        positions = np.flatnonzero(first)
+        if not first.all():
+            key_df = pd.DataFrame(
+                {f"{i}": level for i, level in enumerate([*self.codes])}
+            ).assign(time=self.times, value=self.values)
+            n_values = key_df.groupby(
+                list(key_df.columns[:-1]), sort=False, dropna=False
+            )["value"].transform("nunique", dropna=False)
+            positions[n_values.to_numpy()[positions] > 1] = -1
+        self._index = keys[first]
+        self._index_positions = positions
+        # built on the first scalar lookup
+        self._lookup = None
+
+    @classmethod
+    def from_frame(cls, simulation_df: pd.DataFrame) -> Solution:
+        """Create a solution from a PEtab simulation table."""
+        from .evaluate import _get_grouping_columns
+
+        id_columns = [
+            col for col in _get_grouping_columns(simulation_df) if col != TIME
+        ]
+        codes, categories = zip(
+            *(pd.factorize(simulation_df[col]) for col in id_columns),
+            strict=True,
+        )
+        return cls(
+            id_columns=id_columns,
+            codes=codes,
+            categories=categories,
+            times=simulation_df[TIME].to_numpy(dtype=float),
+            values=simulation_df[SIMULATION].to_numpy(dtype=float),
+            other_columns={
+                col: simulation_df[col].array
+                for col in simulation_df.columns
+                if col not in {*id_columns, TIME, SIMULATION}
+            },
+            columns=simulation_df.columns,
+            dtypes=simulation_df.dtypes.to_dict(),
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} with {len(self)} simulations>"
+
+    def expected(
+        self,
+        observable_id: str,
+        experiment_id: str,
+        time: float,
+        preequilibration_condition_id: str = None,
+    ) -> float:
+        """Get the expected value of a simulation.
+
+        Parameters
+        ----------
+        observable_id: Observable ID
+        experiment_id: Experiment ID (PEtab v2) or simulation condition ID
+            (PEtab v1)
+        time: Simulation time
+        preequilibration_condition_id: Preequilibration condition ID
+            (PEtab v1), if any.
+
+        Raises
+        ------
+        KeyError: If there is no such simulation.
+        ValueError: If there are multiple such simulations with different
+            values.
+        """
+        if self._lookup is None:
+            ids = (
+                _decode(
+                    self._index.get_level_values(i).to_numpy(),
+                    categories,
+                    missing=None,
+                )
+                for i, categories in enumerate(self.categories)
+            )
+            self._lookup = dict(
+                zip(
+                    zip(*ids, self._index.get_level_values(-1)),
+                    self._index_positions,
+                )
+            )
+        key = (observable_id, experiment_id)
+        if len(self.id_columns) > 2:
+            key += (preequilibration_condition_id,)
+        elif preequilibration_condition_id is not None:
+            raise KeyError(
+                "This solution does not have preequilibration conditions."
+            )
+        position = self._lookup[(*key, time)]
+        if position == -1:
+            raise ValueError(
+                f"Multiple different expected values for {(*key, time)}."
+            )
+        return self.values[position]
+
+    def expected_values(
+        self,
+        observable_ids: Sequence[str],
+        experiment_ids: Sequence[str],
+        times: Sequence[float],
+        preequilibration_condition_ids: Sequence[str] = None,
+    ) -> np.ndarray:
+        """Get the expected values of multiple simulations.
+
+        See :meth:`expected`.
+
+        Returns
+        -------
+        The expected values, or NaN for simulations that do not exist or
+        have multiple different values.
+        """
+        ids = [observable_ids, experiment_ids]
+        if len(self.id_columns) > 2:
+            if preequilibration_condition_ids is None:
+                preequilibration_condition_ids = [None] * len(times)
+            ids.append(preequilibration_condition_ids)
+        elif preequilibration_condition_ids is not None:
+            raise KeyError(
+                "This solution does not have preequilibration conditions."
+            )
+
+        codes = []
+        for values, categories in zip(ids, self.categories, strict=True):
+            values = pd.Series(values, dtype=object)
+            col_codes = categories.get_indexer(values)
+            # unknown IDs do not match missing IDs
+            col_codes[(col_codes == -1) & values.notna().to_numpy()] = -2
+            codes.append(col_codes)
+        positions = self._index.get_indexer(
+            pd.MultiIndex.from_arrays([*codes, np.asarray(times, dtype=float)])
+        )
+        positions = np.where(
+            positions == -1, -1, self._index_positions[positions]
+        )
+        return np.where(positions == -1, np.nan, self.values[positions])
+
+    def to_frame(self) -> pd.DataFrame:
+        """Get the simulation table."""
+        columns = {
+            col: _decode(codes, categories)
+            for col, codes, categories in zip(
+                self.id_columns, self.codes, self.categories
+            )
+        }
+        columns[TIME] = self.times
+        columns[SIMULATION] = self.values
+        columns |= self._other_columns
+        df = pd.DataFrame({col: columns[col] for col in self._columns})
+        return df.astype(
+            {col: dtype for col, dtype in self._dtypes.items() if col in df}
+        )
+
+
+def _decode(codes: np.ndarray, categories: pd.Index, missing=np.nan):
+    """Get the IDs for integer codes."""
+    return np.append(categories.to_numpy(dtype=object), missing)[codes]
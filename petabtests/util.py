@@ -0,0 +1,19 @@
+"""Helpers shared by the petabtests modules."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+__all__ = ["as_list"]
+
+
+def as_list(
+    dfs: list[pd.DataFrame] | pd.DataFrame | None,
+) -> list[pd.DataFrame]:
+    """Get a list of non-``None`` tables from a single table, a list of
+    tables, or ``None``."""
+    if dfs is None:
+        return []
+    if isinstance(dfs, pd.DataFrame):
+        dfs = [dfs]
+    return [df for df in dfs if df is not None]
@@ -1,4 +1,11 @@
-from petabtests.antimony import antimony_to_sbml_str
+from petabtests.antimony import (
+    AntimonyConversionError,
+    antimony_to_sbml_str,
+    antimony_to_sbml_strs,
+)
+from petabtests.cache import DiskCache, file_digest
+import os
+import pytest
 import libsbml
 import tempfile
 from pathlib import Path
@@ -26,3 +33,88 @@ def test_antimony_file_to_sbml_str():
     assert sbml_model.getNumSpecies() == 2
     assert sbml_model.getNumReactions() == 1
     assert sbml_model.getNumParameters() == 1
+
+
+def test_antimony_to_sbml_str_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("PETABTESTS_CACHE_DIR", str(tmp_path))
+    ant_model = """
+        model test
+          S1 -> S2; k1*S1
+          k1 = 0.1
+          S1 = 10
+        end
+        """
+
+    sbml_str = antimony_to_sbml_str(ant_model)
+    cached_files = list((tmp_path / "antimony").iterdir())
+    assert len(cached_files) == 1
+    assert cached_files[0].read_text() == sbml_str
+
+    # served from the cache
+    cached_files[0].write_text("cached")
+    assert antimony_to_sbml_str(ant_model) == "cached"
+    assert antimony_to_sbml_str(ant_model, cache=False) == sbml_str
+
+
+def test_disk_cache_eviction(tmp_path):
+    cache = DiskCache("test", cache_dir=tmp_path, max_size=10)
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    # make "a" the least recently used entry
+    os.utime(tmp_path / "test" / "a", (0, 0))
+    cache.put("c", b"12345")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == b"12345"
+    assert cache.get("c") == b"12345"
+
+
+def test_disk_cache_eviction_scans(tmp_path, monkeypatch):
+    cache = DiskCache("test", cache_dir=tmp_path, max_size=12)
+    cache.put("a", b"12345")
+
+    # the cache directory is only scanned once the limit may be exceeded
+    scans = []
+    evict = DiskCache._evict
+    monkeypatch.setattr(
+        DiskCache, "_evict", lambda self: scans.append(1) or evict(self)
+    )
+    cache.put("b", b"12345")
+    assert not scans
+    cache.put("c", b"12345")
+    assert len(scans) == 1
+    assert len(list((tmp_path / "test").iterdir())) == 2
+
+
+def test_disk_cache_file_key(tmp_path):
+    path = tmp_path / "model.ant"
+    path.write_bytes(b"12345")
+    # files are keyed by their content
+    assert DiskCache.key("a", path) == DiskCache.key("a", b"12345")
+    digest = file_digest(path)
+    path.write_bytes(b"123456")
+    assert file_digest(path) != digest
+    assert DiskCache.key("a", path) == DiskCache.key("a", b"123456")
+
+
+def test_antimony_to_sbml_strs():
+    ant_models = [
+        f"""
+        model test{i}
+          S1 -> S2; k1*S1
+          k1 = {i}
+        end
+        """
+        for i in range(4)
+    ]
+    sbml_strs = antimony_to_sbml_strs(ant_models, jobs=2, cache=False)
+    assert sbml_strs == [
+        antimony_to_sbml_str(ant_model, cache=False)
+        for ant_model in ant_models
+    ]
+
+    invalid_model = "model invalid\n  S1 -> S2; k1 *\nend"
+    with pytest.raises(AntimonyConversionError) as exc_info:
+        antimony_to_sbml_strs([*ant_models, invalid_model], cache=False)
+    assert exc_info.value.index == len(ant_models)
+    assert exc_info.value.model == invalid_model
@@ -1,6 +1,24 @@
-from petabtests import evaluate_simulations, evaluate_chi2, evaluate_llh
+from petabtests import (
+    absolute_simulations_distance_for_chunks,
+    absolute_simulations_distance_for_file,
+    absolute_simulations_distance_for_table,
+    evaluate_simulations,
+    evaluate_chi2,
+    evaluate_llh,
+    evaluate_log_prior,
+    evaluate_simulation_files,
+    evaluate_suite,
+    evaluate_unnorm_log_posterior,
+    SIMULATION_DFS,
+    Solution,
+    load_solution,
+    read_simulation_file,
+    simulation_diagnostics_for_table,
+)
 from petab.v1.C import *
+import numpy as np
 import pandas as pd
+import pytest
 
 
 def test_evaluate_chi2():
@@ -13,6 +31,54 @@ def test_evaluate_llh():
     assert not evaluate_llh(0.5, 0.501)
 
 
+def test_evaluate_log_prior():
+    gt_log_prior = {"p1": -0.5, "p2": -1.0}
+    assert evaluate_log_prior({"p2": -1.0, "p1": -0.5}, gt_log_prior)
+    assert evaluate_log_prior(
+        np.array([-1.0, -0.5]), gt_log_prior, parameter_ids=["p2", "p1"]
+    )
+    assert not evaluate_log_prior({"p1": -0.5}, gt_log_prior)
+    assert not evaluate_log_prior({**gt_log_prior, "p3": 0.0}, gt_log_prior)
+    assert not evaluate_log_prior(None, gt_log_prior)
+    assert not evaluate_log_prior({"p1": -0.5, "p2": None}, gt_log_prior)
+    assert evaluate_log_prior(
+        {"p1": [-0.5, None], "p2": -1.0}, gt_log_prior
+    ).tolist() == [True, False]
+    with pytest.raises(ValueError, match="parameter_ids"):
+        evaluate_log_prior(np.array([-1.0, -0.5]), gt_log_prior)
+
+    # batches
+    passed, distance = evaluate_log_prior(
+        {"p1": [-0.5, -0.4, -0.5], "p2": -1.0},
+        gt_log_prior,
+        return_distance=True,
+    )
+    assert passed.tolist() == [True, False, True]
+    assert np.allclose(distance, [0, 0.1, 0])
+    samples = pd.DataFrame(
+        [[-1.0, -0.5], [-1.0, np.nan]], columns=["p2", "p1"]
+    )
+    assert evaluate_log_prior(samples, gt_log_prior).tolist() == [True, False]
+    passed, distance = evaluate_log_prior(
+        [gt_log_prior, {"p1": -0.5}, {**gt_log_prior, "p3": 0.0}],
+        gt_log_prior,
+        return_distance=True,
+    )
+    assert passed.tolist() == [True, False, False]
+    assert distance[0] == 0 and np.isnan(distance[1:]).all()
+
+
+def test_evaluate_unnorm_log_posterior():
+    assert evaluate_unnorm_log_posterior(-3.5, -3.5001)
+    assert not evaluate_unnorm_log_posterior(-3.5, -3.51)
+    assert not evaluate_unnorm_log_posterior(None, -3.5)
+    passed, distance = evaluate_unnorm_log_posterior(
+        [-3.5, -3.6, np.nan], -3.5, return_distance=True
+    )
+    assert passed.tolist() == [True, False, False]
+    assert np.allclose(distance[:2], [0, 0.1])
+
+
 def test_evaluate_simulations():
     simulations_df = pd.DataFrame(
         data={
@@ -44,3 +110,255 @@ def test_evaluate_simulations():
     )
 
     assert not evaluate_simulations(simulations_df, gt_simulations_df)
+
+
+def test_absolute_simulations_distance_for_table():
+    gt_simulations_df = pd.DataFrame(
+        data={
+            OBSERVABLE_ID: ["obs_a", "obs_a", "obs_a", "obs_b"],
+            "experimentId": ["e0", "e0", "e0", "e1"],
+            TIME: [0, 10, 10, 10],
+            SIMULATION: [0.7, 0.1, 0.2, 0.3],
+        }
+    )
+
+    # row order does not matter, duplicate keys are matched by value,
+    #  times are matched with tolerance
+    simulations_df = pd.DataFrame(
+        data={
+            OBSERVABLE_ID: ["obs_b", "obs_a", "obs_a", "obs_a"],
+            "experimentId": ["e1", "e0", "e0", "e0"],
+            TIME: [10, 10 + 1e-10, 10, 0],
+            SIMULATION: [0.3, 0.21, 0.1, 0.7],
+        },
+        index=[3, 5, 7, 9],
+    )
+    assert absolute_simulations_distance_for_table(
+        simulations_df, gt_simulations_df
+    ) == pytest.approx(0.01 / 4)
+
+    for col, value in [(OBSERVABLE_ID, "obs_c"), (TIME, 11)]:
+        mismatching_df = simulations_df.copy()
+        mismatching_df.loc[3, col] = value
+        with pytest.raises(AssertionError):
+            absolute_simulations_distance_for_table(
+                mismatching_df, gt_simulations_df
+            )
+
+    with pytest.raises(AssertionError):
+        absolute_simulations_distance_for_table(
+            simulations_df.iloc[1:], gt_simulations_df
+        )
+
+
+def test_absolute_simulations_distance_for_chunks(tmp_path):
+    gt_simulations_df = pd.DataFrame(
+        data={
+            OBSERVABLE_ID: ["obs_a"] * 6 + ["obs_b"] * 2,
+            "experimentId": ["e0", "e0", "e1", "e1", "e1", "e1", "e0", "e1"],
+            TIME: [0, 1, 0, 1, 1, 1, 1, 1],
+            SIMULATION: [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8],
+        }
+    )
+    # duplicate keys are spread over multiple chunks
+    simulations_df = gt_simulations_df.iloc[::-1].copy()
+    simulations_df[SIMULATION] += 0.01
+    expected = absolute_simulations_distance_for_table(
+        simulations_df, gt_simulations_df
+    )
+    assert expected == pytest.approx(0.01)
+
+    chunks = [simulations_df.iloc[i : i + 3] for i in range(0, 8, 3)]
+    assert absolute_simulations_distance_for_chunks(
+        chunks, gt_simulations_df
+    ) == pytest.approx(expected)
+
+    simulation_file = tmp_path / "simulations.tsv"
+    simulations_df.to_csv(simulation_file, sep="\t", index=False)
+    assert absolute_simulations_distance_for_file(
+        simulation_file, gt_simulations_df, chunksize=3
+    ) == pytest.approx(expected)
+
+    # a row that occurs twice, while another one is missing
+    with pytest.raises(AssertionError):
+        absolute_simulations_distance_for_chunks(
+            [simulations_df.iloc[:4], simulations_df.iloc[3:7]],
+            gt_simulations_df,
+        )
+
+
+def test_simulation_diagnostics():
+    gt_simulations_df = pd.DataFrame(
+        data={
+            OBSERVABLE_ID: ["obs_a", "obs_a", "obs_a", "obs_b"],
+            "experimentId": ["e0", "e0", "e0", "e1"],
+            TIME: [0, 10, 10, 10],
+            SIMULATION: [0.7, 0.1, 0.2, 0.3],
+        }
+    )
+    simulations_df = gt_simulations_df.copy()
+    simulations_df[SIMULATION] += [0.0, 0.02, 0.05, 0.01]
+    diagnostics = simulation_diagnostics_for_table(
+        simulations_df, gt_simulations_df, top_k=2
+    )
+    assert diagnostics.matches
+    assert diagnostics.distance == pytest.approx(
+        absolute_simulations_distance_for_table(
+            simulations_df, gt_simulations_df
+        )
+    )
+    assert diagnostics.rows["error"].tolist() == pytest.approx(
+        [0.0, 0.02, 0.05, 0.01]
+    )
+    assert diagnostics.worst.index.tolist() == [2, 1]
+    assert diagnostics.by_observable["max"].tolist() == pytest.approx(
+        [0.05, 0.01]
+    )
+    assert diagnostics.by_experiment["mean"].tolist() == pytest.approx(
+        [0.07 / 3, 0.01]
+    )
+
+    # one row is missing, one is duplicated, and one is unknown
+    simulations_df = pd.concat(
+        [
+            simulations_df.iloc[1:],
+            simulations_df.iloc[[3]],
+            simulations_df.iloc[[0]].assign(**{OBSERVABLE_ID: "obs_c"}),
+        ]
+    )
+    diagnostics = simulation_diagnostics_for_table(
+        simulations_df, gt_simulations_df
+    )
+    assert not diagnostics.matches
+    assert diagnostics.missing.index.tolist() == [0]
+    assert diagnostics.extra[OBSERVABLE_ID].tolist() == ["obs_c", "obs_b"]
+    assert diagnostics.rows["error"].isna().tolist() == [
+        True,
+        False,
+        False,
+        False,
+    ]
+
+
+def test_evaluate_suite():
+    version, format_ = "v2.0.0", "sbml"
+    results = {
+        case_id: load_solution(case_id, format_, version)
+        for case_id in ["0001", "0002", "0003"]
+    }
+    evaluation = evaluate_suite(results, version=version, format_=format_)
+    assert len(evaluation) == 9
+    assert evaluation["passed"].all()
+    assert set(evaluation["metric"]) == {"simulations", "chi2", "llh"}
+
+    results["0002"] = {**results["0002"], "chi2": results["0002"]["chi2"] + 1}
+    results["0003"] = {**results["0003"], "llh": None}
+    evaluation = evaluate_suite(results, version=version, format_=format_)
+    failed = evaluation.loc[~evaluation["passed"], ["case", "metric"]]
+    assert failed.values.tolist() == [["0002", "chi2"], ["0003", "llh"]]
+
+    # test case with priors
+    result = load_solution("0024", format_, version)
+    evaluation = evaluate_suite(
+        {"0024": result}, version=version, format_=format_
+    )
+    assert evaluation["passed"].all()
+    assert {"log_prior", "unnorm_log_posterior"} <= set(evaluation["metric"])
+
+    # batches of results are rejected
+    for metric in ["log_prior", "unnorm_log_posterior"]:
+        value = result[metric]
+        batch = (
+            {key: [v, v] for key, v in value.items()}
+            if metric == "log_prior"
+            else [value]
+        )
+        with pytest.raises(ValueError, match="batch"):
+            evaluate_suite(
+                {"0024": {**result, metric: batch}},
+                version=version,
+                format_=format_,
+            )
+
+
+def test_solution():
+    simulations_df = pd.DataFrame(
+        data={
+            OBSERVABLE_ID: ["obs_a", "obs_a", "obs_a", "obs_b", "obs_b"],
+            SIMULATION_CONDITION_ID: ["c0", "c0", "c1", "c1", "c1"],
+            PREEQUILIBRATION_CONDITION_ID: ["pre", "pre", "pre", None, None],
+            TIME: [0.0, 10.0, 10.0, 10.0, 10.0],
+            SIMULATION: [0.1, 0.2, 0.3, 0.4, 0.5],
+        }
+    )
+    solution = Solution.from_frame(simulations_df)
+    assert len(solution) == 5
+    pd.testing.assert_frame_equal(solution.to_frame(), simulations_df)
+
+    assert solution.expected("obs_a", "c1", 10, "pre") == 0.3
+    with pytest.raises(KeyError):
+        solution.expected("obs_a", "c1", 10)
+    # replicates with different values
+    with pytest.raises(ValueError):
+        solution.expected("obs_b", "c1", 10)
+
+    expected = solution.expected_values(
+        ["obs_a", "obs_a", "obs_b", "obs_c"],
+        ["c0", "c0", "c1", "c0"],
+        [10, 10, 10, 0],
+        ["pre", None, None, "pre"],
+    )
+    np.testing.assert_array_equal(expected, [0.2, np.nan, np.nan, np.nan])
+
+    solution = load_solution("0001", "sbml", "v2.0.0", as_solutions=True)[
+        SIMULATION_DFS
+    ][0]
+    assert isinstance(solution, Solution)
+    simulations_df = load_solution("0001", "sbml", "v2.0.0")[SIMULATION_DFS][0]
+    pd.testing.assert_frame_equal(solution.to_frame(), simulations_df)
+
+
+def test_evaluate_simulation_files(tmp_path):
+    version, format_, case_id = "v2.0.0", "sbml", "0001"
+    (gt_simulations_df,) = load_solution(case_id, format_, version)[
+        SIMULATION_DFS
+    ]
+    simulations_df = gt_simulations_df.iloc[::-1]
+
+    simulation_files = [tmp_path / "simulations.tsv"]
+    simulations_df.to_csv(simulation_files[0], sep="\t", index=False)
+    arrays = {
+        col: values.fillna("").to_numpy(dtype=str)
+        if values.dtype.kind == "O"
+        else values.to_numpy()
+        for col, values in simulations_df.items()
+    }
+    # memory-mapped, and read at once
+    simulation_files.append(tmp_path / "simulations.npz")
+    np.savez(simulation_files[-1], **arrays)
+    simulation_files.append(tmp_path / "simulations_compressed.npz")
+    np.savez_compressed(simulation_files[-1], **arrays)
+    try:
+        import pyarrow as pa
+        from pyarrow import feather, parquet
+    except ImportError:
+        pass
+    else:
+        table = pa.Table.from_pandas(simulations_df, preserve_index=False)
+        simulation_files.append(tmp_path / "simulations.parquet")
+        parquet.write_table(table, simulation_files[-1])
+        simulation_files.append(tmp_path / "simulations.arrow")
+        feather.write_feather(table, simulation_files[-1])
+
+    for simulation_file in simulation_files:
+        chunks = list(read_simulation_file(simulation_file, chunksize=1))
+        for chunk in chunks:
+            assert "object" not in set(chunk.dtypes.astype(str))
+        if simulation_file.suffix == ".npz":
+            assert len(chunks) == len(simulations_df)
+        assert evaluate_simulation_files(
+            case_id, simulation_file, format_, version
+        )
+        assert not evaluate_simulation_files(
+            case_id, simulation_file, format_, version, tol=0
+        )
@@ -1,5 +1,8 @@
 import petabtests
+import pytest
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 
 def test_cases_dir_exists():
@@ -14,3 +17,73 @@ def test_cases_dir_exists():
     assert os.path.isdir(
         petabtests.get_cases_dir(format_="pysb", version="v2.0.0")
     )
+
+
+def test_get_cases_by_tag():
+    all_cases = petabtests.get_cases(format_="sbml", version="v2.0.0")
+    cases_with_priors = petabtests.get_cases(
+        format_="sbml", version="v2.0.0", tags=[petabtests.TAG_PRIORS]
+    )
+    assert cases_with_priors
+    assert set(cases_with_priors) < set(all_cases)
+
+
+def test_load_cases_concurrently():
+    """Test that test cases can be loaded concurrently without touching the
+    global import state."""
+    cases = [
+        ("v1.0.0", "sbml", case_id)
+        for case_id in petabtests.get_cases(format_="sbml", version="v1.0.0")
+    ] + [
+        ("v2.0.0", "sbml", case_id)
+        for case_id in petabtests.get_cases(format_="sbml", version="v2.0.0")
+    ]
+    sys_path = sys.path.copy()
+    sys_modules = set(sys.modules)
+
+    def load(version, format_, case_id):
+        case_dir = petabtests.get_cases_dir(format_, version) / case_id
+        if version == "v1.0.0":
+            return petabtests.PetabV1TestCase.load(case_dir, case_id)
+        return petabtests.PetabV2TestCase.load(case_dir, case_id)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        loaded = list(executor.map(lambda args: load(*args), cases))
+
+    assert [petabtests.test_id_str(case.id) for case in loaded] == [
+        case_id for _, _, case_id in cases
+    ]
+    assert sys.path == sys_path
+    assert not any(
+        name.startswith("petabtests_case_") or name.isdigit()
+        for name in set(sys.modules) - sys_modules
+    )
+
+
+def test_load_case_lazily():
+    """Test that loading a test case does not build it."""
+    case_dir = petabtests.get_cases_dir(format_="sbml", version="v2.0.0")
+    case = petabtests.PetabV2TestCase.load(case_dir / "0022", "0022")
+
+    assert isinstance(case, petabtests.LazyTestCase)
+    assert case.id == 22
+    assert case.brief
+    assert not case.is_materialized
+
+    assert isinstance(case.model, petabtests.AntimonyModel)
+    assert case.is_materialized
+    assert case.materialize() is case.materialize()
+
+
+def test_parse_case_ids():
+    assert petabtests.parse_case_ids("0001,0010-0012, 3") == [
+        "0001",
+        "0003",
+        "0010",
+        "0011",
+        "0012",
+    ]
+    with pytest.raises(ValueError):
+        petabtests.parse_case_ids("0012-0010")
+    with pytest.raises(ValueError):
+        petabtests.parse_case_ids("a")
@@ -1,23 +1,53 @@
-from petabtests.core import create_all
-from petabtests.C import CASES_DIR
+import json
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 
-import sys
-import subprocess
+import numpy as np
+import pandas as pd
+import pytest
+from petab.v2.C import OBSERVABLE_ID, SIMULATION
 
-from petabtests.core import create_case
+import petabtests.file
+import petabtests.lint
+from petabtests.C import CHI2, LOG_PRIOR, SIMULATION_DFS
+from petabtests.bundle import (
+    SOLUTION_BUNDLE_FILE,
+    SharedSolutionBundle,
+    read_solution_bundle,
+    render_solution_bundle,
+)
+from petabtests.core import (
+    clear,
+    create_all,
+    create_case,
+    get_cases,
+    get_cases_dir,
+)
+from petabtests.evaluate import absolute_simulations_distance_for_array
+from petabtests.file import (
+    FileWriter,
+    get_case_dir,
+    load_case,
+    load_solution,
+    load_solution_files,
+)
+from petabtests.lint import (
+    LintResult,
+    get_cached_lint_result,
+    lint_problem,
+    lint_problem_files,
+)
+from petabtests.manifest import is_up_to_date, read_manifest
+from petabtests.residuals import compute_residuals
 
 
 def test_check_cases_up_to_date():
-    sys.path.insert(0, CASES_DIR)
-    create_all()
-    res = subprocess.run(
-        ["git", "diff", "--exit-code", CASES_DIR], capture_output=True
-    )
-    has_changes = res.returncode
-    assert not has_changes, res.stdout.decode()
+    differences = create_all(check=True, jobs=2)
+    assert not differences, "\n".join(map(str, differences))
 
 
-def test_create_case():
+def test_create_case(tmp_path):
     """Test creating a single test case.
 
     Mostly for debugging purposes.
@@ -25,4 +55,460 @@ def test_create_case():
     format_ = "sbml"
     version = "v2.0.0"
     id_ = "0022"
-    create_case(format_=format_, version=version, id_=id_)
+    create_case(
+        format_=format_, version=version, id_=id_, output_root=tmp_path
+    )
+
+
+def test_manifest(tmp_path):
+    """Test that regenerated test cases are recognized as up to date."""
+    format_ = "sbml"
+    version = "v2.0.0"
+    id_ = "0001"
+    create_case(
+        format_=format_, version=version, id_=id_, output_root=tmp_path
+    )
+
+    case_dir = get_case_dir(format_=format_, version=version, id_=id_)
+    output_dir = get_case_dir(
+        format_=format_, version=version, id_=id_, root=tmp_path
+    )
+    manifest = read_manifest(output_dir)
+    assert is_up_to_date(case_dir, manifest, output_dir)
+
+    manifest["outputs"]["_0001.yaml"] = "0" * 64
+    assert not is_up_to_date(case_dir, manifest, output_dir)
+
+
+def test_clear_and_create_selected_cases(tmp_path):
+    """Test clearing and creating a subset of the test cases."""
+    selection = dict(
+        versions=["v2.0.0"], formats=["sbml"], output_root=tmp_path
+    )
+    case_dir = get_case_dir(format_="sbml", version="v2.0.0", id_="0001")
+    output_dir = get_case_dir(
+        format_="sbml", version="v2.0.0", id_="0001", root=tmp_path
+    )
+    other_output_dir = get_case_dir(
+        format_="sbml", version="v2.0.0", id_="0002", root=tmp_path
+    )
+
+    def generated_files(dir_):
+        return [f for f in dir_.glob("_*") if f.is_file()]
+
+    create_all(cases=["0001", "0002"], **selection)
+    clear(cases=["0001"], **selection)
+    assert not generated_files(output_dir)
+    assert generated_files(other_output_dir)
+
+    create_all(cases=["0001"], **selection)
+    assert is_up_to_date(case_dir, read_manifest(output_dir), output_dir)
+
+
+def test_profile(tmp_path):
+    """Test profiling the generation of test cases."""
+    selection = dict(
+        versions=["v2.0.0"],
+        formats=["sbml"],
+        cases=["0001", "0002"],
+        output_root=tmp_path / "cases",
+    )
+    create_all(
+        force=True,
+        profile=tmp_path,
+        profile_top=1,
+        **selection,
+    )
+
+    with open(tmp_path / "profile.json") as f:
+        profiles = json.load(f)
+    assert {p["id"] for p in profiles} == {"0001", "0002"}
+    # ranked by decreasing wall time
+    walls = [p["total"]["wall"] for p in profiles]
+    assert walls == sorted(walls, reverse=True)
+    for p in profiles:
+        assert {"load", "build", "residuals", "lint", "other"} <= set(
+            p["phases"]
+        )
+        assert sum(t["wall"] for t in p["phases"].values()) == pytest.approx(
+            p["total"]["wall"]
+        )
+    assert (tmp_path / "profile.csv").exists()
+    # only the slowest test case is profiled with cProfile
+    assert [p.name for p in tmp_path.glob("*.prof")] == [
+        f"v2.0.0_sbml_{profiles[0]['id']}.prof"
+    ]
+
+    # up-to-date test cases are skipped and not profiled
+    create_all(profile=tmp_path / "skipped", profile_top=1, **selection)
+    with open(tmp_path / "skipped" / "profile.json") as f:
+        assert json.load(f) == []
+    assert not list((tmp_path / "skipped").glob("*.prof"))
+
+
+@pytest.mark.parametrize(
+    "version,case_id", [("v1.0.0", "0005"), ("v2.0.0", "0022")]
+)
+def test_to_problem(version, case_id, tmp_path, monkeypatch):
+    """Test validating test cases as PEtab problems in memory."""
+    monkeypatch.setenv("PETABTESTS_CACHE_DIR", str(tmp_path / "cache"))
+    case_dir = get_case_dir(format_="sbml", version=version, id_=case_id)
+    problem = load_case(case_dir, case_id).to_problem()
+    assert problem.model is not None
+
+    yaml_path = case_dir / f"_{case_id}.yaml"
+    assert get_cached_lint_result(yaml_path, version) is None
+    result = lint_problem(problem, version, yaml_path=yaml_path)
+    assert result.valid
+    # the result is cached for the written files
+    assert get_cached_lint_result(yaml_path, version) == result
+
+
+@pytest.mark.parametrize("version", ["v1.0.0", "v2.0.0"])
+def test_compute_residuals(version):
+    """Test that chi2 and llh match the PEtab library."""
+    from petab.v1 import calculate as calculate_v1
+    from petab.v2 import calculate as calculate_v2
+
+    calculate = calculate_v1 if version == "v1.0.0" else calculate_v2
+    for case_id in get_cases("sbml", version=version):
+        case_dir = get_case_dir(format_="sbml", version=version, id_=case_id)
+        case = load_case(case_dir, case_id)
+        tables = (
+            case.measurement_dfs,
+            case.simulation_dfs,
+            case.observable_dfs,
+            case.parameter_df,
+        )
+        residuals = compute_residuals(*tables, version=version)
+        assert residuals.chi2 == calculate.calculate_chi2(*tables)
+        assert residuals.llh == calculate.calculate_llh(*tables)
+        assert sum(len(df) for df in residuals.residual_dfs) == sum(
+            len(df) for df in case.measurement_dfs
+        )
+
+
+def test_match_simulations():
+    """Test matching measurements to simulations."""
+    from petabtests.residuals import _match_simulations
+
+    measurement_df = pd.DataFrame(
+        {
+            OBSERVABLE_ID: ["obs_a", "obs_a", "obs_b"],
+            "time": [0, 1, 1],
+            # empty entries match anything
+            "preequilibrationConditionId": ["", np.nan, "c0"],
+        }
+    )
+    simulation_df = pd.DataFrame(
+        {
+            OBSERVABLE_ID: ["obs_b", "obs_a", "obs_a", "obs_a"],
+            "time": [1, 0, 1, 1],
+            "preequilibrationConditionId": ["c0", "c1", "c2", "c2"],
+            SIMULATION: [1.0, 2.0, 3.0, 3.0],
+        }
+    )
+    assert _match_simulations(measurement_df, simulation_df).tolist() == [
+        1,
+        2,
+        0,
+    ]
+
+    simulation_df.loc[3, SIMULATION] = 4.0
+    with pytest.raises(ValueError, match="Multiple different simulations"):
+        _match_simulations(measurement_df, simulation_df)
+    with pytest.raises(ValueError, match="Could not find simulation"):
+        _match_simulations(
+            measurement_df.assign(time=[0, 2, 1]), simulation_df
+        )
+
+
+@pytest.mark.parametrize("version", ["v1.0.0", "v2.0.0"])
+def test_lint_problem_files(version, tmp_path, monkeypatch):
+    """Test validating written test cases with cached results."""
+    monkeypatch.setenv("PETABTESTS_CACHE_DIR", str(tmp_path / "cache"))
+    case_dir = tmp_path / "0001"
+    shutil.copytree(
+        get_case_dir(format_="sbml", version=version, id_="0001"), case_dir
+    )
+    yaml_path = case_dir / "_0001.yaml"
+
+    assert get_cached_lint_result(yaml_path, version) is None
+    assert lint_problem_files(yaml_path, version).valid
+    assert get_cached_lint_result(yaml_path, version).valid
+
+    # changing a referenced file invalidates the cached result
+    parameters_file = case_dir / "_parameters.tsv"
+    parameters_file.write_text(
+        parameters_file.read_text().replace("parameterId", "foo")
+    )
+    assert get_cached_lint_result(yaml_path, version) is None
+    result = lint_problem_files(yaml_path, version)
+    assert not result.valid
+    assert result.messages
+    assert get_cached_lint_result(yaml_path, version) == result
+
+
+def test_create_case_lints(tmp_path, monkeypatch):
+    """Test that creating a single test case validates it."""
+    monkeypatch.setenv("PETABTESTS_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(
+        petabtests.lint,
+        "_lint_v1",
+        lambda problem: LintResult(valid=False, messages=["invalid"]),
+    )
+    case = dict(format_="sbml", version="v1.0.0", id_="0001")
+
+    with pytest.raises(RuntimeError, match="Invalid PEtab problems"):
+        create_case(**case, output_root=tmp_path)
+    # the invalid test case is regenerated next time
+    output_dir = get_case_dir(**case, root=tmp_path)
+    assert not (output_dir / "_manifest.json").exists()
+
+    create_case(**case, output_root=tmp_path, lint=False)
+    assert (output_dir / "_manifest.json").exists()
+
+
+def test_file_writer_writes_only_changes(tmp_path):
+    """Test that unchanged files are not rewritten."""
+    path = tmp_path / "file.tsv"
+    output = FileWriter()
+    output.write(path, "a\n")
+    stat = path.stat()
+
+    output = FileWriter()
+    output.write(path, "a\n")
+    assert output.paths == [path]
+    assert output.changed_paths == []
+    assert path.stat().st_mtime_ns == stat.st_mtime_ns
+    assert path.stat().st_ino == stat.st_ino
+
+    output.write(path, "b\n")
+    assert output.changed_paths == [path]
+    assert path.read_text() == "b\n"
+
+    # identical copies are linked or left untouched
+    src, dst = tmp_path / "model.xml", tmp_path / "_model.xml"
+    src.write_text("<sbml/>")
+    FileWriter().copy(src, dst)
+    assert dst.read_text() == "<sbml/>"
+    stat = dst.stat()
+    output = FileWriter()
+    output.copy(src, dst)
+    assert output.changed_paths == []
+    assert dst.stat().st_mtime_ns == stat.st_mtime_ns
+    assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".")] == []
+
+
+def test_create_out_of_tree(tmp_path):
+    """Test generating test cases to a different root directory."""
+    selection = dict(versions=["v1.0.0"], formats=["sbml"], cases=["0001"])
+    case_dir = get_case_dir(format_="sbml", version="v1.0.0", id_="0001")
+    mtimes = {path: path.stat().st_mtime_ns for path in case_dir.iterdir()}
+
+    create_all(jobs=None, output_root=tmp_path, **selection)
+
+    output_dir = get_case_dir(
+        format_="sbml", version="v1.0.0", id_="0001", root=tmp_path
+    )
+    for path in case_dir.glob("_*"):
+        if path.is_file() and path.name != "_manifest.json":
+            assert (output_dir / path.name).read_bytes() == path.read_bytes()
+    assert (tmp_path / "v1.0.0" / "sbml" / "_catalog.json").exists()
+    # unselected test cases are not generated, but are taken from the
+    #  in-tree catalog and solutions
+    cases_dir = get_cases_dir(format_="sbml", version="v1.0.0", root=tmp_path)
+    assert [p.name for p in cases_dir.iterdir() if p.is_dir()] == ["0001"]
+    in_tree_cases = get_cases(format_="sbml", version="v1.0.0")
+    assert (
+        get_cases(format_="sbml", version="v1.0.0", root=tmp_path)
+        == in_tree_cases
+    )
+    assert (
+        read_solution_bundle("sbml", "v1.0.0", root=tmp_path).case_ids
+        == in_tree_cases
+    )
+    assert is_up_to_date(case_dir, read_manifest(output_dir), output_dir)
+    # the test case definitions are left alone
+    assert {
+        path: path.stat().st_mtime_ns for path in case_dir.iterdir()
+    } == mtimes
+
+    assert not create_all(check=True, output_root=tmp_path, **selection)
+    clear(output_root=tmp_path, **selection)
+    assert not list(output_dir.glob("_*"))
+
+
+def test_create_out_of_tree_by_tag(tmp_path):
+    """Test selecting test cases by tag for a fresh output root."""
+    create_all(
+        jobs=0,
+        versions=["v2.0.0"],
+        formats=["sbml"],
+        tags=["priors"],
+        output_root=tmp_path,
+    )
+    cases_dir = get_cases_dir(format_="sbml", version="v2.0.0", root=tmp_path)
+    assert sorted(p.name for p in cases_dir.iterdir() if p.is_dir()) == [
+        "0024",
+        "0025",
+    ]
+
+
+def test_load_solution_cache(tmp_path):
+    """Test that solutions are memoized, and invalidated when the solution
+    files change."""
+    version, format_, case_id = "v2.0.0", "sbml", "0001"
+    case_dir = get_case_dir(case_id, format_, version, root=tmp_path)
+    shutil.copytree(get_case_dir(case_id, format_, version), case_dir)
+    expected = load_solution(case_id, format_, version)
+
+    solution = load_solution(case_id, format_, version, root=tmp_path)
+    assert solution[CHI2] == expected[CHI2]
+    (simulation_df,) = solution[SIMULATION_DFS]
+    pd.testing.assert_frame_equal(simulation_df, expected[SIMULATION_DFS][0])
+
+    # returned solutions are copies
+    simulation_df[SIMULATION] = 0.0
+    solution = load_solution(case_id, format_, version, root=tmp_path)
+    pd.testing.assert_frame_equal(
+        solution[SIMULATION_DFS][0], expected[SIMULATION_DFS][0]
+    )
+
+    # nested values are copies as well
+    solution = load_solution_files("0024", format_, version)
+    log_prior = dict(solution[LOG_PRIOR])
+    solution[LOG_PRIOR].clear()
+    assert (
+        load_solution_files("0024", format_, version)[LOG_PRIOR] == log_prior
+    )
+
+    # changes are picked up
+    simulation_df.to_csv(case_dir / "_simulations.tsv", sep="\t", index=False)
+    solution = load_solution(case_id, format_, version, root=tmp_path)
+    assert (solution[SIMULATION_DFS][0][SIMULATION] == 0.0).all()
+
+
+def test_solution_bundle(tmp_path, monkeypatch):
+    """Test that solutions are loaded from the solution bundle without
+    accessing the solution files."""
+    version, format_ = "v1.0.0", "sbml"
+    for case_id in ["0001", "0002"]:
+        shutil.copytree(
+            get_case_dir(case_id, format_, version),
+            get_case_dir(case_id, format_, version, root=tmp_path),
+        )
+    bundle_file = get_cases_dir(format_, version, tmp_path) / (
+        SOLUTION_BUNDLE_FILE
+    )
+    bundle_file.write_bytes(
+        render_solution_bundle(["0001"], format_, version, root=tmp_path)
+    )
+    bundle = read_solution_bundle(format_, version, root=tmp_path)
+    assert bundle.case_ids == ["0001"]
+    assert read_solution_bundle(format_, version, root=tmp_path) is bundle
+
+    # the simulation tables of bundled solutions are not parsed
+    load_simulation_table = petabtests.file._load_simulation_table
+    monkeypatch.setattr(
+        petabtests.file,
+        "_load_simulation_table",
+        lambda path, stamp: (
+            pytest.fail("Simulation table parsed.")
+            if path.parent.name == "0001"
+            else load_simulation_table(path, stamp)
+        ),
+    )
+    for case_id in ["0001", "0002"]:
+        solution = load_solution(case_id, format_, version, root=tmp_path)
+        expected = load_solution(case_id, format_, version)
+        assert solution.keys() == expected.keys()
+        assert solution[CHI2] == expected[CHI2]
+        for df, expected_df in zip(
+            solution[SIMULATION_DFS], expected[SIMULATION_DFS], strict=True
+        ):
+            pd.testing.assert_frame_equal(df, expected_df)
+
+        # returned solutions are copies
+        solution[SIMULATION_DFS][0][SIMULATION] = 0.0
+        solution = load_solution(case_id, format_, version, root=tmp_path)
+        assert (solution[SIMULATION_DFS][0][SIMULATION] != 0.0).any()
+
+    # changed solution files are only detected explicitly
+    monkeypatch.undo()
+    expected_chi2 = load_solution("0001", format_, version)[CHI2]
+    case_dir = get_case_dir("0001", format_, version, root=tmp_path)
+    yaml_file = case_dir / "_0001_solution.yaml"
+    yaml_file.write_text(
+        re.sub(r"(?m)^chi2: .*$", "chi2: 999.0", yaml_file.read_text())
+    )
+    (case_dir / "_simulations.tsv").unlink()
+    assert not bundle.is_up_to_date("0001", format_, version, root=tmp_path)
+    solution = load_solution("0001", format_, version, root=tmp_path)
+    assert solution[CHI2] == expected_chi2
+
+    # regenerating a test case removes the bundle
+    create_case(format_, version, "0001", output_root=tmp_path, lint=False)
+    assert not bundle_file.exists()
+    solution = load_solution("0001", format_, version, root=tmp_path)
+    assert solution[CHI2] == expected_chi2
+    bundle_file.write_bytes(
+        render_solution_bundle(["0001"], format_, version, root=tmp_path)
+    )
+
+    # clearing test cases removes the bundle
+    clear(versions=[version], formats=[format_], output_root=tmp_path)
+    assert not bundle_file.exists()
+
+    # the committed bundles are up to date
+    for version, format_ in [
+        ("v1.0.0", "sbml"),
+        ("v2.0.0", "sbml"),
+        ("v2.0.0", "pysb"),
+    ]:
+        bundle = read_solution_bundle(format_, version)
+        assert bundle.case_ids == get_cases(format_, version)
+        for case_id in bundle.case_ids:
+            assert bundle.is_up_to_date(case_id, format_, version)
+
+    # nested values are copies as well
+    bundle = read_solution_bundle("sbml", "v2.0.0")
+    solution = bundle.load_solution("0024")
+    log_prior = dict(solution[LOG_PRIOR])
+    solution[LOG_PRIOR].clear()
+    assert bundle.load_solution("0024")[LOG_PRIOR] == log_prior
+
+
+def _shared_simulations_distance(
+    bundle_name: str, case_id: str, simulations: np.ndarray
+) -> float:
+    bundle = SharedSolutionBundle.attach(bundle_name)
+    gt_simulations = bundle.get_array(case_id, SIMULATION)
+    assert not gt_simulations.flags.writeable
+    return absolute_simulations_distance_for_array(simulations, gt_simulations)
+
+
+def test_shared_solution_bundle():
+    """Test evaluating against a solution bundle in shared memory."""
+    version, format_ = "v2.0.0", "sbml"
+    case_ids = ["0001", "0002", "0003"]
+    simulations = [
+        load_solution(case_id, format_, version)[SIMULATION_DFS][0][
+            SIMULATION
+        ].to_numpy()
+        + 0.1
+        for case_id in case_ids
+    ]
+    with SharedSolutionBundle.publish(format_, version) as bundle:
+        assert bundle.get_categories("0001", SIMULATION) is None
+        assert "obs_a" in bundle.get_categories("0001", OBSERVABLE_ID)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            distances = list(
+                executor.map(
+                    _shared_simulations_distance,
+                    [bundle.name] * len(case_ids),
+                    case_ids,
+                    simulations,
+                )
+            )
+    assert distances == pytest.approx([0.1] * len(case_ids))